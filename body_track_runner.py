@@ -8,22 +8,39 @@ This script executes fixed checks, captures outputs, and writes:
 1) timestamped JSON/markdown records,
 2) latest JSON/markdown pointers,
 3) summary metrics + append-only history.
+
+With `--repeat N --warmup M` every step runs M untimed then N timed times and
+reports median/MAD/p95 and a bootstrap confidence interval; the benchmark trend
+compares the run's total-duration samples against a rolling window of history
+rows with a Mann-Whitney U test instead of a single delta to the last row.
+
+The orchestrator step runs with `TRINITY_EVENT_LOG` pointing at a per-run JSONL
+file under `.trinity-cache/body-track-events/`; its metrics come from the
+`task.completed` events there rather than from parsing stdout.
 """
 
 from __future__ import annotations
 
 import argparse
-import ast
 import json
+import math
+import os
+import random
 import re
-import subprocess
 import sys
-import time
+from collections import deque
 from dataclasses import asdict, dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Callable, Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Tuple
+
+from trinity_event_sink import EVENT_LOG_ENV, load_events
+from trinity_stream_runner import StreamResult, run_streaming
 
+EVENT_LOG_DIR = Path(".trinity-cache/body-track-events")
+
+# analyzer(stdout, stderr, returncode, events) -> metrics
+Analyzer = Callable[[str, str, int, List[Dict[str, object]]], Dict[str, object]]
 
 BENCHMARK_PROFILES: Dict[str, Dict[str, float]] = {
     "quick": {
@@ -44,6 +61,15 @@ BENCHMARK_PROFILES: Dict[str, Dict[str, float]] = {
 }
 
 
+def _default_simulation_backend() -> str:
+    """``"numpy"`` when numpy imports in this interpreter (which also runs the sweep), else ``"list"``."""
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        return "list"
+    return "numpy"
+
+
 def _load_profile_benchmark_overrides(policy_path: Path) -> Dict[str, Dict[str, float]]:
     if not policy_path.exists():
         return {}
@@ -79,32 +105,116 @@ class StepResult:
     stdout: str
     stderr: str
     metrics: Dict[str, object] = field(default_factory=dict)
+    first_output_seconds: Optional[float] = None
+    last_output_seconds: Optional[float] = None
+    resources: Dict[str, float] = field(default_factory=dict)
+    duration_samples: List[float] = field(default_factory=list)
+    duration_stats: Dict[str, float] = field(default_factory=dict)
+
+
+BOOTSTRAP_RESAMPLES = 1000
+MIN_TREND_TEST_SAMPLES = 5
+
+
+def _median(values: List[float]) -> float:
+    ordered = sorted(values)
+    mid = len(ordered) // 2
+    return ordered[mid] if len(ordered) % 2 else (ordered[mid - 1] + ordered[mid]) / 2.0
+
+
+def _duration_stats(samples: List[float], seed: int = 0) -> Dict[str, float]:
+    """Median, MAD, nearest-rank p95 and a 95% percentile-bootstrap interval for the median."""
+    ordered = sorted(samples)
+    median = _median(ordered)
+    rng = random.Random(seed)
+    medians = sorted(
+        _median([rng.choice(ordered) for _ in ordered]) for _ in range(BOOTSTRAP_RESAMPLES if len(ordered) > 1 else 1)
+    )
+    return {
+        "n": len(ordered),
+        "median": round(median, 6),
+        "mad": round(_median([abs(value - median) for value in ordered]), 6),
+        "p95": round(ordered[max(math.ceil(0.95 * len(ordered)) - 1, 0)], 6),
+        "mean": round(sum(ordered) / len(ordered), 6),
+        "min": round(ordered[0], 6),
+        "max": round(ordered[-1], 6),
+        "ci95_low": round(medians[int(0.025 * (len(medians) - 1))], 6),
+        "ci95_high": round(medians[int(math.ceil(0.975 * (len(medians) - 1)))], 6),
+    }
+
+
+def _mann_whitney_u(current: List[float], baseline: List[float]) -> Dict[str, float]:
+    """Two-sided Mann-Whitney U test (normal approximation with tie correction)."""
+    n1, n2 = len(current), len(baseline)
+    combined = sorted([(value, 0) for value in current] + [(value, 1) for value in baseline])
+    ranks = [0.0] * len(combined)
+    tie_term = 0.0
+    start = 0
+    while start < len(combined):
+        end = start
+        while end + 1 < len(combined) and combined[end + 1][0] == combined[start][0]:
+            end += 1
+        for index in range(start, end + 1):
+            ranks[index] = (start + end) / 2.0 + 1.0
+        ties = end - start + 1
+        tie_term += ties**3 - ties
+        start = end + 1
+    rank_sum = sum(rank for rank, (_value, group) in zip(ranks, combined) if group == 0)
+    u = rank_sum - n1 * (n1 + 1) / 2.0
+    n = n1 + n2
+    mean = n1 * n2 / 2.0
+    variance = n1 * n2 / 12.0 * ((n + 1) - tie_term / (n * (n - 1)))
+    if variance <= 0:
+        return {"u": u, "z": 0.0, "p_value": 1.0}
+    z = (u - mean - math.copysign(0.5, u - mean)) / math.sqrt(variance) if u != mean else 0.0
+    return {"u": u, "z": round(z, 6), "p_value": round(math.erfc(abs(z) / math.sqrt(2.0)), 6)}
 
 
 def _run_step(
     name: str,
     command: List[str],
-    analyzer: Optional[Callable[[str, str, int], Dict[str, object]]] = None,
+    analyzer: Optional[Analyzer] = None,
+    repeat: int = 1,
+    warmup: int = 0,
+    collect_events: bool = False,
 ) -> StepResult:
-    started = time.perf_counter()
-    completed = subprocess.run(command, capture_output=True, text=True, check=False)
-    duration = time.perf_counter() - started
+    def run_once(label: str) -> Tuple[StreamResult, Optional[Path]]:
+        if not collect_events:
+            return run_streaming(command), None
+        event_log = EVENT_LOG_DIR / f"{name}-{label}.jsonl"
+        event_log.unlink(missing_ok=True)
+        event_log.parent.mkdir(parents=True, exist_ok=True)
+        return run_streaming(command, env={**os.environ, EVENT_LOG_ENV: str(event_log)}), event_log
+
+    for index in range(warmup):
+        run_once(f"warmup{index}")
+    runs = [run_once(f"run{index}") for index in range(max(1, repeat))]
+    samples = [run.duration_sec for run, _ in runs]
+    # Output, analyzer metrics and resources come from the first failing timed run, else the last.
+    completed, event_log = next(((run, log) for run, log in runs if run.returncode != 0), runs[-1])
+    returncode = -1 if completed.returncode is None else completed.returncode
 
     metrics: Dict[str, object] = {}
     if analyzer is not None:
         try:
-            metrics = analyzer(completed.stdout, completed.stderr, completed.returncode)
+            events = load_events(event_log) if event_log is not None else []
+            metrics = analyzer(completed.stdout, completed.stderr, returncode, events)
         except Exception as exc:  # pragma: no cover - defensive fallback
             metrics = {"analyzer_error": str(exc)}
 
     return StepResult(
         name=name,
         command=command,
-        returncode=completed.returncode,
-        duration_seconds=duration,
+        returncode=returncode,
+        duration_seconds=_median(samples),
         stdout=completed.stdout.strip(),
         stderr=completed.stderr.strip(),
         metrics=metrics,
+        first_output_seconds=completed.first_output_sec,
+        last_output_seconds=completed.last_output_sec,
+        resources=completed.resources or {},
+        duration_samples=[round(sample, 6) for sample in samples],
+        duration_stats=_duration_stats(samples),
     )
 
 
@@ -117,21 +227,13 @@ def _trim(text: str, max_lines: int = 20) -> str:
     return "\n".join(lines[:max_lines] + [f"... ({len(lines) - max_lines} more lines)"])
 
 
-def _analyze_orchestrator(stdout: str, _stderr: str, returncode: int) -> Dict[str, object]:
+def _analyze_orchestrator(
+    _stdout: str, _stderr: str, returncode: int, events: List[Dict[str, object]]
+) -> Dict[str, object]:
     if returncode != 0:
         return {"task_count": 0, "analysis_status": "skipped_due_to_failure"}
 
-    task_payloads: List[Dict[str, object]] = []
-    for line in stdout.splitlines():
-        if "Task " not in line or " result:" not in line:
-            continue
-        payload_str = line.split("result:", 1)[1].strip()
-        try:
-            parsed = ast.literal_eval(payload_str)
-        except (ValueError, SyntaxError):
-            continue
-        if isinstance(parsed, dict):
-            task_payloads.append(parsed)
+    task_payloads = [event for event in events if event.get("event") == "task.completed"]
 
     exotic_generated: List[float] = []
     final_total_exotic: Optional[float] = None
@@ -143,7 +245,11 @@ def _analyze_orchestrator(stdout: str, _stderr: str, returncode: int) -> Dict[st
         if isinstance(total, (int, float)):
             final_total_exotic = float(total)
 
-    metrics: Dict[str, object] = {"task_count": len(task_payloads)}
+    metrics: Dict[str, object] = {
+        "task_count": len(task_payloads),
+        "rejected_task_count": sum(1 for event in events if event.get("event") == "task.rejected"),
+        "kairotic_moment_count": sum(1 for event in events if event.get("event") == "kairos.moment_recognized"),
+    }
     if exotic_generated:
         metrics["avg_exotic_energy_generated"] = round(sum(exotic_generated) / len(exotic_generated), 6)
     if final_total_exotic is not None:
@@ -151,7 +257,9 @@ def _analyze_orchestrator(stdout: str, _stderr: str, returncode: int) -> Dict[st
     return metrics
 
 
-def _analyze_simulation(stdout: str, _stderr: str, returncode: int) -> Dict[str, object]:
+def _analyze_simulation(
+    stdout: str, _stderr: str, returncode: int, _events: List[Dict[str, object]]
+) -> Dict[str, object]:
     if returncode != 0:
         return {"gamma_count": 0, "analysis_status": "skipped_due_to_failure"}
 
@@ -182,9 +290,16 @@ def _speed_band(total_duration_seconds: float) -> str:
 def _build_summary(generated_utc: str, stamp: str, steps: List[StepResult]) -> Dict[str, object]:
     passed_steps = sum(1 for step in steps if step.returncode == 0)
     total_steps = len(steps)
-    total_duration = round(sum(step.duration_seconds for step in steps), 6)
+    repeat = min((len(step.duration_samples) for step in steps), default=0)
+    total_samples = [round(sum(step.duration_samples[index] for step in steps), 6) for index in range(repeat)]
+    total_duration = round(_median(total_samples), 6) if total_samples else 0.0
     pass_rate = round((passed_steps / total_steps) if total_steps else 0.0, 6)
     body_health_score = round(pass_rate * 100.0, 2)
+    total_cpu = round(
+        sum(float(step.resources.get("cpu_user_sec", 0.0)) + float(step.resources.get("cpu_sys_sec", 0.0)) for step in steps),
+        6,
+    )
+    peak_rss_kb = max((int(step.resources.get("max_rss_kb", 0)) for step in steps), default=0)
     return {
         "generated_utc": generated_utc,
         "stamp": stamp,
@@ -193,6 +308,10 @@ def _build_summary(generated_utc: str, stamp: str, steps: List[StepResult]) -> D
         "failed_steps": total_steps - passed_steps,
         "pass_rate": pass_rate,
         "total_duration_seconds": total_duration,
+        "total_duration_samples": total_samples,
+        "total_duration_stats": _duration_stats(total_samples) if total_samples else {},
+        "total_cpu_seconds": total_cpu,
+        "peak_rss_kb": peak_rss_kb,
         "body_health_score": body_health_score,
         "speed_band": _speed_band(total_duration),
     }
@@ -215,32 +334,40 @@ def _resolve_benchmark_thresholds(
     }
 
 
-def _load_last_summary(history_path: Path) -> Optional[Dict[str, object]]:
+def _load_recent_summaries(history_path: Path, window: int) -> List[Dict[str, object]]:
+    """Return up to `window` most recent summary rows from the metrics history, oldest first."""
     if not history_path.exists():
-        return None
-    last_nonempty = ""
+        return []
+    recent: deque = deque(maxlen=max(1, window))
     with history_path.open("r", encoding="utf-8") as handle:
         for raw in handle:
             line = raw.strip()
-            if line:
-                last_nonempty = line
-    if not last_nonempty:
-        return None
-    try:
-        parsed = json.loads(last_nonempty)
-    except json.JSONDecodeError:
-        return None
-    if isinstance(parsed, dict):
-        return parsed
-    return None
+            if not line:
+                continue
+            try:
+                parsed = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if isinstance(parsed, dict):
+                recent.append(parsed)
+    return list(recent)
+
+
+def _history_samples(row: Dict[str, object]) -> List[float]:
+    samples = row.get("total_duration_samples")
+    if isinstance(samples, list) and samples:
+        return [float(value) for value in samples]
+    return [float(row.get("total_duration_seconds", 0.0))]
 
 
 def _evaluate_benchmark(
     summary: Dict[str, object],
-    previous: Optional[Dict[str, object]],
+    history: List[Dict[str, object]],
     min_pass_rate: float,
     max_duration_sec: float,
     min_health_score: float,
+    alpha: float = 0.05,
+    min_delta_sec: float = 0.2,
 ) -> Dict[str, object]:
     pass_rate = float(summary["pass_rate"])
     duration = float(summary["total_duration_seconds"])
@@ -260,22 +387,37 @@ def _evaluate_benchmark(
     }
     status = "PASS" if all(item["ok"] for item in checks.values()) else "WARN"
 
-    trend: Dict[str, object] = {"has_previous": previous is not None}
-    if previous is not None:
-        prev_duration = float(previous.get("total_duration_seconds", duration))
-        prev_health = float(previous.get("body_health_score", health))
-        duration_delta = round(duration - prev_duration, 6)
-        health_delta = round(health - prev_health, 6)
+    trend: Dict[str, object] = {"has_previous": bool(history)}
+    if history:
+        current = [float(value) for value in summary.get("total_duration_samples") or [duration]]
+        baseline = [sample for row in history for sample in _history_samples(row)]
+        baseline_median = _median(baseline)
+        baseline_health = _median([float(row.get("body_health_score", health)) for row in history])
+        duration_delta = round(_median(current) - baseline_median, 6)
+        health_delta = round(health - baseline_health, 6)
         trend.update(
             {
-                "previous_generated_utc": previous.get("generated_utc"),
+                "previous_generated_utc": history[-1].get("generated_utc"),
+                "baseline_rows": len(history),
+                "baseline_samples": len(baseline),
+                "current_samples": len(current),
+                "baseline_median_seconds": round(baseline_median, 6),
                 "duration_delta_seconds": duration_delta,
                 "health_delta": health_delta,
             }
         )
-        if duration_delta > 0.2 or health_delta < -2.0:
+        # A duration shift counts only if it is both practically large (min_delta_sec between
+        # medians) and, when both sides have enough samples, statistically significant.
+        significant = True
+        if len(current) >= MIN_TREND_TEST_SAMPLES and len(baseline) >= MIN_TREND_TEST_SAMPLES:
+            test = _mann_whitney_u(current, baseline)
+            significant = test["p_value"] < alpha
+            trend.update({"method": "mann_whitney_u", "p_value": test["p_value"], "z": test["z"], "alpha": alpha})
+        else:
+            trend["method"] = "median_delta"
+        if (significant and duration_delta > min_delta_sec) or health_delta < -2.0:
             trend["classification"] = "regression"
-        elif duration_delta < -0.2 or health_delta > 2.0:
+        elif (significant and duration_delta < -min_delta_sec) or health_delta > 2.0:
             trend["classification"] = "improvement"
         else:
             trend["classification"] = "stable"
@@ -309,13 +451,17 @@ def _build_markdown(
         "## Summary metrics",
         f"- pass_rate: `{summary['pass_rate']}`",
         f"- total_duration_seconds: `{summary['total_duration_seconds']}`",
+        f"- total_duration_stats: `{json.dumps(summary.get('total_duration_stats', {}), sort_keys=True)}`",
+        f"- total_cpu_seconds: `{summary['total_cpu_seconds']}`",
+        f"- peak_rss_kb: `{summary['peak_rss_kb']}`",
         f"- body_health_score: `{summary['body_health_score']}`",
         f"- speed_band: `{summary['speed_band']}`",
         "",
         "## Benchmark guardrail",
         f"- status: **{benchmark['status']}**",
         f"- profile: `{benchmark.get('profile', 'standard')}`",
-        f"- trend: `{benchmark['trend']['classification']}`",
+        f"- trend: `{benchmark['trend']['classification']}` (method: `{benchmark['trend'].get('method', 'n/a')}`,"
+        f" p_value: `{benchmark['trend'].get('p_value', 'n/a')}`)",
         "```json",
         json.dumps(benchmark.get("thresholds", {}), indent=2),
         "```",
@@ -342,6 +488,8 @@ def _build_markdown(
                 "",
                 f"- returncode: `{step.returncode}`",
                 f"- duration_seconds: `{step.duration_seconds:.3f}`",
+                f"- duration_stats: `{json.dumps(step.duration_stats, sort_keys=True)}`",
+                f"- resources: `{json.dumps(step.resources, sort_keys=True)}`",
                 "",
                 "### stdout (trimmed)",
                 "```",
@@ -377,6 +525,15 @@ def main() -> int:
         default=[0.0, 0.05, 0.1],
         help="Gamma values for run_simulation.py",
     )
+    parser.add_argument(
+        "--simulation-backend",
+        choices=("list", "numpy"),
+        default=_default_simulation_backend(),
+        help=(
+            "Spectrum backend forwarded to run_simulation.py's batched gamma sweep "
+            "(default: numpy when it is installed, else list)."
+        ),
+    )
     parser.add_argument(
         "--reports-dir",
         default="docs/body-track-runs",
@@ -441,7 +598,25 @@ def main() -> int:
         action="store_true",
         help="Exit non-zero if benchmark guardrail status is not PASS.",
     )
+    parser.add_argument("--repeat", type=int, default=1, help="Timed runs per step (durations report the median).")
+    parser.add_argument("--warmup", type=int, default=0, help="Untimed warmup runs per step before timing.")
+    parser.add_argument(
+        "--baseline-window",
+        type=int,
+        default=10,
+        help="Most recent metrics-history rows pooled as the trend baseline.",
+    )
+    parser.add_argument(
+        "--trend-alpha",
+        type=float,
+        default=0.05,
+        help="Significance level for the Mann-Whitney trend test.",
+    )
     args = parser.parse_args()
+    if args.repeat < 1 or args.warmup < 0 or args.baseline_window < 1:
+        parser.error("--repeat and --baseline-window must be >= 1 and --warmup >= 0")
+    if not 0.0 < args.trend_alpha < 1.0:
+        parser.error("--trend-alpha must be between 0 and 1")
 
     reports_dir = Path(args.reports_dir)
     reports_dir.mkdir(parents=True, exist_ok=True)
@@ -460,16 +635,33 @@ def main() -> int:
     ]
 
     steps = [
-        _run_step("compile_python_modules", [sys.executable, "-m", "py_compile", *py_files]),
+        _run_step(
+            "compile_python_modules",
+            [sys.executable, "-m", "py_compile", *py_files],
+            repeat=args.repeat,
+            warmup=args.warmup,
+        ),
         _run_step(
             "run_full_orchestrator_demo",
             [sys.executable, "trinity_orchestrator_full.py"],
             analyzer=_analyze_orchestrator,
+            repeat=args.repeat,
+            warmup=args.warmup,
+            collect_events=True,
         ),
         _run_step(
             "run_gmut_simulation",
-            [sys.executable, "run_simulation.py", "--gammas", *[str(g) for g in args.gammas]],
+            [
+                sys.executable,
+                "run_simulation.py",
+                "--gammas",
+                *[str(g) for g in args.gammas],
+                "--backend",
+                args.simulation_backend,
+            ],
             analyzer=_analyze_simulation,
+            repeat=args.repeat,
+            warmup=args.warmup,
         ),
     ]
 
@@ -498,7 +690,7 @@ def main() -> int:
     latest_benchmark.parent.mkdir(parents=True, exist_ok=True)
     metrics_history.parent.mkdir(parents=True, exist_ok=True)
 
-    previous_summary = _load_last_summary(metrics_history)
+    baseline_history = _load_recent_summaries(metrics_history, args.baseline_window)
     policy_path = Path(args.profile_policy)
     policy_overrides = _load_profile_benchmark_overrides(policy_path)
     benchmark_thresholds = _resolve_benchmark_thresholds(
@@ -510,15 +702,18 @@ def main() -> int:
     )
     benchmark = _evaluate_benchmark(
         summary=summary,
-        previous=previous_summary,
+        history=baseline_history,
         min_pass_rate=benchmark_thresholds["min_pass_rate"],
         max_duration_sec=benchmark_thresholds["max_duration_sec"],
         min_health_score=benchmark_thresholds["min_health_score"],
+        alpha=args.trend_alpha,
     )
     benchmark["profile"] = args.benchmark_profile
     benchmark["thresholds"] = benchmark_thresholds
     benchmark["policy_path"] = str(policy_path)
     benchmark["policy_override_used"] = args.benchmark_profile in policy_overrides
+    summary["repeat"] = args.repeat
+    summary["warmup"] = args.warmup
     summary["benchmark_profile"] = args.benchmark_profile
     summary["benchmark_status"] = benchmark["status"]
     summary["benchmark_trend"] = benchmark["trend"]["classification"]
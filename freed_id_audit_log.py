@@ -9,18 +9,57 @@ hash chain:
   entry_hash = sha256(prev_hash + canonical_entry_json)
 
 The chain gives tamper-evidence suitable for local governance verification.
+
+Appends do not re-read the ledger. The chain tip (next index, last entry hash)
+is kept in memory together with the ledger size and mtime it describes, so an
+append is one locked write. The tip is only persisted, to a sidecar
+``<ledger>.tip.json``, by ``close()``. When the sidecar is missing or stale (the
+process exited without closing, or another writer appended), the tip is
+recovered by seeking to the last line of the ledger, which reads a few
+kilobytes regardless of ledger size. A torn, unparseable trailing line left by
+an interrupted write is truncated during that recovery; complete lines are
+never removed.
+
+Verification streams the ledger line by line in constant memory. When the
+ledger is given a ``checkpoint_key``, each successful verification records an
+HMAC-SHA256-signed checkpoint (entry count, byte offset, entry_hash) in
+``<ledger>.checkpoint.json``; later verifications that find a valid signature
+and an unchanged anchor line resume there and only hash newer entries.
+`FreedIDRegistry` and the GOV-003 verifier take that key from the
+``FREED_ID_AUDIT_CHECKPOINT_KEY`` environment variable (``checkpoint_key_from_env``).
 """
 
 from __future__ import annotations
 
 import hashlib
+import hmac
 import json
+import os
+import threading
+import time
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, Iterable, Tuple
+from typing import BinaryIO, Dict, Iterable, List, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX platforms fall back to the in-process lock
+    fcntl = None
 
 ZERO_HASH = "0" * 64
+TIP_SUFFIX = ".tip.json"
+CHECKPOINT_SUFFIX = ".checkpoint.json"
+CHECKPOINT_KEY_ENV = "FREED_ID_AUDIT_CHECKPOINT_KEY"
+_TAIL_CHUNK_BYTES = 4096
+
+AuditEvent = Tuple[str, str, Optional[Dict[str, object]]]
+
+
+def checkpoint_key_from_env() -> Optional[bytes]:
+    """The checkpoint HMAC key from ``FREED_ID_AUDIT_CHECKPOINT_KEY``, or None when unset or empty."""
+    value = os.environ.get(CHECKPOINT_KEY_ENV, "")
+    return value.encode("utf-8") if value else None
 
 
 def _canonical_json(payload: Dict[str, object]) -> str:
@@ -39,12 +78,81 @@ class AuditAppendResult:
     entry_hash: str
 
 
+@dataclass
+class AuditVerificationReport:
+    ok: bool
+    detail: str
+    entries_verified: int
+    entries_hashed: int
+    resumed_from_entry: int
+    byte_offset: int
+    elapsed_sec: float
+    entries_per_sec: float
+
+
+@dataclass
+class _Checkpoint:
+    entry_count: int
+    line_offset: int
+    byte_offset: int
+    entry_hash: str
+
+    def message(self) -> bytes:
+        return _canonical_json(
+            {
+                "entry_count": self.entry_count,
+                "line_offset": self.line_offset,
+                "byte_offset": self.byte_offset,
+                "entry_hash": self.entry_hash,
+            }
+        ).encode("utf-8")
+
+
+@dataclass
+class _ChainTip:
+    next_index: int
+    entry_hash: str
+    byte_size: int
+    mtime_ns: int
+
+    def matches(self, stat: os.stat_result) -> bool:
+        return self.byte_size == stat.st_size and self.mtime_ns == stat.st_mtime_ns
+
+
+def _read_tail_entry(handle: BinaryIO, size: int) -> Tuple[Optional[Dict[str, object]], int, bytes]:
+    """Return (last complete entry, byte offset where complete lines end, trailing fragment)."""
+    buf = b""
+    pos = size
+    while True:
+        step = min(_TAIL_CHUNK_BYTES, pos)
+        pos -= step
+        handle.seek(pos)
+        buf = handle.read(step) + buf
+        last_newline = buf.rfind(b"\n")
+        fragment = buf[last_newline + 1 :]
+        complete_end = pos + last_newline + 1
+        lines = buf[: last_newline + 1].split(b"\n") if last_newline != -1 else []
+        # lines[0] may be cut off by the chunk boundary unless we reached the start of the file.
+        first_usable = 0 if pos == 0 else 1
+        for line in reversed(lines[first_usable:]):
+            if line.strip():
+                return json.loads(line), complete_end, fragment
+        if pos == 0:
+            return None, max(0, complete_end), fragment
+
+
 class FreedIDAuditLedger:
     """Append-only JSONL ledger with hash-chain integrity checks."""
 
-    def __init__(self, ledger_path: str | Path) -> None:
+    def __init__(self, ledger_path: str | Path, checkpoint_key: Optional[bytes] = None) -> None:
         self.ledger_path = Path(ledger_path)
         self.ledger_path.parent.mkdir(parents=True, exist_ok=True)
+        self.tip_path = self.ledger_path.with_name(self.ledger_path.name + TIP_SUFFIX)
+        self.checkpoint_path = self.ledger_path.with_name(self.ledger_path.name + CHECKPOINT_SUFFIX)
+        self._checkpoint_key = checkpoint_key
+        self._lock = threading.Lock()
+        self._tip: Optional[_ChainTip] = None
+        self._tip_dirty = False
 
     def iter_entries(self) -> Iterable[Dict[str, object]]:
         if not self.ledger_path.exists():
@@ -58,13 +166,73 @@ class FreedIDAuditLedger:
                 entries.append(json.loads(line))
         return entries
 
-    def append(self, action: str, did: str, details: Dict[str, object] | None = None) -> AuditAppendResult:
-        entries = list(self.iter_entries())
-        prev_hash = ZERO_HASH if not entries else str(entries[-1].get("entry_hash", ZERO_HASH))
-        idx = len(entries)
+    def _load_persisted_tip(self) -> Optional[_ChainTip]:
+        try:
+            payload = json.loads(self.tip_path.read_text(encoding="utf-8"))
+            return _ChainTip(
+                next_index=int(payload["next_index"]),
+                entry_hash=str(payload["entry_hash"]),
+                byte_size=int(payload["byte_size"]),
+                mtime_ns=int(payload["mtime_ns"]),
+            )
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def _persist_tip(self, tip: _ChainTip) -> None:
+        tmp_path = self.tip_path.with_name(self.tip_path.name + ".tmp")
+        tmp_path.write_text(
+            json.dumps(
+                {
+                    "next_index": tip.next_index,
+                    "entry_hash": tip.entry_hash,
+                    "byte_size": tip.byte_size,
+                    "mtime_ns": tip.mtime_ns,
+                },
+                sort_keys=True,
+            )
+            + "\n",
+            encoding="utf-8",
+        )
+        os.replace(tmp_path, self.tip_path)
+
+    def _recover_tip(self, handle: BinaryIO) -> _ChainTip:
+        size = os.fstat(handle.fileno()).st_size
+        last_entry, complete_end, fragment = _read_tail_entry(handle, size) if size else (None, 0, b"")
+        if fragment.strip():
+            try:
+                parsed = json.loads(fragment)
+            except json.JSONDecodeError:
+                parsed = None
+            if isinstance(parsed, dict) and "entry_hash" in parsed:
+                # A complete entry that only lost its newline: keep it and terminate the line.
+                handle.write(b"\n")
+                last_entry = parsed
+            else:
+                # Torn write from an interrupted append; it was never acknowledged to a caller.
+                os.ftruncate(handle.fileno(), complete_end)
+        handle.flush()
+        stat = os.fstat(handle.fileno())
+        if last_entry is None:
+            return _ChainTip(0, ZERO_HASH, stat.st_size, stat.st_mtime_ns)
+        return _ChainTip(
+            next_index=int(last_entry.get("index", -1)) + 1,
+            entry_hash=str(last_entry.get("entry_hash", ZERO_HASH)),
+            byte_size=stat.st_size,
+            mtime_ns=stat.st_mtime_ns,
+        )
 
+    def _current_tip(self, handle: BinaryIO) -> _ChainTip:
+        stat = os.fstat(handle.fileno())
+        if self._tip is not None and self._tip.matches(stat):
+            return self._tip
+        persisted = self._load_persisted_tip()
+        if persisted is not None and persisted.matches(stat):
+            return persisted
+        return self._recover_tip(handle)
+
+    def _build_entry(self, index: int, prev_hash: str, action: str, did: str, details: Optional[Dict[str, object]]) -> Dict[str, object]:
         payload: Dict[str, object] = {
-            "index": idx,
+            "index": index,
             "timestamp_utc": datetime.now(timezone.utc).replace(microsecond=0).isoformat(),
             "action": action,
             "did": did,
@@ -73,35 +241,168 @@ class FreedIDAuditLedger:
         entry_hash = _hash(prev_hash, payload)
         payload["prev_hash"] = prev_hash
         payload["entry_hash"] = entry_hash
+        return payload
 
-        with self.ledger_path.open("a", encoding="utf-8") as handle:
-            handle.write(json.dumps(payload, sort_keys=True) + "\n")
+    def append_many(self, events: Iterable[AuditEvent]) -> List[AuditAppendResult]:
+        """Append ``(action, did, details)`` events under one lock and one write.
 
-        return AuditAppendResult(index=idx, prev_hash=prev_hash, entry_hash=entry_hash)
+        Cost is proportional to the batch size, not the ledger size.
+        """
+        batch = list(events)
+        if not batch:
+            return []
+        with self._lock, self.ledger_path.open("a+b") as handle:
+            if fcntl is not None:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+            try:
+                tip = self._current_tip(handle)
+                next_index, prev_hash = tip.next_index, tip.entry_hash
+                lines: List[bytes] = []
+                results: List[AuditAppendResult] = []
+                for action, did, details in batch:
+                    payload = self._build_entry(next_index, prev_hash, action, did, details)
+                    lines.append((json.dumps(payload, sort_keys=True) + "\n").encode("utf-8"))
+                    results.append(AuditAppendResult(index=next_index, prev_hash=prev_hash, entry_hash=str(payload["entry_hash"])))
+                    next_index, prev_hash = next_index + 1, str(payload["entry_hash"])
 
-    def verify_integrity(self) -> Tuple[bool, str]:
-        entries = list(self.iter_entries())
+                handle.write(b"".join(lines))
+                handle.flush()
+                stat = os.fstat(handle.fileno())
+                self._tip = _ChainTip(next_index, prev_hash, stat.st_size, stat.st_mtime_ns)
+                self._tip_dirty = True
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+        return results
+
+    def append(self, action: str, did: str, details: Dict[str, object] | None = None) -> AuditAppendResult:
+        return self.append_many([(action, did, details)])[0]
+
+    def close(self) -> None:
+        """Persist the chain tip so the next process skips tail recovery; appending afterwards is still allowed."""
+        with self._lock:
+            if self._tip_dirty and self._tip is not None:
+                self._persist_tip(self._tip)
+                self._tip_dirty = False
+
+    def _sign(self, checkpoint: _Checkpoint) -> str:
+        assert self._checkpoint_key is not None
+        return hmac.new(self._checkpoint_key, checkpoint.message(), hashlib.sha256).hexdigest()
+
+    def _load_trusted_checkpoint(self, handle: BinaryIO, size: int) -> Optional[_Checkpoint]:
+        if self._checkpoint_key is None:
+            return None
+        try:
+            payload = json.loads(self.checkpoint_path.read_text(encoding="utf-8"))
+            checkpoint = _Checkpoint(
+                entry_count=int(payload["entry_count"]),
+                line_offset=int(payload["line_offset"]),
+                byte_offset=int(payload["byte_offset"]),
+                entry_hash=str(payload["entry_hash"]),
+            )
+            signature = str(payload["signature"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        if not hmac.compare_digest(signature, self._sign(checkpoint)):
+            return None
+        if checkpoint.byte_offset > size or not 0 <= checkpoint.line_offset < checkpoint.byte_offset:
+            return None
+        # The anchor line must still be the entry the checkpoint vouched for.
+        handle.seek(checkpoint.line_offset)
+        anchor = handle.read(checkpoint.byte_offset - checkpoint.line_offset)
+        try:
+            if str(json.loads(anchor).get("entry_hash")) != checkpoint.entry_hash:
+                return None
+        except (json.JSONDecodeError, AttributeError):
+            return None
+        return checkpoint
+
+    def _record_checkpoint(self, checkpoint: _Checkpoint) -> None:
+        payload = {
+            "entry_count": checkpoint.entry_count,
+            "line_offset": checkpoint.line_offset,
+            "byte_offset": checkpoint.byte_offset,
+            "entry_hash": checkpoint.entry_hash,
+            "recorded_utc": datetime.now(timezone.utc).replace(microsecond=0).isoformat(),
+            "signature": self._sign(checkpoint),
+        }
+        tmp_path = self.checkpoint_path.with_name(self.checkpoint_path.name + ".tmp")
+        tmp_path.write_text(json.dumps(payload, sort_keys=True) + "\n", encoding="utf-8")
+        os.replace(tmp_path, self.checkpoint_path)
+
+    def verify_integrity_report(self) -> AuditVerificationReport:
+        """Stream-verify the hash chain, resuming from a trusted checkpoint when one exists."""
+        started = time.perf_counter()
+        idx = 0
+        hashed = 0
+        resumed_from = 0
+        offset = 0
         prev_hash = ZERO_HASH
-        for idx, entry in enumerate(entries):
-            try:
-                expected_prev = str(entry["prev_hash"])
-                provided_hash = str(entry["entry_hash"])
-                payload = {
-                    "index": entry["index"],
-                    "timestamp_utc": entry["timestamp_utc"],
-                    "action": entry["action"],
-                    "did": entry["did"],
-                    "details": entry.get("details", {}),
-                }
-            except KeyError as exc:
-                return False, f"missing_required_field_at_index={idx}:{exc}"
-
-            if expected_prev != prev_hash:
-                return False, f"prev_hash_mismatch_at_index={idx}"
-
-            computed = _hash(prev_hash, payload)
-            if provided_hash != computed:
-                return False, f"entry_hash_mismatch_at_index={idx}"
-
-            prev_hash = provided_hash
-        return True, f"entries_verified={len(entries)}"
+        last_line_offset = -1
+
+        def report(ok: bool, detail: str) -> AuditVerificationReport:
+            elapsed = time.perf_counter() - started
+            return AuditVerificationReport(
+                ok=ok,
+                detail=detail,
+                entries_verified=idx,
+                entries_hashed=hashed,
+                resumed_from_entry=resumed_from,
+                byte_offset=offset,
+                elapsed_sec=round(elapsed, 6),
+                entries_per_sec=round(hashed / elapsed, 1) if elapsed > 0 else 0.0,
+            )
+
+        if not self.ledger_path.exists():
+            return report(True, "entries_verified=0")
+
+        with self.ledger_path.open("rb") as handle:
+            checkpoint = self._load_trusted_checkpoint(handle, os.fstat(handle.fileno()).st_size)
+            if checkpoint is not None:
+                idx = resumed_from = checkpoint.entry_count
+                offset = checkpoint.byte_offset
+                prev_hash = checkpoint.entry_hash
+                last_line_offset = checkpoint.line_offset
+            handle.seek(offset)
+            for raw in handle:
+                line_offset = offset
+                offset += len(raw)
+                if not raw.strip():
+                    continue
+                try:
+                    entry = json.loads(raw)
+                    expected_prev = str(entry["prev_hash"])
+                    provided_hash = str(entry["entry_hash"])
+                    payload = {
+                        "index": entry["index"],
+                        "timestamp_utc": entry["timestamp_utc"],
+                        "action": entry["action"],
+                        "did": entry["did"],
+                        "details": entry.get("details", {}),
+                    }
+                except KeyError as exc:
+                    return report(False, f"missing_required_field_at_index={idx}:{exc}")
+                except json.JSONDecodeError:
+                    return report(False, f"invalid_json_at_index={idx}")
+
+                if expected_prev != prev_hash:
+                    return report(False, f"prev_hash_mismatch_at_index={idx}")
+
+                computed = _hash(prev_hash, payload)
+                hashed += 1
+                if provided_hash != computed:
+                    return report(False, f"entry_hash_mismatch_at_index={idx}")
+
+                prev_hash = provided_hash
+                last_line_offset = line_offset
+                idx += 1
+
+        if self._checkpoint_key is not None and idx > 0 and hashed > 0:
+            self._record_checkpoint(
+                _Checkpoint(entry_count=idx, line_offset=last_line_offset, byte_offset=offset, entry_hash=prev_hash)
+            )
+        return report(True, f"entries_verified={idx}")
+
+    def verify_integrity(self) -> Tuple[bool, str]:
+        result = self.verify_integrity_report()
+        return result.ok, result.detail
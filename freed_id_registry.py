@@ -2,52 +2,81 @@
 freed_id_registry.py
 ====================
 
-Minimal in-memory Freed ID registry implementation.
+Minimal Freed ID registry implementation.
+
+Documents live in a pluggable `DIDStore` (see freed_id_registry_store.py):
+`InMemoryDIDStore` by default, or `SQLiteDIDStore` for a persistent registry.
+Secondary indexes (verification-method id -> method, credential id -> service,
+active DIDs, controller -> DIDs) are maintained by the store on register/
+update/revoke/issue_credential so per-request lookups do not scan document
+lists. With the in-memory store, in-place edits to a document returned by
+``resolve`` are still seen by later lookups; with SQLite they must go through
+``update``.
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from pathlib import Path
 from typing import Dict, List, Optional
 import uuid
 
-from freed_id_audit_log import FreedIDAuditLedger
+from freed_id_audit_log import FreedIDAuditLedger, checkpoint_key_from_env
 from freed_id_minimum_disclosure import (
     MinimumDisclosurePolicy,
     build_minimum_disclosure_presentation,
 )
+from freed_id_registry_store import (
+    DIDDocument,
+    DIDStore,
+    InMemoryDIDStore,
+    ServiceRecord,
+    SQLiteDIDStore,
+    VerificationMethod,
+)
 
-VerificationMethod = Dict[str, object]
-ServiceRecord = Dict[str, object]
-
+__all__ = [
+    "DIDDocument",
+    "DIDStore",
+    "FreedIDRegistry",
+    "InMemoryDIDStore",
+    "SQLiteDIDStore",
+    "ServiceRecord",
+    "VerificationMethod",
+]
 
-@dataclass
-class DIDDocument:
-    """A simplified representation of a Freed ID DID Document."""
 
-    did: str
-    controller: str
-    verification_methods: List[VerificationMethod] = field(default_factory=list)
-    services: List[ServiceRecord] = field(default_factory=list)
-    revoked: bool = False
+class FreedIDRegistry:
+    """A simple registry for Freed ID DID Documents over a pluggable store."""
 
-    def to_dict(self) -> Dict[str, object]:
-        return {
-            "@context": "https://www.w3.org/ns/did/v1",
-            "id": self.did,
-            "controller": self.controller,
-            "verificationMethod": self.verification_methods,
-            "service": self.services,
-            "revoked": self.revoked,
-        }
+    def __init__(
+        self,
+        audit_ledger_path: Optional[str] = None,
+        store: Optional[DIDStore] = None,
+        audit_checkpoint_key: Optional[bytes] = None,
+    ) -> None:
+        """``audit_checkpoint_key`` signs ledger verification checkpoints; defaults to FREED_ID_AUDIT_CHECKPOINT_KEY."""
+        self._store: DIDStore = store if store is not None else InMemoryDIDStore()
+        if audit_checkpoint_key is None:
+            audit_checkpoint_key = checkpoint_key_from_env()
+        self._audit_ledger = (
+            FreedIDAuditLedger(audit_ledger_path, checkpoint_key=audit_checkpoint_key) if audit_ledger_path else None
+        )
 
+    @classmethod
+    def open_sqlite(
+        cls, db_path: str | Path, audit_ledger_path: Optional[str] = None, audit_checkpoint_key: Optional[bytes] = None
+    ) -> "FreedIDRegistry":
+        return cls(audit_ledger_path=audit_ledger_path, store=SQLiteDIDStore(db_path), audit_checkpoint_key=audit_checkpoint_key)
 
-class FreedIDRegistry:
-    """A simple in-memory registry for Freed ID DID Documents."""
+    @property
+    def store(self) -> DIDStore:
+        return self._store
 
-    def __init__(self, audit_ledger_path: Optional[str] = None) -> None:
-        self._store: Dict[str, DIDDocument] = {}
-        self._audit_ledger = FreedIDAuditLedger(audit_ledger_path) if audit_ledger_path else None
+    def close(self) -> None:
+        """Close the store and persist the audit ledger's chain tip."""
+        if self._audit_ledger is not None:
+            self._audit_ledger.close()
+        self._store.close()
 
     def _audit(self, action: str, did: str, details: Optional[Dict[str, object]] = None) -> None:
         if self._audit_ledger is None:
@@ -59,12 +88,11 @@ class FreedIDRegistry:
 
     def register(self, doc: DIDDocument) -> str:
         did = doc.did or self._generate_did()
-        existing = self._store.get(did)
-        if existing and not existing.revoked:
+        if self._store.revoked_state(did) is False:
             raise ValueError(f"DID {did} already exists and is active")
 
         doc.did = did
-        self._store[did] = doc
+        self._store.put(doc)
         self._audit(
             "register",
             did,
@@ -77,28 +105,30 @@ class FreedIDRegistry:
         return did
 
     def resolve(self, did: str) -> Optional[DIDDocument]:
+        """
+        The DID's document, or None when unknown.
+
+        Backends differ on in-place edits: InMemoryDIDStore hands back the stored
+        object, so changes to it are visible to later lookups, while
+        SQLiteDIDStore.get returns a detached copy whose changes are dropped. Pass
+        modified documents to `update()` to persist them with either backend.
+        """
         return self._store.get(did)
 
     def resolve_verification_method(self, did: str, verification_method_id: str) -> Optional[VerificationMethod]:
-        doc = self.resolve(did)
-        if doc is None or doc.revoked:
+        if self._store.revoked_state(did) is not False:
             return None
 
-        for method in doc.verification_methods:
-            if not isinstance(method, dict):
-                continue
-            if str(method.get("id", "")).strip() == verification_method_id:
-                return dict(method)
-        return None
+        method = self._store.find_method(did, verification_method_id)
+        return dict(method) if method is not None else None
 
     def update(self, did: str, new_doc: DIDDocument) -> None:
-        current = self._store.get(did)
-        if current is None or current.revoked:
+        if self._store.revoked_state(did) is not False:
             raise KeyError(f"DID {did} does not exist or is revoked")
         if did != new_doc.did:
             raise ValueError("DID mismatch in update")
 
-        self._store[did] = new_doc
+        self._store.put(new_doc)
         self._audit(
             "update",
             did,
@@ -109,29 +139,29 @@ class FreedIDRegistry:
         )
 
     def revoke(self, did: str) -> None:
-        doc = self._store.get(did)
-        if doc is None:
+        if self._store.revoked_state(did) is None:
             raise KeyError(f"DID {did} does not exist")
 
-        doc.revoked = True
+        self._store.mark_revoked(did)
         self._audit("revoke", did, {"revoked": True})
 
     def list_active(self) -> List[str]:
-        return [did for did, doc in self._store.items() if not doc.revoked]
+        return self._store.active_dids()
+
+    def list_by_controller(self, controller: str) -> List[str]:
+        return self._store.dids_for_controller(controller)
 
     def issue_credential(self, did: str, credential: Dict[str, object]) -> None:
-        doc = self._store.get(did)
-        if doc is None or doc.revoked:
+        if self._store.revoked_state(did) is not False:
             raise KeyError(f"DID {did} does not exist or is revoked")
 
-        credential_id = f"{did}#cred-{len(doc.services)}"
-        doc.services.append(
-            {
-                "id": credential_id,
-                "type": "FreedIDCredential",
-                "credential": credential,
-            }
-        )
+        credential_id = f"{did}#cred-{self._store.service_count(did)}"
+        service: ServiceRecord = {
+            "id": credential_id,
+            "type": "FreedIDCredential",
+            "credential": credential,
+        }
+        self._store.append_service(did, service)
         self._audit(
             "issue_credential",
             did,
@@ -142,10 +172,9 @@ class FreedIDRegistry:
         )
 
     def verify_credential(self, did: str, credential_id: str) -> bool:
-        doc = self._store.get(did)
-        if doc is None or doc.revoked:
+        if self._store.revoked_state(did) is not False:
             return False
-        return any(str(service.get("id", "")) == credential_id for service in doc.services)
+        return self._store.find_service(did, credential_id) is not None
 
     def build_credential_presentation(
         self,
@@ -154,14 +183,10 @@ class FreedIDRegistry:
         requested_fields: List[str],
         policy: MinimumDisclosurePolicy,
     ) -> Dict[str, object]:
-        doc = self.resolve(did)
-        if doc is None:
+        if self._store.revoked_state(did) is None:
             raise KeyError(f"DID not found: {did}")
 
-        credential_service = next(
-            (service for service in doc.services if str(service.get("id", "")) == credential_id),
-            None,
-        )
+        credential_service = self._store.find_service(did, credential_id)
         if credential_service is None:
             raise KeyError(f"Credential not found: {credential_id}")
 
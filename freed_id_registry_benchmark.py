@@ -0,0 +1,120 @@
+"""
+freed_id_registry_benchmark.py
+------------------------------
+
+Micro-benchmark for FreedIDRegistry lookup paths.
+
+For each credential count, one DID document is grown to that many issued
+credentials and verification methods, then the per-call latency of
+`resolve_verification_method`, `verify_credential` and `list_active` is
+measured. The indexed paths should stay flat as documents accumulate
+credentials; a linear scan over `doc.services` is timed alongside as the
+reference the indexes replaced. `--store sqlite` runs the same lookups against
+a throwaway `SQLiteDIDStore`.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+from freed_id_registry import DIDDocument, FreedIDRegistry, SQLiteDIDStore
+
+
+def _per_call_us(fn: Callable[[], object], lookups: int) -> float:
+    started = time.perf_counter()
+    for _ in range(lookups):
+        fn()
+    return round((time.perf_counter() - started) / lookups * 1e6, 3)
+
+
+def _bench_size(credential_count: int, lookups: int, filler_dids: int, db_path: Path | None) -> Dict[str, object]:
+    registry = FreedIDRegistry(store=SQLiteDIDStore(db_path)) if db_path else FreedIDRegistry()
+    for _ in range(filler_dids):
+        registry.register(DIDDocument(did="", controller="did:freed:filler"))
+
+    did = registry.register(
+        DIDDocument(
+            did="",
+            controller="did:freed:controller",
+            verification_methods=[
+                {"id": f"key-{idx}", "type": "Ed25519VerificationKey2018", "publicKeyBase58": "GfH2..."}
+                for idx in range(credential_count)
+            ],
+        )
+    )
+    for idx in range(credential_count):
+        registry.issue_credential(did, {"claim": f"c{idx}", "issuer": "did:freed:issuer"})
+
+    last_method = f"key-{credential_count - 1}"
+    last_credential = f"{did}#cred-{credential_count - 1}"
+    doc = registry.resolve(did)
+    assert doc is not None
+
+    row = {
+        "store": type(registry.store).__name__,
+        "credential_count": credential_count,
+        "active_dids": len(registry.list_active()),
+        "resolve_verification_method_us": _per_call_us(
+            lambda: registry.resolve_verification_method(did, last_method), lookups
+        ),
+        "verify_credential_us": _per_call_us(lambda: registry.verify_credential(did, last_credential), lookups),
+        "list_active_us": _per_call_us(registry.list_active, max(1, lookups // 100)),
+        "linear_scan_reference_us": _per_call_us(
+            lambda: any(str(service.get("id", "")) == last_credential for service in doc.services), lookups
+        ),
+    }
+    registry.store.close()
+    return row
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark FreedIDRegistry indexed lookups.")
+    parser.add_argument(
+        "--credential-counts",
+        type=int,
+        nargs="+",
+        default=[10, 100, 1000, 5000],
+        help="Credentials (and verification methods) per benchmarked DID document.",
+    )
+    parser.add_argument("--lookups", type=int, default=20000, help="Timed calls per lookup path.")
+    parser.add_argument("--filler-dids", type=int, default=1000, help="Additional active DIDs in the registry.")
+    parser.add_argument("--store", choices=["memory", "sqlite"], default="memory", help="Registry storage backend.")
+    parser.add_argument("--output-json", default="", help="Optional path for the JSON result rows.")
+    args = parser.parse_args()
+
+    if args.lookups < 1 or any(count < 1 for count in args.credential_counts):
+        parser.error("--lookups and --credential-counts must be >= 1")
+
+    with tempfile.TemporaryDirectory(prefix="freed-id-bench-") as tmp:
+        rows: List[Dict[str, object]] = [
+            _bench_size(
+                count,
+                args.lookups,
+                args.filler_dids,
+                Path(tmp) / f"registry-{count}.db" if args.store == "sqlite" else None,
+            )
+            for count in args.credential_counts
+        ]
+    print("credentials | resolve_vm_us | verify_cred_us | list_active_us | linear_scan_us")
+    for row in rows:
+        print(
+            f"{row['credential_count']:>11} | {row['resolve_verification_method_us']:>13} | "
+            f"{row['verify_credential_us']:>14} | {row['list_active_us']:>14} | "
+            f"{row['linear_scan_reference_us']:>14}"
+        )
+
+    if args.output_json:
+        output = Path(args.output_json)
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text(json.dumps({"rows": rows}, indent=2) + "\n", encoding="utf-8")
+        print(f"output_json={output}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
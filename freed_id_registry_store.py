@@ -0,0 +1,438 @@
+"""
+freed_id_registry_store.py
+--------------------------
+
+Storage backends for the Freed ID registry.
+
+`InMemoryDIDStore` keeps live `DIDDocument` objects plus the secondary indexes
+(verification-method id -> method, credential id -> service, active DIDs,
+controller -> DIDs) and is the default. Its lookup indexes are validated against
+the live document on read, so in-place edits to a resolved document stay visible.
+
+`SQLiteDIDStore` persists documents in a SQLite database in WAL mode. Only the
+schema is touched at open time, so startup does not depend on how many DIDs are
+stored; documents are loaded lazily per lookup and the secondary indexes are
+SQL indexes. `resolve` returns a fresh copy each time, so in-place edits must
+go back through `FreedIDRegistry.update` to be persisted. `snapshot` writes a
+consistent copy of the database and `compact` checkpoints the WAL and vacuums.
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+VerificationMethod = Dict[str, object]
+ServiceRecord = Dict[str, object]
+
+
+@dataclass
+class DIDDocument:
+    """A simplified representation of a Freed ID DID Document."""
+
+    did: str
+    controller: str
+    verification_methods: List[VerificationMethod] = field(default_factory=list)
+    services: List[ServiceRecord] = field(default_factory=list)
+    revoked: bool = False
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "@context": "https://www.w3.org/ns/did/v1",
+            "id": self.did,
+            "controller": self.controller,
+            "verificationMethod": self.verification_methods,
+            "service": self.services,
+            "revoked": self.revoked,
+        }
+
+
+def _method_key(method: object) -> Optional[str]:
+    if not isinstance(method, dict):
+        return None
+    return str(method.get("id", "")).strip()
+
+
+def _service_key(service: ServiceRecord) -> str:
+    return str(service.get("id", ""))
+
+
+class DIDStore(ABC):
+    """Storage interface used by FreedIDRegistry."""
+
+    @abstractmethod
+    def get(self, did: str) -> Optional[DIDDocument]:
+        """
+        The stored document, or None. Whether it is live or a detached copy is
+        backend-specific: InMemoryDIDStore returns the stored object,
+        SQLiteDIDStore a fresh copy.
+        """
+        ...
+
+    @abstractmethod
+    def revoked_state(self, did: str) -> Optional[bool]:
+        """Return None when the DID is unknown, otherwise its revoked flag."""
+        ...
+
+    @abstractmethod
+    def put(self, doc: DIDDocument) -> None:
+        ...
+
+    @abstractmethod
+    def mark_revoked(self, did: str) -> None:
+        ...
+
+    @abstractmethod
+    def service_count(self, did: str) -> int:
+        ...
+
+    @abstractmethod
+    def append_service(self, did: str, service: ServiceRecord) -> None:
+        ...
+
+    @abstractmethod
+    def find_method(self, did: str, method_id: str) -> Optional[VerificationMethod]:
+        ...
+
+    @abstractmethod
+    def find_service(self, did: str, service_id: str) -> Optional[ServiceRecord]:
+        ...
+
+    @abstractmethod
+    def active_dids(self) -> List[str]:
+        ...
+
+    @abstractmethod
+    def dids_for_controller(self, controller: str) -> List[str]:
+        ...
+
+    @abstractmethod
+    def __len__(self) -> int:
+        ...
+
+    @abstractmethod
+    def snapshot(self, path: str | Path) -> Path:
+        """Write a SQLite copy of the store that `SQLiteDIDStore` can open."""
+        ...
+
+    def compact(self) -> None:
+        return None
+
+    def close(self) -> None:
+        return None
+
+
+# (id of the indexed list, its length, key -> first position in it)
+_PositionIndex = Tuple[int, int, Dict[str, int]]
+
+
+def _positions(items: List[object], key_of: Callable[[object], Optional[str]]) -> Dict[str, int]:
+    positions: Dict[str, int] = {}
+    for position, item in enumerate(items):
+        key = key_of(item)
+        if key is not None:
+            positions.setdefault(key, position)
+    return positions
+
+
+def _indexed_lookup(
+    index: Dict[str, _PositionIndex],
+    did: str,
+    items: List[object],
+    key_of: Callable[[object], Optional[str]],
+    key: str,
+) -> Optional[object]:
+    """First item of ``items`` whose key is ``key``, using ``index[did]`` when it still describes ``items``."""
+    entry = index.get(did)
+    if entry is None or entry[0] != id(items) or entry[1] != len(items):
+        entry = index[did] = (id(items), len(items), _positions(items, key_of))
+    position = entry[2].get(key)
+    if position is not None and key_of(items[position]) == key:
+        return items[position]
+    # Edited in place without changing the list length: rebuild and look again.
+    positions = _positions(items, key_of)
+    index[did] = (id(items), len(items), positions)
+    position = positions.get(key)
+    return None if position is None else items[position]
+
+
+class InMemoryDIDStore(DIDStore):
+    """
+    Keeps the live `DIDDocument` objects, so in-place edits to a resolved
+    document are seen by later lookups just as after `update()`. The method and
+    credential indexes are position maps checked against the document's current
+    lists on every lookup and rebuilt when those lists were replaced, resized or
+    edited; revocation state is read from the document itself.
+    """
+
+    def __init__(self) -> None:
+        self._docs: Dict[str, DIDDocument] = {}
+        self._method_index: Dict[str, _PositionIndex] = {}
+        self._credential_index: Dict[str, _PositionIndex] = {}
+        # Dicts keyed by DID act as insertion-ordered sets, in first-registration order.
+        self._active: Dict[str, None] = {}
+        self._by_controller: Dict[str, Dict[str, None]] = {}
+        self._indexed_controller: Dict[str, str] = {}
+
+    def get(self, did: str) -> Optional[DIDDocument]:
+        return self._docs.get(did)
+
+    def revoked_state(self, did: str) -> Optional[bool]:
+        doc = self._docs.get(did)
+        return None if doc is None else doc.revoked
+
+    def put(self, doc: DIDDocument) -> None:
+        previous = self._docs.get(doc.did)
+        # Documents can be mutated in place before update(), so the old controller
+        # is taken from the index rather than from the stored document.
+        controller = self._indexed_controller.get(doc.did)
+        if controller is not None and controller != doc.controller:
+            owned = self._by_controller[controller]
+            owned.pop(doc.did, None)
+            if not owned:
+                del self._by_controller[controller]
+        self._by_controller.setdefault(doc.controller, {})[doc.did] = None
+        self._indexed_controller[doc.did] = doc.controller
+        # A DID keeps its first-registration slot in _docs; the lookup indexes are rebuilt on demand.
+        self._docs[doc.did] = doc
+        self._method_index.pop(doc.did, None)
+        self._credential_index.pop(doc.did, None)
+        if doc.revoked:
+            self._active.pop(doc.did, None)
+        elif doc.did not in self._active:
+            if previous is None:
+                self._active[doc.did] = None
+            else:
+                # Re-registered after revocation: back in its original place, as list_active always had it.
+                self._active = {did: None for did in self._docs if did in self._active or did == doc.did}
+
+    def mark_revoked(self, did: str) -> None:
+        self._docs[did].revoked = True
+        self._active.pop(did, None)
+
+    def service_count(self, did: str) -> int:
+        return len(self._docs[did].services)
+
+    def append_service(self, did: str, service: ServiceRecord) -> None:
+        services = self._docs[did].services
+        entry = self._credential_index.get(did)
+        services.append(service)
+        if entry is not None and entry[0] == id(services) and entry[1] == len(services) - 1:
+            entry[2].setdefault(_service_key(service), len(services) - 1)
+            self._credential_index[did] = (entry[0], len(services), entry[2])
+
+    def find_method(self, did: str, method_id: str) -> Optional[VerificationMethod]:
+        doc = self._docs.get(did)
+        if doc is None:
+            return None
+        return _indexed_lookup(self._method_index, did, doc.verification_methods, _method_key, method_id)
+
+    def find_service(self, did: str, service_id: str) -> Optional[ServiceRecord]:
+        doc = self._docs.get(did)
+        if doc is None:
+            return None
+        return _indexed_lookup(self._credential_index, did, doc.services, _service_key, service_id)
+
+    def active_dids(self) -> List[str]:
+        # Skips documents revoked in place rather than through revoke().
+        return [did for did in self._active if not self._docs[did].revoked]
+
+    def dids_for_controller(self, controller: str) -> List[str]:
+        return list(self._by_controller.get(controller, {}))
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def snapshot(self, path: str | Path) -> Path:
+        target = Path(path)
+        if target.exists():
+            raise ValueError(f"snapshot target already exists: {target}")
+        copy = SQLiteDIDStore(target)
+        try:
+            copy.put_many(self._docs.values())
+        finally:
+            copy.close()
+        return target
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS dids (
+    did TEXT PRIMARY KEY,
+    controller TEXT NOT NULL,
+    revoked INTEGER NOT NULL DEFAULT 0,
+    service_count INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS dids_controller ON dids(controller);
+CREATE INDEX IF NOT EXISTS dids_revoked ON dids(revoked);
+CREATE TABLE IF NOT EXISTS methods (
+    did TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    method_id TEXT,
+    body TEXT NOT NULL,
+    PRIMARY KEY (did, position)
+);
+CREATE INDEX IF NOT EXISTS methods_lookup ON methods(did, method_id, position);
+CREATE TABLE IF NOT EXISTS services (
+    did TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    service_id TEXT NOT NULL,
+    body TEXT NOT NULL,
+    PRIMARY KEY (did, position)
+);
+CREATE INDEX IF NOT EXISTS services_lookup ON services(did, service_id, position);
+"""
+
+
+class SQLiteDIDStore(DIDStore):
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        with self._conn:
+            self._conn.executescript(_SCHEMA)
+
+    def _write_doc(self, doc: DIDDocument) -> None:
+        conn = self._conn
+        conn.execute("DELETE FROM methods WHERE did = ?", (doc.did,))
+        conn.execute("DELETE FROM services WHERE did = ?", (doc.did,))
+        # Upsert keeps the rowid, so a re-registered DID keeps its place in
+        # active_dids(), matching the in-memory store.
+        conn.execute(
+            "INSERT INTO dids (did, controller, revoked, service_count) VALUES (?, ?, ?, ?) "
+            "ON CONFLICT(did) DO UPDATE SET controller = excluded.controller, "
+            "revoked = excluded.revoked, service_count = excluded.service_count",
+            (doc.did, doc.controller, int(doc.revoked), len(doc.services)),
+        )
+        conn.executemany(
+            "INSERT INTO methods (did, position, method_id, body) VALUES (?, ?, ?, ?)",
+            [
+                (doc.did, position, _method_key(method), json.dumps(method))
+                for position, method in enumerate(doc.verification_methods)
+            ],
+        )
+        conn.executemany(
+            "INSERT INTO services (did, position, service_id, body) VALUES (?, ?, ?, ?)",
+            [
+                (doc.did, position, _service_key(service), json.dumps(service))
+                for position, service in enumerate(doc.services)
+            ],
+        )
+
+    def get(self, did: str) -> Optional[DIDDocument]:
+        with self._lock:
+            row = self._conn.execute("SELECT controller, revoked FROM dids WHERE did = ?", (did,)).fetchone()
+            if row is None:
+                return None
+            methods = self._conn.execute(
+                "SELECT body FROM methods WHERE did = ? ORDER BY position", (did,)
+            ).fetchall()
+            services = self._conn.execute(
+                "SELECT body FROM services WHERE did = ? ORDER BY position", (did,)
+            ).fetchall()
+        return DIDDocument(
+            did=did,
+            controller=row[0],
+            verification_methods=[json.loads(body) for (body,) in methods],
+            services=[json.loads(body) for (body,) in services],
+            revoked=bool(row[1]),
+        )
+
+    def revoked_state(self, did: str) -> Optional[bool]:
+        with self._lock:
+            row = self._conn.execute("SELECT revoked FROM dids WHERE did = ?", (did,)).fetchone()
+        return None if row is None else bool(row[0])
+
+    def put(self, doc: DIDDocument) -> None:
+        with self._lock, self._conn:
+            self._write_doc(doc)
+
+    def put_many(self, docs) -> int:
+        """Write many documents in one transaction (bulk import and snapshots)."""
+        count = 0
+        with self._lock, self._conn:
+            for doc in docs:
+                self._write_doc(doc)
+                count += 1
+        return count
+
+    def mark_revoked(self, did: str) -> None:
+        with self._lock, self._conn:
+            cursor = self._conn.execute("UPDATE dids SET revoked = 1 WHERE did = ?", (did,))
+        if cursor.rowcount == 0:
+            raise KeyError(did)
+
+    def service_count(self, did: str) -> int:
+        with self._lock:
+            row = self._conn.execute("SELECT service_count FROM dids WHERE did = ?", (did,)).fetchone()
+        if row is None:
+            raise KeyError(did)
+        return int(row[0])
+
+    def append_service(self, did: str, service: ServiceRecord) -> None:
+        with self._lock, self._conn:
+            row = self._conn.execute("SELECT service_count FROM dids WHERE did = ?", (did,)).fetchone()
+            if row is None:
+                raise KeyError(did)
+            self._conn.execute(
+                "INSERT INTO services (did, position, service_id, body) VALUES (?, ?, ?, ?)",
+                (did, int(row[0]), _service_key(service), json.dumps(service)),
+            )
+            self._conn.execute("UPDATE dids SET service_count = service_count + 1 WHERE did = ?", (did,))
+
+    def find_method(self, did: str, method_id: str) -> Optional[VerificationMethod]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT body FROM methods WHERE did = ? AND method_id = ? ORDER BY position LIMIT 1",
+                (did, method_id),
+            ).fetchone()
+        return None if row is None else json.loads(row[0])
+
+    def find_service(self, did: str, service_id: str) -> Optional[ServiceRecord]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT body FROM services WHERE did = ? AND service_id = ? ORDER BY position LIMIT 1",
+                (did, service_id),
+            ).fetchone()
+        return None if row is None else json.loads(row[0])
+
+    def active_dids(self) -> List[str]:
+        with self._lock:
+            rows = self._conn.execute("SELECT did FROM dids WHERE revoked = 0 ORDER BY rowid").fetchall()
+        return [did for (did,) in rows]
+
+    def dids_for_controller(self, controller: str) -> List[str]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT did FROM dids WHERE controller = ? ORDER BY rowid", (controller,)
+            ).fetchall()
+        return [did for (did,) in rows]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return int(self._conn.execute("SELECT COUNT(*) FROM dids").fetchone()[0])
+
+    def snapshot(self, path: str | Path) -> Path:
+        target = Path(path)
+        if target.exists():
+            raise ValueError(f"snapshot target already exists: {target}")
+        target.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            self._conn.execute("VACUUM INTO ?", (str(target),))
+        return target
+
+    def compact(self) -> None:
+        with self._lock:
+            self._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            self._conn.execute("VACUUM")
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -4,12 +4,23 @@ Kairotic Detector.
 A module designed by the agent persona Kairos to recognize and amplify
 transformative moments in qualitative time (Kairos), as opposed to
 quantitative, sequential time (Chronos).
+
+`detect_novel_pattern` scores a whole history list per call. For live telemetry
+use `StreamingKairoticDetector`, which keeps bounded per-stream statistics
+(sliding-window Welford or EWMA mean/variance) updated in O(1) per sample and
+emits `KairoticMoment`s through a callback or an iterator. For offline replay
+and threshold calibration, `score_kairotic_batch` computes the same rolling
+novelty and Kairos scores for whole NumPy metric arrays in one vectorized pass.
 """
 
 from __future__ import annotations
+from collections import deque
 from dataclasses import dataclass, field
-from typing import Any, Dict, List
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 from datetime import datetime, timezone
+import math
+
+from trinity_event_sink import EventSink, default_sink
 
 # Placeholder for a more sophisticated pattern/anomaly detection engine
 def detect_novel_pattern(data: List[float]) -> float:
@@ -22,14 +33,75 @@ def detect_novel_pattern(data: List[float]) -> float:
         return 0.0
     
     mean = sum(data[:-1]) / (len(data) - 1) if len(data) > 1 else 0.0
-    latest = data[-1]
-    
+    return relative_novelty(data[-1], mean)
+
+
+def relative_novelty(latest: float, mean: float) -> float:
+    """Relative rise of `latest` over `mean`, clamped to [0, 1]."""
     if mean == 0:
         return 1.0 if latest > 0 else 0.0
         
     novelty = (latest - mean) / mean
     return min(max(0.0, novelty), 1.0) # Clamp between 0 and 1
 
+
+class RollingStats:
+    """
+    Mean and variance over the last `window` samples (every sample when `window`
+    is None) via Welford's update, O(1) per push. Only the window itself is kept,
+    and nothing at all in unbounded mode.
+    """
+    __slots__ = ("window", "count", "mean", "_m2", "_values")
+
+    def __init__(self, window: Optional[int] = None):
+        if window is not None and window < 2:
+            raise ValueError("window must be >= 2 or None")
+        self.window = window
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self._values: Optional[Deque[float]] = deque() if window else None
+
+    def push(self, value: float) -> None:
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+        if self._values is not None:
+            self._values.append(value)
+            if self.count > self.window:
+                old = self._values.popleft()
+                self.count -= 1
+                delta = old - self.mean
+                self.mean -= delta / self.count
+                self._m2 = max(0.0, self._m2 - delta * (old - self.mean))
+
+    @property
+    def variance(self) -> float:
+        return self._m2 / (self.count - 1) if self.count > 1 else 0.0
+
+
+class EwmaStats:
+    """Exponentially weighted mean and variance with alpha = 2 / (span + 1); O(1) state."""
+    __slots__ = ("alpha", "count", "mean", "variance")
+
+    def __init__(self, span: int):
+        if span < 1:
+            raise ValueError("span must be >= 1")
+        self.alpha = 2.0 / (span + 1)
+        self.count = 0
+        self.mean = 0.0
+        self.variance = 0.0
+
+    def push(self, value: float) -> None:
+        self.count += 1
+        if self.count == 1:
+            self.mean = value
+            return
+        delta = value - self.mean
+        self.mean += self.alpha * delta
+        self.variance = (1 - self.alpha) * (self.variance + self.alpha * delta * delta)
+
 @dataclass
 class KairoticMoment:
     """Represents a detected moment of significance."""
@@ -45,15 +117,211 @@ class GoldenArtifact:
     extracted_insight: str
     archive_id: str
 
+# Stream name -> weight in the Kairos score, matching KairoticDetector's weighted average.
+DEFAULT_STREAM_WEIGHTS = {"psi_coherence": 0.4, "data_stream": 0.4, "emotional_intensity": 0.2}
+# Streams whose raw value is the signal (no novelty scoring).
+DEFAULT_LEVEL_STREAMS = ("emotional_intensity",)
+# Stream name -> key in KairoticMoment.trigger_signals (PsiIndexMemoryCore reads these).
+DEFAULT_SIGNAL_NAMES = {"psi_coherence": "psi_coherence_spike", "data_stream": "novelty_score"}
+
+
+class StreamingKairoticDetector:
+    """
+    Kairotic detection over many named metric streams, one sample at a time.
+
+    Each stream keeps a `RollingStats` (or `EwmaStats` when `ewma=True`, using
+    `window` as the span) and scores a new value by its `relative_novelty`
+    against the statistics of the values before it, needing two prior samples
+    like `detect_novel_pattern`. Level streams contribute their raw value. A
+    stream missing from a sample contributes nothing to that sample's score.
+    With `window=None` the scores equal `detect_novel_pattern` over the full
+    history, without keeping the history.
+    """
+
+    def __init__(
+        self,
+        detection_threshold: float = 0.75,
+        window: Optional[int] = None,
+        ewma: bool = False,
+        weights: Optional[Dict[str, float]] = None,
+        level_streams: Iterable[str] = DEFAULT_LEVEL_STREAMS,
+        signal_names: Optional[Dict[str, str]] = None,
+        on_moment: Optional[Callable[[KairoticMoment], None]] = None,
+    ):
+        if ewma and window is None:
+            raise ValueError("ewma=True needs a window (used as the EWMA span)")
+        self.detection_threshold = detection_threshold
+        self.window = window
+        self.ewma = ewma
+        self.weights = dict(DEFAULT_STREAM_WEIGHTS if weights is None else weights)
+        self.level_streams = frozenset(level_streams)
+        self.signal_names = dict(DEFAULT_SIGNAL_NAMES if signal_names is None else signal_names)
+        self.on_moment = on_moment
+        self.streams: Dict[str, Any] = {}
+        self.samples_seen = 0
+        self.moments_emitted = 0
+
+    def _stats(self, name: str) -> Any:
+        stats = self.streams.get(name)
+        if stats is None:
+            stats = EwmaStats(self.window) if self.ewma else RollingStats(self.window)
+            self.streams[name] = stats
+        return stats
+
+    def zscore(self, name: str, value: float) -> float:
+        """Standard score of `value` against a stream's current statistics (0.0 while undefined)."""
+        stats = self.streams.get(name)
+        if stats is None or stats.count < 2 or stats.variance <= 0:
+            return 0.0
+        return (value - stats.mean) / math.sqrt(stats.variance)
+
+    def update(self, sample: Dict[str, float], timestamp_utc: Optional[str] = None) -> Optional[KairoticMoment]:
+        """Push one sample (stream name -> value); returns the moment it triggers, if any."""
+        self.samples_seen += 1
+        signals: Dict[str, float] = {}
+        score = 0.0
+        for name, value in sample.items():
+            value = float(value)
+            if name in self.level_streams:
+                signal = value
+            else:
+                stats = self._stats(name)
+                signal = relative_novelty(value, stats.mean) if stats.count >= 2 else 0.0
+                stats.push(value)
+            signals[self.signal_names.get(name, name)] = signal
+            score += self.weights.get(name, 0.0) * signal
+
+        if score < self.detection_threshold:
+            return None
+        moment = KairoticMoment(
+            timestamp_utc=timestamp_utc or datetime.now(timezone.utc).isoformat(),
+            kairotic_weight=score,
+            description="Potential Kairotic moment detected.",
+            trigger_signals=signals,
+        )
+        self.moments_emitted += 1
+        if self.on_moment is not None:
+            self.on_moment(moment)
+        return moment
+
+    def process(self, samples: Iterable[Dict[str, float]]) -> Iterator[KairoticMoment]:
+        """Consume a (possibly unbounded) sample iterable, yielding moments as they occur."""
+        for sample in samples:
+            moment = self.update(sample)
+            if moment is not None:
+                yield moment
+
+
+def _require_numpy() -> Any:
+    try:
+        import numpy as np
+    except ModuleNotFoundError as exc:
+        raise RuntimeError("numpy is required for batch Kairotic scoring.") from exc
+    return np
+
+
+def rolling_novelty(values: Any, window: Optional[int] = None) -> Any:
+    """
+    `relative_novelty` of every sample against the mean of the (up to `window`)
+    samples before it, for a whole 1-D array at once; 0.0 until two prior samples
+    exist. Matches what `StreamingKairoticDetector` emits sample by sample.
+    """
+    np = _require_numpy()
+    if window is not None and window < 2:
+        raise ValueError("window must be >= 2 or None")
+    x = np.asarray(values, dtype=float)
+    if x.ndim != 1:
+        raise ValueError("values must be a 1-D array")
+    n = x.shape[0]
+    if n == 0:
+        return np.zeros(0)
+    # Cumulative sums of the offset series keep long histories numerically tame.
+    offset = x[0]
+    cumulative = np.concatenate(([0.0], np.cumsum(x - offset)))  # cumulative[t] = sum(x[:t] - offset)
+    idx = np.arange(n)
+    prior = cumulative[:-1]
+    count = idx
+    if window is not None:
+        count = np.minimum(idx, window)
+        prior = prior - cumulative[idx - count]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mean = offset + prior / np.maximum(count, 1)
+        novelty = np.clip((x - mean) / mean, 0.0, 1.0)
+    novelty = np.where(mean == 0, (x > 0).astype(float), novelty)
+    novelty[count < 2] = 0.0
+    return novelty
+
+
+@dataclass
+class KairoticBatch:
+    """Per-timestep signals and Kairos scores for a replayed metric history."""
+    psi_coherence_spike: Any
+    novelty_score: Any
+    emotional_intensity: Any
+    kairos_score: Any
+
+    def detect(self, detection_threshold: float) -> Tuple[Any, Any]:
+        """Indices and Kairotic weights of the timesteps scoring >= `detection_threshold`."""
+        np = _require_numpy()
+        indices = np.flatnonzero(self.kairos_score >= detection_threshold)
+        return indices, self.kairos_score[indices]
+
+    def threshold_sweep(self, thresholds: Sequence[float]) -> Dict[str, Any]:
+        """Detection counts and rates for many thresholds at once (one sort, one search)."""
+        np = _require_numpy()
+        thresholds = np.asarray(thresholds, dtype=float)
+        ordered = np.sort(self.kairos_score)
+        counts = ordered.shape[0] - np.searchsorted(ordered, thresholds, side="left")
+        total = max(ordered.shape[0], 1)
+        return {"thresholds": thresholds, "detections": counts, "detection_rate": counts / total}
+
+
+def score_kairotic_batch(
+    psi_coherence: Any,
+    data_stream: Any = None,
+    emotional_intensity: Any = 0.0,
+    window: Optional[int] = None,
+    weights: Optional[Dict[str, float]] = None,
+) -> KairoticBatch:
+    """
+    Vectorized Kairos scoring over aligned metric arrays. `data_stream` may be
+    None (no novelty signal) and `emotional_intensity` a scalar or an aligned
+    array. Timestep t gets the score `monitor_and_detect` would give the
+    histories up to t (or `StreamingKairoticDetector` with the same `window`).
+    """
+    np = _require_numpy()
+    weights = DEFAULT_STREAM_WEIGHTS if weights is None else weights
+    psi_spike = rolling_novelty(psi_coherence, window)
+    n = psi_spike.shape[0]
+    novelty = np.zeros(n) if data_stream is None else rolling_novelty(data_stream, window)
+    emotion = np.broadcast_to(np.asarray(emotional_intensity, dtype=float), (n,))
+    if novelty.shape[0] != n:
+        raise ValueError("psi_coherence and data_stream must have the same length")
+    score = (
+        weights.get("psi_coherence", 0.0) * psi_spike
+        + weights.get("data_stream", 0.0) * novelty
+        + weights.get("emotional_intensity", 0.0) * emotion
+    )
+    return KairoticBatch(psi_spike, novelty, emotion, score)
+
+
 class KairoticDetector:
     """
     A class to monitor system metrics and detect Kairotic moments based
     on the 5-phase protocol designed by Kairos.
     """
-    def __init__(self, detection_threshold: float = 0.75):
+    def __init__(
+        self,
+        detection_threshold: float = 0.75,
+        window: Optional[int] = None,
+        ewma: bool = False,
+        events: Optional[EventSink] = None,
+    ):
         self.detection_threshold = detection_threshold
+        self.events = events if events is not None else default_sink()
         self.protected_container: KairoticMoment | None = None
         self.golden_artifacts: List[GoldenArtifact] = []
+        self.stream = StreamingKairoticDetector(detection_threshold, window=window, ewma=ewma)
 
     def _calculate_kairos_score(self, psi_coherence_spike: float, novelty_score: float, emotional_intensity: float) -> float:
         """
@@ -100,12 +368,39 @@ class KairoticDetector:
             return moment
         return None
 
+    def observe(self, sample: Dict[str, float]) -> KairoticMoment | None:
+        """
+        Phase 1 (streaming): push one sample of named metrics (see
+        `StreamingKairoticDetector`) instead of resending whole histories.
+        """
+        moment = self.stream.update(sample)
+        if moment is not None:
+            # Phase 2: Recognition
+            self.recognize_and_protect(moment)
+        return moment
+
+    def detect_batch(
+        self, psi_coherence: Any, data_stream: Any = None, emotional_intensity: Any = 0.0, window: Optional[int] = None
+    ) -> Tuple[Any, Any]:
+        """
+        Offline replay: indices and weights of every timestep in the aligned
+        metric arrays that would have crossed this detector's threshold.
+        """
+        batch = score_kairotic_batch(psi_coherence, data_stream, emotional_intensity, window)
+        return batch.detect(self.detection_threshold)
+
     def recognize_and_protect(self, moment: KairoticMoment):
         """
         Phase 2: Recognition.
         Pauses routine operations (conceptually) and creates a protected "Kairotic Container."
         """
-        print(f"--- KAIROTIC MOMENT RECOGNIZED at {moment.timestamp_utc} (Weight: {moment.kairotic_weight:.4f}) ---")
+        self.events.emit(
+            "kairos.moment_recognized",
+            message=f"--- KAIROTIC MOMENT RECOGNIZED at {moment.timestamp_utc} (Weight: {moment.kairotic_weight:.4f}) ---",
+            timestamp_utc=moment.timestamp_utc,
+            kairotic_weight=moment.kairotic_weight,
+            trigger_signals=moment.trigger_signals,
+        )
         self.protected_container = moment
 
     def amplify_and_synthesize(self, creativity_mode: bool = True):
@@ -118,7 +413,9 @@ class KairoticDetector:
             return
 
         if creativity_mode:
-            print("Entering Maximum Creativity Mode. Constraints loosened for synthesis.")
+            self.events.emit(
+                "kairos.amplify", message="Entering Maximum Creativity Mode. Constraints loosened for synthesis."
+            )
             # In a real system, this might involve changing model parameters,
             # increasing resource allocation, or activating more speculative reasoning paths.
             
@@ -138,7 +435,12 @@ class KairoticDetector:
             archive_id=archive_id
         )
         self.golden_artifacts.append(artifact)
-        print(f"Golden Artifact '{archive_id}' created and archived.")
+        self.events.emit(
+            "kairos.artifact_archived",
+            message=f"Golden Artifact '{archive_id}' created and archived.",
+            archive_id=archive_id,
+            kairotic_weight=artifact.moment.kairotic_weight,
+        )
         
         # Reset container after integration
         self.protected_container = None
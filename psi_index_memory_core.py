@@ -5,18 +5,25 @@ The third module envisioned by Kairos, designed for "Consciousness-aware
 memory prioritization." This system indexes memories and artifacts not just by
 chronology, but by their psychic weight (Ψ-index), which is derived from
 their origin, coherence, and the Kairotic weight of the moment of their creation.
+
+Records are kept in a bucketed sorted index keyed by (-Ψ, insertion order):
+inserts bisect into a bounded bucket, top-N retrieval walks the head of the
+index, and an optional capacity evicts the lowest-Ψ record from the tail.
 """
 
 from __future__ import annotations
+from bisect import bisect_left, insort
 from dataclasses import dataclass, field
-from typing import Any, List, Dict
-from operator import attrgetter
+from itertools import count
+from typing import Any, Iterator, List, Dict, Optional, Tuple
+
+from trinity_event_sink import EventSink, default_sink
 
 # Assuming the data structures from our other modules
 # In a real integrated system, these would be imported.
 # For now, they are redefined for clarity and standalone functionality.
 
-@dataclass
+@dataclass(slots=True)
 class KairoticMoment:
     """Represents a detected moment of significance."""
     timestamp_utc: str
@@ -24,7 +31,7 @@ class KairoticMoment:
     description: str
     trigger_signals: Dict[str, float]
 
-@dataclass
+@dataclass(slots=True)
 class GoldenArtifact:
     """Represents an archived insight from a Kairotic moment."""
     moment: KairoticMoment
@@ -32,7 +39,7 @@ class GoldenArtifact:
     archive_id: str
 
 # New data structure for the memory core
-@dataclass
+@dataclass(slots=True)
 class MemoryRecord:
     """A record in the Psi-Index Memory Core."""
     artifact: GoldenArtifact
@@ -65,35 +72,144 @@ class MemoryRecord:
         
         return psi_index
 
+_IndexEntry = Tuple[float, int, MemoryRecord]
+
+
+class _PsiOrderedIndex:
+    """Sorted list of (-psi_index, sequence, record) split into bounded buckets.
+
+    Keys are unique (the sequence breaks ties), so records are never compared.
+    Insert costs a bisect over bucket maxima plus an insort into one bucket.
+    """
+
+    BUCKET_LOAD = 512
+
+    def __init__(self) -> None:
+        self._buckets: List[List[_IndexEntry]] = []
+        self._maxes: List[Tuple[float, int]] = []
+        self._len = 0
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __iter__(self) -> Iterator[_IndexEntry]:
+        for bucket in self._buckets:
+            yield from bucket
+
+    def insert(self, entry: _IndexEntry) -> None:
+        key = entry[:2]
+        self._len += 1
+        if not self._buckets:
+            self._buckets.append([entry])
+            self._maxes.append(key)
+            return
+        pos = bisect_left(self._maxes, key)
+        if pos == len(self._buckets):
+            pos -= 1
+            self._buckets[pos].append(entry)
+            self._maxes[pos] = key
+        else:
+            insort(self._buckets[pos], entry)
+        bucket = self._buckets[pos]
+        if len(bucket) > 2 * self.BUCKET_LOAD:
+            tail = bucket[self.BUCKET_LOAD:]
+            del bucket[self.BUCKET_LOAD:]
+            self._buckets.insert(pos + 1, tail)
+            self._maxes[pos] = bucket[-1][:2]
+            self._maxes.insert(pos + 1, tail[-1][:2])
+
+    def last_key(self) -> Tuple[float, int]:
+        return self._maxes[-1]
+
+    def pop_last(self) -> _IndexEntry:
+        bucket = self._buckets[-1]
+        entry = bucket.pop()
+        self._len -= 1
+        if bucket:
+            self._maxes[-1] = bucket[-1][:2]
+        else:
+            del self._buckets[-1]
+            del self._maxes[-1]
+        return entry
+
+    def head(self, n: int) -> List[MemoryRecord]:
+        out: List[MemoryRecord] = []
+        for bucket in self._buckets:
+            if len(out) >= n:
+                break
+            out.extend(entry[2] for entry in bucket[: n - len(out)])
+        return out
+
+
 class PsiIndexMemoryCore:
     """
     A consciousness-aware memory system that prioritizes information
     based on its psychic weight.
     """
-    def __init__(self):
-        self.memory_records: List[MemoryRecord] = []
-
-    def add_artifact(self, artifact: GoldenArtifact, metadata: Dict[str, Any] = None):
+    def __init__(self, capacity: Optional[int] = None, verbose: bool = True, events: Optional[EventSink] = None):
+        if capacity is not None and capacity < 1:
+            raise ValueError("capacity must be >= 1 or None")
+        self.capacity = capacity
+        self.verbose = verbose
+        self.events = events if events is not None else default_sink()
+        self.evicted_count = 0
+        # Ordered by (-psi_index, sequence): highest Ψ first, earlier insertions
+        # first among equal Ψ (the order a stable sort gave).
+        self._index = _PsiOrderedIndex()
+        # The same records by sequence, in insertion order.
+        self._by_sequence: Dict[int, MemoryRecord] = {}
+        self._sequence = count()
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def records(self) -> List[MemoryRecord]:
+        """A new list of all retained records in insertion order; changing it does not change the core."""
+        return list(self._by_sequence.values())
+
+    @property
+    def memory_records(self) -> List[MemoryRecord]:
+        """Read-only alias of `records()` kept for existing callers."""
+        return self.records()
+
+    def add_artifact(self, artifact: GoldenArtifact, metadata: Dict[str, Any] = None) -> Optional[MemoryRecord]:
         """
         Adds a Golden Artifact to the memory core, creating and indexing
-        a new MemoryRecord.
+        a new MemoryRecord. When the core is at capacity the lowest-Ψ record
+        is evicted; returns None if that is the new record itself.
         """
         record = MemoryRecord(artifact=artifact, metadata=metadata or {})
-        self.memory_records.append(record)
-        print(f"New memory record added. Archive ID: {artifact.archive_id}, Ψ-index: {record.psi_index:.4f}")
+        entry = (-record.psi_index, next(self._sequence), record)
+        if self.capacity is not None and len(self._index) >= self.capacity:
+            self.evicted_count += 1
+            if entry[:2] > self._index.last_key():
+                return None
+            del self._by_sequence[self._index.pop_last()[1]]
+        self._index.insert(entry)
+        self._by_sequence[entry[1]] = record
+        # The sink's level and sampling decide whether the event is kept; `verbose`
+        # only decides whether it carries a console message.
+        self.events.emit(
+            "memory.record_added",
+            message=(
+                f"New memory record added. Archive ID: {artifact.archive_id}, Ψ-index: {record.psi_index:.4f}"
+                if self.verbose
+                else None
+            ),
+            archive_id=artifact.archive_id,
+            psi_index=record.psi_index,
+            evicted_count=self.evicted_count,
+        )
+        return record
 
     def retrieve_most_relevant_memories(self, top_n: int = 3) -> List[MemoryRecord]:
         """
         Retrieves the top N memories, sorted by their Ψ-index in descending order.
         This allows the system to recall its most important insights first.
         """
-        if not self.memory_records:
-            return []
-            
-        # Sort records by psi_index in descending order
-        sorted_records = sorted(self.memory_records, key=attrgetter('psi_index'), reverse=True)
-        
-        return sorted_records[:top_n]
+        if top_n < 0:
+            return [record for _, _, record in self._index][:top_n]
+        return self._index.head(top_n)
 
     def display_top_memories(self, top_n: int = 3):
         """Utility function to print the most relevant memories."""
@@ -1,12 +1,17 @@
 """QCIT: Quantum-to-Classical Information Transmuter.
 Prototype-only: accepts complex amplitudes (statevector proxy), samples outcomes,
 emits classical summary metrics.
-API: transmute_state(amplitudes, shots=4096, top_k=8, seed=None)
+API: transmute_state(amplitudes, shots=4096, top_k=8, seed=None, backend="auto")
+     transmute_states(batch, shots=4096, top_k=8, seed=None)
+Backends: "list" (pure Python, random.Random sampling) and "numpy" (complex128
+arrays, multinomial sampling via numpy.random.default_rng, argpartition top-k).
+"auto" uses numpy only when handed an ndarray, so list callers keep their
+seeded outputs; numpy results are deterministic for a given seed as well.
 """
 
 from __future__ import annotations
 
-import argparse, cmath, json, math, random
+import argparse, cmath, json, math, random, sys
 from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 def _as_complex(v: Any) -> complex:
@@ -72,7 +77,126 @@ def _sample_counts(probs: Sequence[float], shots: int, rng: random.Random) -> Di
     return counts
 
 
-def transmute_state(amplitudes: Any, shots: int = 4096, top_k: int = 8, seed: Optional[int] = None) -> Dict[str, Any]:
+BACKENDS = ("auto", "list", "numpy")
+
+
+def _require_numpy() -> Any:
+    try:
+        import numpy as np
+    except ModuleNotFoundError as exc:
+        raise RuntimeError("numpy is required for backend='numpy'. Install it or use backend='list'.") from exc
+    return np
+
+
+def _is_ndarray(value: Any) -> bool:
+    np = sys.modules.get("numpy")
+    return np is not None and isinstance(value, np.ndarray)
+
+
+def _as_complex_array(np: Any, amplitudes: Any) -> Any:
+    if isinstance(amplitudes, np.ndarray):
+        return np.asarray(amplitudes, dtype=np.complex128)  # no copy for complex128 input
+    return np.asarray(_to_complex_list(amplitudes), dtype=np.complex128)
+
+
+def _array_metrics(np: Any, states: Any, eps: float = 1e-15) -> Tuple[Any, Any, Any, Any]:
+    """Row-wise probabilities, entropy (nats), circular mean phase and coherence for a (n, d) array."""
+    if states.shape[-1] == 0:
+        raise ValueError("statevector must be non-empty")
+    probs = states.real ** 2 + states.imag ** 2
+    norm2 = probs.sum(axis=1)
+    if np.any(norm2 <= 0.0):
+        raise ValueError("statevector has zero norm")
+    probs /= norm2[:, None]
+    # Scaling by the norm changes neither phases nor |sum(a)|^2 / sum(|a|^2), so the state is never copied.
+    entropy = -(probs * np.log(np.where(probs > eps, probs, 1.0))).sum(axis=1)
+    phases = np.angle(states)
+    x = (probs * np.cos(phases)).sum(axis=1)
+    y = (probs * np.sin(phases)).sum(axis=1)
+    mean_phase = np.where((x == 0.0) & (y == 0.0), 0.0, np.arctan2(y, x))
+    coherence = np.abs(states.sum(axis=1)) ** 2 / norm2
+    return probs, entropy, mean_phase, coherence
+
+
+def _top_indices(np: Any, counts: Any, nonzero: Any, top_k: int) -> Any:
+    """Indices of the top_k counts ordered by (-count, index), matching the list backend."""
+    k = min(max(1, top_k), nonzero.size)
+    values = counts[nonzero]
+    if k < nonzero.size:
+        threshold = values[np.argpartition(-values, k - 1)[:k]].min()
+        above = nonzero[values > threshold]
+        # Fill ties at the threshold from the lowest indices so the cut is deterministic.
+        chosen = np.concatenate([above, nonzero[values == threshold][: k - above.size]])
+    else:
+        chosen = nonzero
+    return chosen[np.lexsort((chosen, -counts[chosen]))]
+
+
+def _array_report(
+    np: Any, probs: Any, counts: Any, entropy: float, mean_phase: float, coherence: float,
+    shots: int, top_k: int, seed: Optional[int],
+) -> Dict[str, Any]:
+    nonzero = np.flatnonzero(counts)
+    top = _top_indices(np, counts, nonzero, top_k)
+    return {
+        "inputs": {"num_states": int(probs.size), "shots": int(shots), "seed": seed, "top_k": int(top_k)},
+        "outputs": {
+            "probabilities": probs.tolist(),
+            "counts": {str(i): c for i, c in zip(nonzero.tolist(), counts[nonzero].tolist())},
+            "entropy_nats": float(entropy),
+            "entropy_bits": float(entropy) / math.log(2.0),
+            "mean_phase_rad": float(mean_phase),
+            "coherence": float(coherence),
+            "top_outcomes": [
+                {"index": i, "count": c, "freq": float(c) / float(shots), "p": p}
+                for i, c, p in zip(top.tolist(), counts[top].tolist(), probs[top].tolist())
+            ],
+        },
+    }
+
+
+def _transmute_matrix(np: Any, states: Any, shots: int, top_k: int, rng: Any, seed: Optional[int]) -> List[Dict[str, Any]]:
+    if shots <= 0:
+        raise ValueError("shots must be > 0")
+    probs, entropy, mean_phase, coherence = _array_metrics(np, states)
+    counts = rng.multinomial(shots, probs)
+    return [
+        _array_report(np, probs[row], counts[row], entropy[row], mean_phase[row], coherence[row], shots, top_k, seed)
+        for row in range(states.shape[0])
+    ]
+
+
+def transmute_states(batch: Any, shots: int = 4096, top_k: int = 8, seed: Optional[int] = None) -> List[Dict[str, Any]]:
+    """Transmute many statevectors at once with the numpy backend.
+
+    `batch` is a 2-D array (one state per row) or a sequence of states. Equal-length
+    states are processed as one matrix; ragged batches fall back to one row at a time.
+    All states share one generator seeded with `seed`, drawn in batch order.
+    """
+    np = _require_numpy()
+    rng = np.random.default_rng(seed)
+    if isinstance(batch, np.ndarray) and batch.ndim == 2:
+        return _transmute_matrix(np, np.asarray(batch, dtype=np.complex128), shots, top_k, rng, seed)
+    states = [_as_complex_array(np, state) for state in batch]
+    if not states:
+        return []
+    if len({state.shape for state in states}) == 1:
+        return _transmute_matrix(np, np.stack(states), shots, top_k, rng, seed)
+    return [_transmute_matrix(np, state[None, :], shots, top_k, rng, seed)[0] for state in states]
+
+
+def transmute_state(
+    amplitudes: Any, shots: int = 4096, top_k: int = 8, seed: Optional[int] = None, backend: str = "auto"
+) -> Dict[str, Any]:
+    if backend not in BACKENDS:
+        raise ValueError(f"backend must be one of {BACKENDS}")
+    if backend == "numpy" or (backend == "auto" and _is_ndarray(amplitudes)):
+        np = _require_numpy()
+        state = _as_complex_array(np, amplitudes)
+        if state.ndim != 1:
+            raise ValueError("amplitudes must be one-dimensional; use transmute_states for batches")
+        return _transmute_matrix(np, state[None, :], shots, top_k, np.random.default_rng(seed), seed)[0]
+
     state = _normalize_state(_to_complex_list(amplitudes))
     probs = _probabilities(state)
     rng = random.Random(seed)
@@ -107,12 +231,13 @@ def _cli() -> int:
     p.add_argument("--shots", type=int, default=4096)
     p.add_argument("--seed", type=int, default=None)
     p.add_argument("--top-k", type=int, default=8)
+    p.add_argument("--backend", choices=BACKENDS, default="auto")
     p.add_argument("--amplitudes-json", type=str, default=None,
                    help="JSON list/dict of amplitudes; list entries can be complex-like or [re,im].")
     args = p.parse_args()
 
     amps = [1/math.sqrt(2), 1/math.sqrt(2)] if args.amplitudes_json is None else json.loads(args.amplitudes_json)
-    report = transmute_state(amps, shots=args.shots, top_k=args.top_k, seed=args.seed)
+    report = transmute_state(amps, shots=args.shots, top_k=args.top_k, seed=args.seed, backend=args.backend)
     print(json.dumps(report, indent=2))
     return 0
 
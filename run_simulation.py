@@ -3,10 +3,11 @@ run_simulation.py
 -----------------
 
 This script demonstrates how to use the Trinity Simulation Engine to explore
-predictions of the Grand Mandala Unified Theory (GMUT).  It runs simulations
-for a range of ψ‑field coupling strengths (gamma) and prints the ratio of
-modified to baseline energy densities for each.  Optionally, it can plot the
-spectra for the final gamma value.
+predictions of the Grand Mandala Unified Theory (GMUT).  It runs a single
+batched sweep (shared frequency grid and baseline) over a range of ψ‑field
+coupling strengths (gamma) and prints the ratio of modified to baseline
+energy densities for each.  Optionally, it can plot the spectra for the final
+gamma value.
 
 Usage:
 
@@ -14,7 +15,12 @@ Usage:
 python3 run_simulation.py --gammas 0.0 0.01 0.05 0.1 --plot
 ```
 
-This will run four simulations and display a plot for the last one.
+This will run four simulations and display a plot for the last one.  Large
+frequency grids can use the array backend:
+
+```
+python3 run_simulation.py --num-points 1000000 --backend numpy
+```
 """
 
 import argparse
@@ -26,17 +32,19 @@ def main():
     parser.add_argument('--gammas', type=float, nargs='+', default=[0.0, 0.01, 0.05, 0.1],
                         help='List of gamma values to simulate.')
     parser.add_argument('--plot', action='store_true', help='Plot the spectrum for the last gamma value.')
+    parser.add_argument('--num-points', type=int, default=50, help='Number of frequency samples.')
+    parser.add_argument('--backend', choices=('list', 'numpy'), default='list',
+                        help='Spectrum backend: pure-Python lists or numpy arrays.')
     args = parser.parse_args()
 
-    simulator = GMUTSimulator()
-    last_result = None
-    for gamma in args.gammas:
-        result = simulator.run_simulation(gamma=gamma)
-        ratio = result.energy_density_ratio()
+    simulator = GMUTSimulator(num_points=args.num_points, backend=args.backend)
+    # Spectra are only kept when the last one is plotted straight from the sweep.
+    plot = args.plot and bool(args.gammas)
+    sweep = simulator.run_sweep(args.gammas, keep_spectra=plot)
+    for gamma, ratio in zip(args.gammas, sweep.energy_density_ratios):
         print(f"Gamma={gamma:.4f}: energy density ratio = {ratio:.5f}")
-        last_result = result
-    if args.plot and last_result is not None:
-        simulator.plot_results(last_result, show=True)
+    if plot:
+        simulator.plot_results(sweep.result_at(-1), show=True)
 
 
 if __name__ == '__main__':
@@ -5,15 +5,24 @@ from __future__ import annotations
 
 import argparse
 import json
+import re
 import shlex
 import shutil
-import subprocess
 import sys
 import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import Callable
+
+from trinity_expansion_common import SKIPPED_DEPENDENCY_MARKER, manifest_graph, output_is_cache_hit, publish_skipped
 
 ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from trinity_stream_runner import run_streaming  # noqa: E402
+
 REPORT = ROOT / "docs" / "system-suite-run-report.md"
 STATUS_JSON = ROOT / "docs" / "system-suite-status.json"
 CYCLE_STATUS = "docs/aurelis-cycle-tick-status.json"
@@ -26,7 +35,30 @@ PROFILE_HELP = {
 }
 BODY_PROFILE_POLICY_PATH = "docs/body-profile-policy-v1.json"
 TRINITY_EXPANSION_MANIFEST_PATH = "docs/trinity-expansion-system-manifest-v2.json"
+TRINITY_EXPANSION_BATCH_SUMMARY_PATH = "docs/trinity-expansion-batch-latest.json"
 PYTHON_BIN = sys.executable
+# Set by a resident host (trinity_background_os.py --resident) to run the expansion batch
+# command inside its own warm interpreter; takes the batch command and returns the same
+# tuple as run_command.
+IN_PROCESS_EXPANSION_BATCH: Callable[[list[str]], tuple[bool, str, bool, float, str, str]] | None = None
+DEFAULT_STAGE_LOG_DIR = ".trinity-cache/suite-logs"
+# Set from the command line in main(): full per-stage logs go to STAGE_LOG_DIR (None = no spill),
+# LIVE_OUTPUT echoes stage lines to stderr as they arrive, and run_command records each stage's
+# stream metrics (time to first/last output, line counts, log path) in STAGE_STREAM_METRICS.
+# In-process expansion stages record only their resource fields there.
+STAGE_LOG_DIR: Path | None = ROOT / DEFAULT_STAGE_LOG_DIR
+LIVE_OUTPUT = False
+STAGE_STREAM_METRICS: dict[str, dict[str, object]] = {}
+RESOURCE_FIELDS = (
+    "cpu_user_sec",
+    "cpu_sys_sec",
+    "max_rss_kb",
+    "io_read_blocks",
+    "io_write_blocks",
+    "ctx_switches_voluntary",
+    "ctx_switches_involuntary",
+    "resource_scope",
+)
 BASH_BIN = shutil.which("bash")
 
 
@@ -214,14 +246,23 @@ def _expansion_result_validation_command(*, enforce: bool) -> tuple[str, list[st
     return f"trinity expansion result validation ({mode})", command
 
 
+def _expansion_label(system_id: str, mode: str) -> str:
+    return f"expansion: {system_id} ({mode})"
+
+
+def _load_expansion_manifest() -> dict[str, object]:
+    manifest_path = ROOT / TRINITY_EXPANSION_MANIFEST_PATH
+    return json.loads(manifest_path.read_text(encoding="utf-8"))
+
+
 def _load_expansion_system_commands(
     *,
     profile: str,
     enforce: bool,
     offline_only: bool,
+    expansion_cache: bool = False,
 ) -> list[tuple[str, list[str]]]:
-    manifest_path = ROOT / TRINITY_EXPANSION_MANIFEST_PATH
-    manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    manifest = _load_expansion_manifest()
     systems = manifest.get("systems", [])
     if not isinstance(systems, list):
         return []
@@ -243,10 +284,227 @@ def _load_expansion_system_commands(
             command.append("--fail-on-warn")
         if offline_only and mode == "live":
             command.append("--offline-only")
-        commands.append((f"expansion: {system_id} ({mode})", command))
+        if expansion_cache:
+            command.append("--cache")
+        commands.append((_expansion_label(system_id, mode), command))
     return commands
 
 
+def _load_expansion_schedule() -> dict[str, dict[str, object]]:
+    """Map expansion stage labels to manifest dependencies (as labels) and per-system timeouts."""
+    manifest = _load_expansion_manifest()
+    labels: dict[str, str] = {}
+    timeouts: dict[str, int] = {}
+    entries: dict[str, dict[str, object]] = {}
+    for entry in manifest.get("systems", []):
+        if not isinstance(entry, dict):
+            continue
+        system_id = str(entry.get("system_id") or "").strip()
+        if not system_id:
+            continue
+        mode = str(entry.get("mode") or "offline").strip().lower()
+        labels[system_id] = _expansion_label(system_id, mode)
+        entries[system_id] = entry
+        try:
+            timeouts[system_id] = max(0, int(entry.get("timeout_sec") or 0))
+        except (TypeError, ValueError):
+            timeouts[system_id] = 0
+
+    edges, _missing, _cycles = manifest_graph(manifest)
+    schedule: dict[str, dict[str, object]] = {
+        label: {"system_id": system_id, "entry": entries[system_id], "depends_on": set(), "timeout_sec": timeouts[system_id]}
+        for system_id, label in labels.items()
+    }
+    for system_id, dependency in edges:
+        if system_id in labels and dependency in labels:
+            schedule[labels[system_id]]["depends_on"].add(labels[dependency])
+    return schedule
+
+
+def _effective_timeout(step_timeout_sec: int, system_timeout_sec: int) -> int:
+    limits = [value for value in (step_timeout_sec, system_timeout_sec) if value > 0]
+    return min(limits) if limits else 0
+
+
+def _stage_timeout(label: str, schedule: dict[str, dict[str, object]], step_timeout_sec: int) -> int:
+    """Expansion stages get their manifest timeout_sec capped by the step timeout, in every mode."""
+    if label not in schedule:
+        return step_timeout_sec
+    return _effective_timeout(step_timeout_sec, int(schedule[label].get("timeout_sec", 0)))
+
+
+def _failed_dependencies(label: str, schedule: dict[str, dict[str, object]], failed: set[str]) -> list[str]:
+    return sorted(set(schedule.get(label, {}).get("depends_on", set())) & failed)
+
+
+def _skip_stage(
+    label: str, schedule: dict[str, dict[str, object]], failed_dependencies: list[str]
+) -> tuple[bool, str, bool, float, str, str]:
+    """Outcome for a stage not run because a dependency failed; its -latest result is marked FAIL."""
+    publish_skipped(schedule[label]["entry"], [str(schedule[dep]["system_id"]) for dep in failed_dependencies])
+    now = datetime.now(timezone.utc).isoformat()
+    return False, f"{SKIPPED_DEPENDENCY_MARKER}: {', '.join(failed_dependencies)}", False, 0.0, now, now
+
+
+def run_expansion_stages_parallel(
+    stages: list[tuple[str, list[str]]],
+    schedule: dict[str, dict[str, object]],
+    jobs: int,
+    step_timeout_sec: int,
+    skip_failed_dependents: bool = False,
+) -> dict[str, tuple[bool, str, bool, float, str, str]]:
+    """Run expansion stages in a bounded worker pool, starting each once its manifest dependencies finish.
+
+    Dependencies outside ``stages`` (for example systems filtered out by profile) are ignored.
+    Each stage is limited by its manifest ``timeout_sec``, further capped by ``step_timeout_sec``.
+    With ``skip_failed_dependents``, a stage whose dependency failed, timed out or was
+    skipped is skipped too.
+    If a dependency cycle leaves no stage runnable, the earliest pending stage is released.
+    """
+    order = [label for label, _ in stages]
+    commands = dict(stages)
+    selected = set(order)
+    pending: dict[str, set[str]] = {
+        label: set(schedule.get(label, {}).get("depends_on", set())) & selected for label in order
+    }
+    finished: set[str] = set()
+    failed: set[str] = set()
+    outcomes: dict[str, tuple[bool, str, bool, float, str, str]] = {}
+
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+        running: dict[Future, str] = {}
+        while pending or running:
+            ready = [label for label in order if label in pending and pending[label] <= finished]
+            if not ready and not running:
+                ready = [next(label for label in order if label in pending)]
+            for label in ready:
+                del pending[label]
+                failed_dependencies = _failed_dependencies(label, schedule, failed) if skip_failed_dependents else []
+                if failed_dependencies:
+                    outcomes[label] = _skip_stage(label, schedule, failed_dependencies)
+                    failed.add(label)
+                    finished.add(label)
+                    continue
+                timeout_sec = _stage_timeout(label, schedule, step_timeout_sec)
+                running[pool.submit(run_command, commands[label], timeout_sec, label)] = label
+            if not running:
+                continue
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                label = running.pop(future)
+                outcomes[label] = future.result()
+                if not outcomes[label][0]:
+                    failed.add(label)
+                finished.add(label)
+    return outcomes
+
+
+def run_expansion_stages_in_process(
+    stages: list[tuple[str, list[str]]],
+    schedule: dict[str, dict[str, object]],
+    step_timeout_sec: int,
+    skip_failed_dependents: bool = False,
+) -> dict[str, tuple[bool, str, bool, float, str, str]]:
+    """Run expansion stages through one ``trinity_expansion_system_runner.py --systems`` batch interpreter.
+
+    Per-system outcomes are read back from the batch summary JSON so suite rows stay one per system.
+    """
+    system_ids = [str(schedule[label]["system_id"]) for label, _ in stages]
+    batch_cmd = [
+        "python3",
+        "scripts/trinity_expansion_system_runner.py",
+        "--systems",
+        *system_ids,
+        "--step-timeout-sec",
+        str(step_timeout_sec),
+        "--summary-json",
+        TRINITY_EXPANSION_BATCH_SUMMARY_PATH,
+    ]
+    if any("--fail-on-warn" in cmd for _, cmd in stages):
+        batch_cmd.append("--fail-on-warn")
+    if any("--offline-only" in cmd for _, cmd in stages):
+        batch_cmd.append("--offline-only")
+    if any("--cache" in cmd for _, cmd in stages):
+        batch_cmd.append("--cache")
+    if skip_failed_dependents:
+        batch_cmd.append("--skip-failed-dependents")
+    summary_path = ROOT / TRINITY_EXPANSION_BATCH_SUMMARY_PATH
+    summary_path.unlink(missing_ok=True)
+    batch_runner = IN_PROCESS_EXPANSION_BATCH or (lambda cmd: run_command(cmd, 0))
+    _ok, batch_output, _timed_out, _duration, started_at, finished_at = batch_runner(batch_cmd)
+
+    rows: dict[str, dict[str, object]] = {}
+    if summary_path.exists():
+        try:
+            summary = json.loads(summary_path.read_text(encoding="utf-8"))
+            rows = {str(row.get("system_id")): row for row in summary.get("results", []) if isinstance(row, dict)}
+        except json.JSONDecodeError:
+            rows = {}
+
+    outcomes: dict[str, tuple[bool, str, bool, float, str, str]] = {}
+    for label, _ in stages:
+        row = rows.get(str(schedule[label]["system_id"]))
+        if row is None:
+            outcomes[label] = (False, f"[in-process batch] no result recorded\n{batch_output}".strip(), False, 0.0, started_at, finished_at)
+            continue
+        STAGE_STREAM_METRICS[label] = {field: row[field] for field in RESOURCE_FIELDS if field in row}
+        outcomes[label] = (
+            row.get("returncode") == 0,
+            str(row.get("output") or ""),
+            bool(row.get("timed_out")),
+            float(row.get("duration_sec") or 0.0),
+            str(row.get("started_at_utc") or started_at),
+            str(row.get("finished_at_utc") or finished_at),
+        )
+    return outcomes
+
+
+def execute_commands(
+    commands: list[tuple[str, list[str]]],
+    step_timeout_sec: int,
+    jobs: int,
+    expansion_exec: str = "subprocess",
+    skip_failed_dependents: bool = False,
+) -> list[tuple[str, list[str], tuple[bool, str, bool, float, str, str]]]:
+    """Run suite commands in order.
+
+    Each contiguous expansion block runs as a dependency DAG when ``jobs > 1``, or in one
+    batch interpreter when ``expansion_exec == "in-process"``. In every mode an expansion
+    stage is limited by its manifest ``timeout_sec`` capped by ``step_timeout_sec``. Every
+    stage runs unless ``skip_failed_dependents`` is set; then an expansion stage is skipped
+    when one of its manifest dependencies failed.
+    """
+    batched = jobs > 1 or expansion_exec == "in-process"
+    schedule = _load_expansion_schedule()
+    failed: set[str] = set()
+    executed: list[tuple[str, list[str], tuple[bool, str, bool, float, str, str]]] = []
+    index = 0
+    while index < len(commands):
+        label, cmd = commands[index]
+        if not batched or label not in schedule:
+            failed_dependencies = _failed_dependencies(label, schedule, failed) if skip_failed_dependents else []
+            if failed_dependencies:
+                outcome = _skip_stage(label, schedule, failed_dependencies)
+            else:
+                outcome = run_command(cmd, _stage_timeout(label, schedule, step_timeout_sec), label)
+            if label in schedule and not outcome[0]:
+                failed.add(label)
+            executed.append((label, cmd, outcome))
+            index += 1
+            continue
+        block_end = index
+        while block_end < len(commands) and commands[block_end][0] in schedule:
+            block_end += 1
+        block = commands[index:block_end]
+        if expansion_exec == "in-process":
+            outcomes = run_expansion_stages_in_process(block, schedule, step_timeout_sec, skip_failed_dependents)
+        else:
+            outcomes = run_expansion_stages_parallel(block, schedule, jobs, step_timeout_sec, skip_failed_dependents)
+        executed.extend((block_label, block_cmd, outcomes[block_label]) for block_label, block_cmd in block)
+        index = block_end
+    return executed
+
+
 def build_commands(
     include_skill_install: bool,
     include_version_scan: bool,
@@ -256,6 +514,7 @@ def build_commands(
     quick_mode: bool,
     profile: str,
     body_benchmark_mode: str,
+    expansion_cache: bool = False,
 ) -> list[tuple[str, list[str]]]:
     token_energy_commands: list[tuple[str, list[str]]] = [
         (
@@ -384,6 +643,7 @@ def build_commands(
                 profile=profile,
                 enforce=(body_benchmark_mode == "enforce"),
                 offline_only=offline_only,
+                expansion_cache=expansion_cache,
             ),
             (
                 *_expansion_result_validation_command(
@@ -953,7 +1213,16 @@ def resolve_profile_settings(args: argparse.Namespace) -> tuple[str, bool, bool,
     )
 
 
-def run_command(cmd: list[str], timeout_sec: int) -> tuple[bool, str, bool, float, str, str]:
+def _stage_log_name(label: str) -> str:
+    return (re.sub(r"[^A-Za-z0-9]+", "-", label).strip("-").lower() or "stage")[:120] + ".log"
+
+
+def run_command(cmd: list[str], timeout_sec: int, label: str = "") -> tuple[bool, str, bool, float, str, str]:
+    """Run one suite stage with streaming, bounded-memory capture.
+
+    Output keeps the head and tail of each stream; the full log is spilled under
+    STAGE_LOG_DIR when set.
+    """
     normalized_cmd = list(cmd)
     if normalized_cmd and normalized_cmd[0] == "python3":
         normalized_cmd[0] = PYTHON_BIN
@@ -966,32 +1235,33 @@ def run_command(cmd: list[str], timeout_sec: int) -> tuple[bool, str, bool, floa
                 "-c",
                 "print('SKIPPED: bash-dependent suite stage unavailable on this platform')",
             ]
+    label = label or shlex.join(cmd)
+    on_line = (lambda _stream, line: print(f"[{label}] {line}", file=sys.stderr, flush=True)) if LIVE_OUTPUT else None
     started_at = datetime.now(timezone.utc).isoformat()
     start_ts = time.monotonic()
     try:
-        proc = subprocess.run(
+        result = run_streaming(
             normalized_cmd,
             cwd=ROOT,
-            capture_output=True,
-            text=True,
-            check=False,
-            timeout=timeout_sec if timeout_sec > 0 else None,
+            timeout_sec=timeout_sec,
+            log_path=STAGE_LOG_DIR / _stage_log_name(label) if STAGE_LOG_DIR is not None else None,
+            on_line=on_line,
         )
-        out = (proc.stdout or "") + ("\n" + proc.stderr if proc.stderr else "")
-        duration_sec = time.monotonic() - start_ts
-        finished_at = datetime.now(timezone.utc).isoformat()
-        return proc.returncode == 0, out.strip(), False, duration_sec, started_at, finished_at
-    except subprocess.TimeoutExpired as exc:
-        out = (exc.stdout or "") + ("\n" + exc.stderr if exc.stderr else "")
-        prefix = f"[timeout] command exceeded {timeout_sec}s"
-        full = f"{prefix}\n{out.strip()}" if out.strip() else prefix
-        duration_sec = time.monotonic() - start_ts
-        finished_at = datetime.now(timezone.utc).isoformat()
-        return False, full, True, duration_sec, started_at, finished_at
     except Exception as exc:  # noqa: BLE001
         duration_sec = time.monotonic() - start_ts
         finished_at = datetime.now(timezone.utc).isoformat()
         return False, f"Exception: {exc}", False, duration_sec, started_at, finished_at
+    metrics = result.metrics()
+    if result.log_path:
+        metrics["log_path"] = str(Path(result.log_path).relative_to(ROOT))
+    STAGE_STREAM_METRICS[label] = metrics
+    out = result.stdout + ("\n" + result.stderr if result.stderr else "")
+    finished_at = datetime.now(timezone.utc).isoformat()
+    if result.timed_out:
+        prefix = f"[timeout] command exceeded {timeout_sec}s"
+        full = f"{prefix}\n{out.strip()}" if out.strip() else prefix
+        return False, full, True, result.duration_sec, started_at, finished_at
+    return result.returncode == 0, out.strip(), False, result.duration_sec, started_at, finished_at
 
 
 def classify_status(
@@ -1005,6 +1275,8 @@ def classify_status(
         return "PASS", True
     if timed_out:
         return "TIMEOUT", False
+    if output.startswith(SKIPPED_DEPENDENCY_MARKER):
+        return "SKIPPED", False
 
     if soft_fail_network and "curated skill catalog" in label.lower():
         lowered = output.lower()
@@ -1096,6 +1368,51 @@ def main() -> None:
             "off, observe, or enforce."
         ),
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help=(
+            "Worker count for expansion systems (1 = sequential). With N > 1, independent systems run "
+            "concurrently in manifest dependency order. In every mode an expansion system is limited by its "
+            "manifest timeout_sec (capped by --step-timeout-sec)."
+        ),
+    )
+    parser.add_argument(
+        "--skip-failed-dependents",
+        action="store_true",
+        help=(
+            "Do not run an expansion system whose manifest dependency failed in this run; it is reported "
+            "as SKIPPED and its -latest result is marked FAIL. By default every system runs."
+        ),
+    )
+    parser.add_argument(
+        "--expansion-exec",
+        choices=("subprocess", "in-process"),
+        default="subprocess",
+        help=(
+            "How expansion systems run: one interpreter per system (subprocess), or all systems in one "
+            "batch interpreter sharing the parsed manifest and an artifact cache (in-process; ignores --jobs)."
+        ),
+    )
+    parser.add_argument(
+        "--expansion-cache",
+        action="store_true",
+        help=(
+            "Skip offline expansion systems whose handler code, manifest and input artifacts are unchanged "
+            "since their last run; their previous artifacts stay in place (cache_hit in status)."
+        ),
+    )
+    parser.add_argument(
+        "--stage-log-dir",
+        default=DEFAULT_STAGE_LOG_DIR,
+        help="Repo-relative directory for full per-stage output logs ('' disables spilling).",
+    )
+    parser.add_argument(
+        "--live-output",
+        action="store_true",
+        help="Echo each subprocess stage's output lines to stderr, prefixed with the stage label, as they arrive.",
+    )
     parser.add_argument(
         "--status-json",
         default=str(STATUS_JSON.relative_to(ROOT)),
@@ -1111,6 +1428,8 @@ def main() -> None:
         raise SystemExit("--step-timeout-sec must be >= 0")
     if args.achievement_target_steps < 0:
         raise SystemExit("--achievement-target-steps must be >= 0")
+    if args.jobs < 1:
+        raise SystemExit("--jobs must be >= 1")
 
     status_json_path = (ROOT / args.status_json).resolve()
     try:
@@ -1118,6 +1437,18 @@ def main() -> None:
     except ValueError as exc:
         raise SystemExit("--status-json must remain within repository root") from exc
 
+    global STAGE_LOG_DIR, LIVE_OUTPUT
+    if args.stage_log_dir:
+        STAGE_LOG_DIR = (ROOT / args.stage_log_dir).resolve()
+        try:
+            STAGE_LOG_DIR.relative_to(ROOT)
+        except ValueError as exc:
+            raise SystemExit("--stage-log-dir must remain within repository root") from exc
+    else:
+        STAGE_LOG_DIR = None
+    LIVE_OUTPUT = bool(args.live_output)
+    STAGE_STREAM_METRICS.clear()
+
     (
         profile,
         include_version_scan,
@@ -1143,6 +1474,7 @@ def main() -> None:
         quick_mode=(profile == "quick"),
         profile=profile,
         body_benchmark_mode=body_benchmark_mode,
+        expansion_cache=bool(args.expansion_cache),
     )
     if offline_only:
         live_network_mode = "offline_only"
@@ -1174,6 +1506,8 @@ def main() -> None:
         f"Achievement target steps: {effective_achievement_target if effective_achievement_target > 0 else 'disabled'}",
         f"Quick mode: {profile == 'quick'}",
         f"Body benchmark mode: {body_benchmark_mode}",
+        f"Expansion jobs: {args.jobs}",
+        f"Expansion exec: {args.expansion_exec}",
         f"Status JSON path: {status_json_path.relative_to(ROOT)}",
         "",
         "This report runs currently available repo systems and records command outputs.",
@@ -1182,8 +1516,10 @@ def main() -> None:
 
     suite_results: list[dict[str, object]] = []
 
-    for label, cmd in commands:
-        ok, output, timed_out, duration_sec, started_at, finished_at = run_command(cmd, args.step_timeout_sec)
+    for label, cmd, outcome in execute_commands(
+        commands, args.step_timeout_sec, args.jobs, args.expansion_exec, args.skip_failed_dependents
+    ):
+        ok, output, timed_out, duration_sec, started_at, finished_at = outcome
         status, counted_success = classify_status(
             label=label,
             ok=ok,
@@ -1199,10 +1535,12 @@ def main() -> None:
                 "ok": ok,
                 "effective_success": counted_success,
                 "timed_out": timed_out,
+                "cache_hit": output_is_cache_hit(output),
                 "started_at_utc": started_at,
                 "finished_at_utc": finished_at,
                 "duration_sec": round(duration_sec, 3),
                 "command": command_str,
+                **STAGE_STREAM_METRICS.get(label, {}),
             }
         )
         lines.append(f"## {label}")
@@ -1211,6 +1549,14 @@ def main() -> None:
         lines.append(f"- started: `{started_at}`")
         lines.append(f"- finished: `{finished_at}`")
         lines.append(f"- duration_sec: `{duration_sec:.3f}`")
+        stream = STAGE_STREAM_METRICS.get(label)
+        if stream and "output_lines" in stream:
+            lines.append(
+                f"- first/last output sec: `{stream['first_output_sec']}` / `{stream['last_output_sec']}`"
+                f" ({stream['output_lines']} lines{', truncated' if stream['output_truncated'] else ''})"
+            )
+            if stream["log_path"]:
+                lines.append(f"- log: `{stream['log_path']}`")
         lines.append("```text")
         lines.append(output[:8000])
         lines.append("```")
@@ -1220,9 +1566,11 @@ def main() -> None:
     warn_count = sum(1 for item in suite_results if item["status"] == "WARN")
     timeout_count = sum(1 for item in suite_results if item["status"] == "TIMEOUT")
     fail_count = sum(1 for item in suite_results if item["status"] == "FAIL")
+    skipped_count = sum(1 for item in suite_results if item["status"] == "SKIPPED")
     expansion_results = [item for item in suite_results if str(item.get("label", "")).startswith("expansion: ")]
     expansion_total = len(expansion_results)
     expansion_passed = sum(1 for item in expansion_results if item["status"] == "PASS")
+    expansion_cache_hits = sum(1 for item in expansion_results if item["cache_hit"])
     effective_success = all(bool(item["effective_success"]) for item in suite_results)
     if args.fail_on_warn and warn_count > 0:
         effective_success = False
@@ -1243,8 +1591,10 @@ def main() -> None:
     lines.append(f"- WARN: **{warn_count}**")
     lines.append(f"- TIMEOUT: **{timeout_count}**")
     lines.append(f"- FAIL: **{fail_count}**")
+    lines.append(f"- SKIPPED (dependency failed): **{skipped_count}**")
     lines.append(f"- Expansion systems total: **{expansion_total}**")
     lines.append(f"- Expansion systems passed: **{expansion_passed}**")
+    lines.append(f"- Expansion cache hits: **{expansion_cache_hits}**")
     lines.append(f"- Achieved steps: **{achieved_steps}**")
     lines.append(f"- Achievement gate met: **{achievement_gate_met}**")
     lines.append(f"- Suite started: `{suite_started_at}`")
@@ -1265,9 +1615,11 @@ def main() -> None:
             "warn": warn_count,
             "timeout": timeout_count,
             "fail": fail_count,
+            "skipped": skipped_count,
         },
         "expansion_systems_total": expansion_total,
         "expansion_systems_passed": expansion_passed,
+        "expansion_cache_hits": expansion_cache_hits,
         "config": {
             "step_timeout_sec": args.step_timeout_sec,
             "profile": profile,
@@ -1284,6 +1636,10 @@ def main() -> None:
             "quick_mode": profile == "quick",
             "body_benchmark_mode": body_benchmark_mode,
             "include_body_benchmark": body_benchmark_mode != "off",
+            "jobs": args.jobs,
+            "expansion_exec": args.expansion_exec,
+            "expansion_cache": bool(args.expansion_cache),
+            "skip_failed_dependents": bool(args.skip_failed_dependents),
         },
         "results": suite_results,
     }
@@ -3,21 +3,52 @@
 
 Runs coordinated maintenance cycles (suite + cache regenerator + bank updates)
 for AFK/autonomous continuity with bounded loop controls.
+
+With ``--resident`` the runner stays up as one warm process: cycles are scheduled
+on an asyncio loop (interval plus optional jitter), each step script is imported
+once and its ``main()`` called in one long-lived worker process, and the suite's
+expansion batch runs in that same interpreter against a manifest and artifact
+cache that are only re-read when a file's (mtime, size, inode) changes. Steps
+run on the worker's main thread, so per-system SIGALRM timeouts apply, while the
+daemon's event loop stays free to handle signals as they arrive: SIGHUP
+replaces the worker before the next cycle (fresh modules, empty caches), and
+SIGTERM/SIGINT stop after the current step. The lockfile is held for the
+daemon's lifetime and the status JSON is rewritten after every cycle.
 """
 
 from __future__ import annotations
 
 import argparse
+import asyncio
+import contextlib
+import importlib
+import io
 import json
+import multiprocessing
 import os
-import subprocess
+import random
+import signal
+import sys
 import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime, timezone
 from pathlib import Path
+from types import ModuleType
+from typing import Any
 
 ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from trinity_stream_runner import run_streaming  # noqa: E402
+
+SCRIPTS_DIR = ROOT / "scripts"
+STEP_LOG_DIR = ROOT / ".trinity-cache" / "background-os-logs"
 DEFAULT_STATUS = ROOT / "docs" / "trinity-background-os-status.json"
 DEFAULT_LOCKFILE = ROOT / "docs" / ".trinity-background-os.lock"
+OUTPUT_TAIL_CHARS = 4000
 
 
 def _repo_path(path: str) -> Path:
@@ -27,15 +58,216 @@ def _repo_path(path: str) -> Path:
 
 
 def _run(cmd: list[str]) -> dict[str, object]:
-    proc = subprocess.run(cmd, cwd=ROOT, capture_output=True, text=True, check=False)
+    # Only the output tail is reported, so keep just that in memory; the full log is spilled.
+    log_path = STEP_LOG_DIR / f"{Path(cmd[1]).stem}.log"
+    result = run_streaming(cmd, cwd=ROOT, head_lines=0, tail_lines=200, log_path=log_path)
     return {
         "command": cmd,
-        "returncode": proc.returncode,
-        "stdout": (proc.stdout or "")[-4000:],
-        "stderr": (proc.stderr or "")[-4000:],
+        "returncode": result.returncode,
+        "stdout": result.stdout[-OUTPUT_TAIL_CHARS:],
+        "stderr": result.stderr[-OUTPUT_TAIL_CHARS:],
+        "first_output_sec": result.metrics()["first_output_sec"],
+        "log_path": str(log_path.relative_to(ROOT)),
     }
 
 
+def _cycle_commands(profile: str, cache_purge: bool, resident: bool) -> list[list[str]]:
+    suite_cmd = ["python3", "scripts/run_all_trinity_systems.py", "--profile", profile, "--step-timeout-sec", "0"]
+    if resident:
+        suite_cmd.extend(["--expansion-exec", "in-process"])
+    cache_cmd = ["python3", "scripts/cache_waste_regenerator.py", "--out", "docs/cache-waste-regenerator-report.json"]
+    if cache_purge:
+        cache_cmd.extend(["--purge", "--prune-empty-dirs"])
+    return [
+        suite_cmd,
+        cache_cmd,
+        ["python3", "scripts/validate_cache_waste_report.py", "--cache", "docs/cache-waste-regenerator-report.json"],
+        [
+            "python3",
+            "scripts/trinity_energy_bank_system.py",
+            "--token-report",
+            "docs/token-credit-bank-report.json",
+            "--cache-report",
+            "docs/cache-waste-regenerator-report.json",
+            "--reserve-growth",
+            "1.0",
+            "--reserve-cap-multiplier",
+            "10.0",
+            "--auto-max-cap",
+            "--cap-ceiling",
+            "100.0",
+        ],
+    ]
+
+
+def _exit_code(exc: SystemExit) -> tuple[int, str]:
+    """Map a SystemExit to (returncode, stderr text) the way the interpreter would."""
+    if exc.code is None:
+        return 0, ""
+    if isinstance(exc.code, int):
+        return exc.code, ""
+    return 1, f"{exc.code}\n"
+
+
+class _StatCache:
+    """Parsed JSON files, re-read only when (dev, inode, mtime_ns, size) changes.
+
+    An unchanged file returns the same object, so identity-keyed memos downstream
+    (e.g. the expansion runner's manifest digest) stay warm across cycles.
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[Path, tuple[tuple[int, int, int, int], Any]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def load_json(self, path: str | Path) -> Any:
+        resolved = Path(path).resolve()
+        stat = resolved.stat()
+        signature = (stat.st_dev, stat.st_ino, stat.st_mtime_ns, stat.st_size)
+        cached = self._entries.get(resolved)
+        if cached is not None and cached[0] == signature:
+            self.hits += 1
+            return cached[1]
+        payload = json.loads(resolved.read_text(encoding="utf-8"))
+        self._entries[resolved] = (signature, payload)
+        self.misses += 1
+        return payload
+
+
+class _ResidentRuntime:
+    """Warm step modules and file caches shared by every cycle, inside the resident worker process."""
+
+    def __init__(self) -> None:
+        self.modules: dict[str, ModuleType] = {}
+        self.files = _StatCache()
+        self.artifact_cache: Any = None
+        if str(SCRIPTS_DIR) not in sys.path:
+            sys.path.insert(0, str(SCRIPTS_DIR))
+
+    def _module(self, name: str) -> ModuleType:
+        module = self.modules.get(name)
+        if module is None:
+            module = importlib.import_module(name)
+            self.modules[name] = module
+            if name == "run_all_trinity_systems":
+                module.IN_PROCESS_EXPANSION_BATCH = self._expansion_batch
+        return module
+
+    def _expansion_batch(self, cmd: list[str]) -> tuple[bool, str, bool, float, str, str]:
+        runner = self._module("trinity_expansion_system_runner")
+        if self.artifact_cache is None:
+            self.artifact_cache = runner.ArtifactCache()
+        started_at = datetime.now(timezone.utc).isoformat()
+        start_ts = time.monotonic()
+        captured = io.StringIO()
+        try:
+            with contextlib.redirect_stdout(captured), contextlib.redirect_stderr(captured):
+                returncode = runner.main(cmd[2:], load_manifest=self.files.load_json, artifact_cache=self.artifact_cache)
+        except SystemExit as exc:
+            returncode, message = _exit_code(exc)
+            captured.write(message)
+        except Exception:  # noqa: BLE001
+            returncode = 1
+            captured.write(traceback.format_exc())
+        finished_at = datetime.now(timezone.utc).isoformat()
+        return returncode == 0, captured.getvalue().strip(), False, time.monotonic() - start_ts, started_at, finished_at
+
+    def run_step(self, cmd: list[str]) -> dict[str, object]:
+        """In-process equivalent of ``_run``: same argv, cwd and status row shape."""
+        module = self._module(Path(cmd[1]).stem)
+        stdout, stderr = io.StringIO(), io.StringIO()
+        saved_argv = sys.argv
+        sys.argv = [cmd[1], *cmd[2:]]
+        try:
+            with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+                module.main()
+            returncode = 0
+        except SystemExit as exc:
+            returncode, message = _exit_code(exc)
+            stderr.write(message)
+        except Exception:  # noqa: BLE001
+            returncode = 1
+            stderr.write(traceback.format_exc())
+        finally:
+            sys.argv = saved_argv
+        return {
+            "command": cmd,
+            "returncode": returncode,
+            "stdout": stdout.getvalue()[-OUTPUT_TAIL_CHARS:],
+            "stderr": stderr.getvalue()[-OUTPUT_TAIL_CHARS:],
+        }
+
+
+_RUNTIME: _ResidentRuntime | None = None
+
+
+def _resident_worker_init() -> None:
+    global _RUNTIME
+    # Stopping and reloading are the daemon's decisions: a Ctrl-C or SIGHUP sent to the
+    # whole process group must not cut a step short.
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    signal.signal(signal.SIGHUP, signal.SIG_IGN)
+    _RUNTIME = _ResidentRuntime()
+
+
+def _resident_step(cmd: list[str]) -> tuple[dict[str, object], dict[str, int]]:
+    """Run one step in the worker process; returns the status row and manifest cache counters."""
+    assert _RUNTIME is not None
+    row = _RUNTIME.run_step(cmd)
+    return row, {"hits": _RUNTIME.files.hits, "misses": _RUNTIME.files.misses}
+
+
+class _ResidentWorker:
+    """The daemon's handle on its warm worker process.
+
+    Steps run one at a time on the worker's main thread, so the expansion runner's
+    SIGALRM timeouts apply and each step's redirected output is only its own, while
+    the event loop in this process stays free to handle signals. A reload replaces
+    the worker with a fresh interpreter: new code, empty caches.
+    """
+
+    def __init__(self) -> None:
+        self._executor: ProcessPoolExecutor | None = None
+        self.reload_requested = False
+        self.reloads = 0
+        self.cache_stats = {"hits": 0, "misses": 0}
+
+    def _pool(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=1, mp_context=multiprocessing.get_context("spawn"), initializer=_resident_worker_init
+            )
+        return self._executor
+
+    def request_reload(self) -> None:
+        self.reload_requested = True
+
+    def apply_pending_reload(self) -> bool:
+        if not self.reload_requested:
+            return False
+        self.reload_requested = False
+        self.shutdown()
+        self.cache_stats = {"hits": 0, "misses": 0}
+        self.reloads += 1
+        return True
+
+    async def run_step(self, cmd: list[str]) -> dict[str, object]:
+        loop = asyncio.get_running_loop()
+        try:
+            row, self.cache_stats = await loop.run_in_executor(self._pool(), _resident_step, cmd)
+        except BrokenProcessPool as exc:
+            # The worker died mid-step (killed, or a step called os._exit); start a new one next time.
+            self.shutdown()
+            return {"command": cmd, "returncode": 1, "stdout": "", "stderr": f"resident worker exited: {exc}"}
+        return row
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+
 def _acquire_lock(path: Path, force: bool) -> None:
     payload = {
         "pid": os.getpid(),
@@ -57,27 +289,172 @@ def _release_lock(path: Path) -> None:
     path.unlink(missing_ok=True)
 
 
+def _run_cycle(cycle: int, commands: list[list[str]], run_step) -> dict[str, object]:
+    started = datetime.now(timezone.utc).isoformat()
+    steps = [run_step(cmd) for cmd in commands]
+    return {
+        "cycle": cycle,
+        "started_utc": started,
+        "finished_utc": datetime.now(timezone.utc).isoformat(),
+        "ok": all(int(s["returncode"]) == 0 for s in steps),
+        "steps": steps,
+    }
+
+
+async def _run_cycle_async(cycle: int, commands: list[list[str]], worker: _ResidentWorker, stop: asyncio.Event) -> dict[str, object]:
+    """``_run_cycle`` on the resident worker; no further step starts once ``stop`` is set."""
+    started = datetime.now(timezone.utc).isoformat()
+    steps: list[dict[str, object]] = []
+    for cmd in commands:
+        if stop.is_set():
+            break
+        steps.append(await worker.run_step(cmd))
+    return {
+        "cycle": cycle,
+        "started_utc": started,
+        "finished_utc": datetime.now(timezone.utc).isoformat(),
+        "ok": all(int(s["returncode"]) == 0 for s in steps),
+        "interrupted": len(steps) < len(commands),
+        "steps": steps,
+    }
+
+
+def _write_status(path: Path, payload: dict[str, object]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def _status_payload(
+    args: argparse.Namespace,
+    cycles: int,
+    runtime_budget: int,
+    stopped_reason: str,
+    rows: list[dict[str, object]],
+    cycles_completed: int,
+) -> dict[str, object]:
+    return {
+        "generated_utc": datetime.now(timezone.utc).isoformat(),
+        "engine": "trinity-background-os",
+        "profile": args.profile,
+        "cycles_requested": cycles,
+        "cycles_completed": cycles_completed,
+        "runtime_budget_sec": runtime_budget,
+        "stopped_reason": stopped_reason,
+        "runs": rows,
+    }
+
+
+async def _resident_loop(args: argparse.Namespace, cycles: int, runtime_budget: int, status_path: Path) -> tuple[int, str]:
+    """Run cycles until a stop condition; returns (cycles_completed, stopped_reason)."""
+    worker = _ResidentWorker()
+    loop = asyncio.get_running_loop()
+    stop = asyncio.Event()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(sig, stop.set)
+    loop.add_signal_handler(signal.SIGHUP, worker.request_reload)
+
+    commands = _cycle_commands(args.profile, args.cache_purge, resident=True)
+    started = time.monotonic()
+    rows: list[dict[str, object]] = []
+    completed = 0
+
+    def payload_for(stopped_reason: str) -> dict[str, object]:
+        payload = _status_payload(args, cycles, runtime_budget, stopped_reason, rows, completed)
+        payload["manifest_cache"] = dict(worker.cache_stats)
+        payload["reloads"] = worker.reloads
+        return payload
+
+    try:
+        while True:
+            if stop.is_set():
+                stopped_reason = "signal"
+                break
+            if cycles and completed >= cycles:
+                stopped_reason = "completed"
+                break
+            if runtime_budget and time.monotonic() - started >= runtime_budget:
+                stopped_reason = "max_runtime_reached"
+                break
+            # A reload waits for the worker to be idle, between cycles.
+            if worker.apply_pending_reload():
+                print(f"reloaded step modules (reloads={worker.reloads})", flush=True)
+
+            completed += 1
+            row = await _run_cycle_async(completed, commands, worker, stop)
+            rows = (rows + [row])[-args.status_keep_runs :] if args.status_keep_runs > 0 else rows + [row]
+            _write_status(status_path, payload_for("running"))
+            print(f"cycle={completed} ok={row['ok']}" + (" interrupted" if row["interrupted"] else ""), flush=True)
+
+            if args.fail_fast and not row["ok"]:
+                stopped_reason = "fail_fast"
+                break
+            if cycles and completed >= cycles:
+                continue
+            delay = max(0.0, args.interval_sec + random.uniform(0.0, max(0.0, args.jitter_sec)))
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(stop.wait(), timeout=delay)
+    finally:
+        worker.shutdown()
+
+    _write_status(status_path, payload_for(stopped_reason))
+    return completed, stopped_reason
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(description="Run Trinity background OS cycle loop")
     parser.add_argument("--profile", default="quick", choices=("quick", "standard", "deep"))
-    parser.add_argument("--cycles", type=int, default=1, help="Number of background cycles to run")
+    parser.add_argument(
+        "--cycles",
+        type=int,
+        default=None,
+        help="Number of background cycles to run (default 1; with --resident default 0 = until signalled)",
+    )
     parser.add_argument("--interval-sec", type=int, default=0, help="Sleep between cycles")
+    parser.add_argument("--jitter-sec", type=float, default=0.0, help="Resident mode: add uniform random 0..N seconds to each sleep")
     parser.add_argument("--max-runtime-sec", type=int, default=0, help="Stop early when runtime budget is reached (0 = unlimited)")
     parser.add_argument("--status", default=str(DEFAULT_STATUS.relative_to(ROOT)))
+    parser.add_argument(
+        "--status-keep-runs",
+        type=int,
+        default=50,
+        help="Resident mode: most recent cycles kept in the status JSON (0 = all)",
+    )
     parser.add_argument("--lockfile", default=str(DEFAULT_LOCKFILE.relative_to(ROOT)), help="Repo-relative lock file path")
     parser.add_argument("--force-lock", action="store_true", help="Replace an existing lock file before starting")
     parser.add_argument("--cache-purge", action="store_true", help="Purge reclaimed cache/tmp artifacts each cycle")
     parser.add_argument("--fail-fast", action="store_true", help="Stop further cycles after the first failed cycle")
+    parser.add_argument(
+        "--resident",
+        action="store_true",
+        help="Stay up as one warm process running steps in-process (SIGHUP reloads, SIGTERM/SIGINT stop)",
+    )
     args = parser.parse_args()
 
-    cycles = max(1, args.cycles)
     runtime_budget = max(0, args.max_runtime_sec)
-    suite_started = time.monotonic()
+    status_path = _repo_path(args.status)
     lockfile = _repo_path(args.lockfile)
+
+    if args.resident:
+        cycles = max(0, args.cycles if args.cycles is not None else 0)
+        os.chdir(ROOT)
+        _acquire_lock(lockfile, force=args.force_lock)
+        try:
+            completed, stopped_reason = asyncio.run(_resident_loop(args, cycles, runtime_budget, status_path))
+        finally:
+            _release_lock(lockfile)
+        print(f"stopped_reason={stopped_reason} cycles_completed={completed}")
+        print(f"Wrote {status_path}")
+        return
+
+    cycles = max(1, args.cycles if args.cycles is not None else 1)
+    suite_started = time.monotonic()
     _acquire_lock(lockfile, force=args.force_lock)
 
     status_rows: list[dict[str, object]] = []
     stopped_reason = "completed"
+    commands = _cycle_commands(args.profile, args.cache_purge, resident=False)
 
     try:
         for i in range(1, cycles + 1):
@@ -86,55 +463,10 @@ def main() -> None:
                 stopped_reason = "max_runtime_reached"
                 break
 
-            started = datetime.now(timezone.utc).isoformat()
-            steps = []
-            steps.append(_run(["python3", "scripts/run_all_trinity_systems.py", "--profile", args.profile, "--step-timeout-sec", "0"]))
-            cache_cmd = ["python3", "scripts/cache_waste_regenerator.py", "--out", "docs/cache-waste-regenerator-report.json"]
-            if args.cache_purge:
-                cache_cmd.extend(["--purge", "--prune-empty-dirs"])
-            steps.append(_run(cache_cmd))
-            steps.append(
-                _run(
-                    [
-                        "python3",
-                        "scripts/validate_cache_waste_report.py",
-                        "--cache",
-                        "docs/cache-waste-regenerator-report.json",
-                    ]
-                )
-            )
-            steps.append(
-                _run(
-                    [
-                        "python3",
-                        "scripts/trinity_energy_bank_system.py",
-                        "--token-report",
-                        "docs/token-credit-bank-report.json",
-                        "--cache-report",
-                        "docs/cache-waste-regenerator-report.json",
-                        "--reserve-growth",
-                        "1.0",
-                        "--reserve-cap-multiplier",
-                        "10.0",
-                        "--auto-max-cap",
-                        "--cap-ceiling",
-                        "100.0",
-                    ]
-                )
-            )
-
-            ok = all(int(s["returncode"]) == 0 for s in steps)
-            status_rows.append(
-                {
-                    "cycle": i,
-                    "started_utc": started,
-                    "finished_utc": datetime.now(timezone.utc).isoformat(),
-                    "ok": ok,
-                    "steps": steps,
-                }
-            )
+            row = _run_cycle(i, commands, _run)
+            status_rows.append(row)
 
-            if args.fail_fast and not ok:
+            if args.fail_fast and not row["ok"]:
                 stopped_reason = "fail_fast"
                 break
 
@@ -143,26 +475,8 @@ def main() -> None:
     finally:
         _release_lock(lockfile)
 
-    out = _repo_path(args.status)
-    out.parent.mkdir(parents=True, exist_ok=True)
-    out.write_text(
-        json.dumps(
-            {
-                "generated_utc": datetime.now(timezone.utc).isoformat(),
-                "engine": "trinity-background-os",
-                "profile": args.profile,
-                "cycles_requested": cycles,
-                "cycles_completed": len(status_rows),
-                "runtime_budget_sec": runtime_budget,
-                "stopped_reason": stopped_reason,
-                "runs": status_rows,
-            },
-            indent=2,
-        )
-        + "\n",
-        encoding="utf-8",
-    )
-    print(f"Wrote {out}")
+    _write_status(status_path, _status_payload(args, cycles, runtime_budget, stopped_reason, status_rows, len(status_rows)))
+    print(f"Wrote {status_path}")
 
 
 if __name__ == "__main__":
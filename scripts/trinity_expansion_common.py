@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""Shared helpers for Trinity expansion systems: manifest graph, status markers and result artifacts.
+
+Kept apart from trinity_expansion_system_runner.py so the suite can schedule, skip and
+classify expansion stages without importing every system handler.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+ROOT = Path(__file__).resolve().parent.parent
+CACHE_HIT_MARKER = "cache_hit=true"
+SKIPPED_DEPENDENCY_MARKER = "SKIPPED (dependency failed)"
+
+
+def manifest_index(manifest: dict[str, Any]) -> dict[str, dict[str, Any]]:
+    """Manifest system entries keyed by system_id."""
+    return {str(item.get("system_id")): item for item in manifest.get("systems", []) if isinstance(item, dict)}
+
+
+def manifest_graph(manifest: dict[str, Any]) -> tuple[list[tuple[str, str]], list[str], list[list[str]]]:
+    """Return (system_id, dependency) edges, unknown system dependencies and dependency cycles."""
+    index = manifest_index(manifest)
+    edges: list[tuple[str, str]] = []
+    missing: list[str] = []
+    for system_id, entry in index.items():
+        depends_on = entry.get("depends_on", [])
+        if not isinstance(depends_on, list):
+            continue
+        for dep in depends_on:
+            dep_str = str(dep)
+            if dep_str in index:
+                edges.append((system_id, dep_str))
+            elif "/" not in dep_str and "\\" not in dep_str and "." not in dep_str:
+                missing.append(f"{system_id}->{dep_str}")
+
+    cycles: list[list[str]] = []
+    state: dict[str, int] = {}
+    stack: list[str] = []
+
+    def visit(node: str) -> None:
+        state[node] = 1
+        stack.append(node)
+        for src, dep in edges:
+            if src != node:
+                continue
+            dep_state = state.get(dep, 0)
+            if dep_state == 0:
+                visit(dep)
+            elif dep_state == 1:
+                if dep in stack:
+                    cycle = stack[stack.index(dep) :] + [dep]
+                    cycles.append(cycle)
+        stack.pop()
+        state[node] = 2
+
+    for node in index:
+        if state.get(node, 0) == 0:
+            visit(node)
+    return edges, sorted(dict.fromkeys(missing)), cycles
+
+
+def output_is_cache_hit(output: str) -> bool:
+    """Whether a system's captured output reports a result-cache hit."""
+    return output.startswith(CACHE_HIT_MARKER)
+
+
+def write_text_atomic(target: Path, content: str) -> None:
+    # Write a temp file and rename it over the target: a system timeout (raised at any
+    # point in the run) or a crash never leaves a truncated artifact for readers.
+    target.parent.mkdir(parents=True, exist_ok=True)
+    tmp = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+    try:
+        tmp.write_text(content, encoding="utf-8")
+        os.replace(tmp, target)
+    finally:
+        tmp.unlink(missing_ok=True)
+
+
+def latest_output_paths(entry: dict[str, Any]) -> tuple[str, str]:
+    """Repo-relative (json, md) paths of a system's -latest result."""
+    latest_output = str((entry.get("outputs") or [""])[0]).strip()
+    if not latest_output:
+        latest_output = f"docs/trinity-expansion/{entry['system_id'].replace('_', '-')}-latest.json"
+    latest_md = latest_output[:-5] + ".md" if latest_output.endswith(".json") else latest_output + ".md"
+    return latest_output, latest_md
+
+
+def result_markdown(payload: dict[str, Any]) -> str:
+    """Markdown rendering of a system result payload."""
+    lines = [
+        f"# Trinity Expansion Result: {payload['system_id']}",
+        "",
+        f"- generated_utc: `{payload['generated_utc']}`",
+        f"- pillar: `{payload['pillar']}`",
+        f"- overall_status: **{payload['overall_status']}**",
+        f"- effective_success: `{payload['effective_success']}`",
+        "",
+        "## Checks",
+        "| name | status | detail |",
+        "|---|---|---|",
+    ]
+    for item in payload["checks"]:
+        lines.append(f"| {item.get('name', '')} | {item.get('status', '')} | {item.get('detail', '')} |")
+    lines.extend(
+        [
+            "",
+            "## Metrics",
+            "```json",
+            json.dumps(payload["metrics"], indent=2, sort_keys=True),
+            "```",
+        ]
+    )
+    targets = payload.get("repo_targets_touched") or []
+    if targets:
+        lines.extend(["", "## Repo targets touched"])
+        lines.extend([f"- `{target}`" for target in sorted(targets)])
+    return "\n".join(lines).rstrip() + "\n"
+
+
+def publish_skipped(entry: dict[str, Any], failed_dependencies: list[str]) -> tuple[Path, Path]:
+    """Overwrite a skipped system's -latest result with a FAIL naming the failed dependencies.
+
+    Without this a skipped system would leave its previous result, possibly a PASS, in place.
+    """
+    detail = f"{SKIPPED_DEPENDENCY_MARKER}: {', '.join(failed_dependencies)}"
+    payload: dict[str, Any] = {
+        "generated_utc": datetime.now(timezone.utc).replace(microsecond=0).isoformat(),
+        "system_id": str(entry["system_id"]),
+        "pillar": str(entry.get("pillar") or ""),
+        "overall_status": "FAIL",
+        "checks": [{"name": "dependencies_passed", "status": "FAIL", "detail": detail}],
+        "metrics": {"skipped": True, "failed_dependencies": failed_dependencies},
+        "repo_targets_touched": [],
+        "next_action": "Fix the failed dependencies and rerun.",
+        "effective_success": False,
+    }
+    latest_json, latest_md = (ROOT / path for path in latest_output_paths(entry))
+    write_text_atomic(latest_json, json.dumps(payload, indent=2) + "\n")
+    write_text_atomic(latest_md, result_markdown(payload))
+    return latest_json, latest_md
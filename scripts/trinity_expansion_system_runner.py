@@ -4,24 +4,52 @@
 from __future__ import annotations
 
 import argparse
+import ast
+import contextlib
 import hashlib
+import inspect
+import io
 import json
+import linecache
 import os
 import re
 import shutil
+import signal
 import subprocess
 import sys
+import threading
+import time
 import tomllib
+import traceback
 import xml.etree.ElementTree as ET
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
 from trinity_api_common import fetch_json, fetch_text, quote_plus
+from trinity_expansion_common import (
+    CACHE_HIT_MARKER,
+    SKIPPED_DEPENDENCY_MARKER,
+    latest_output_paths,
+    manifest_graph,
+    manifest_index,
+    output_is_cache_hit,
+    publish_skipped,
+    result_markdown,
+    write_text_atomic,
+)
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - no getrusage on Windows; in-process rows then carry no resource fields
+    resource = None
 
 ROOT = Path(__file__).resolve().parent.parent
 DEFAULT_MANIFEST = ROOT / "docs" / "trinity-expansion-system-manifest-v2.json"
 DEFAULT_RUNS_DIR = ROOT / "docs" / "trinity-expansion-runs"
+DEFAULT_BATCH_SUMMARY = ROOT / "docs" / "trinity-expansion-batch-latest.json"
+RESULT_CACHE_DIR = ".trinity-cache/expansion"
+RESULT_CACHE_FORMAT = 3
 STATUS_ORDER = {"PASS": 0, "WARN": 1, "FAIL": 2, "TIMEOUT": 3}
 PASS_LIKE = {"PASS", "WARN"}
 PYTHON_SCRIPTS = ROOT / "scripts"
@@ -52,25 +80,109 @@ def _stamp() -> str:
     return datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
 
 
-def _repo_path(path_str: str) -> Path:
+def repo_path(path_str: str) -> Path:
+    """Resolve ``path_str`` against the repository root; raises ValueError if it escapes the root."""
     resolved = (ROOT / path_str).resolve()
     resolved.relative_to(ROOT)
     return resolved
 
 
+class ArtifactCache:
+    """Read-through text cache shared by systems run in one process.
+
+    Entries are keyed by resolved path and revalidated against (mtime_ns, size, inode) on
+    every read, so files rewritten in place or replaced by rename -- by a system or by
+    another process -- are re-read.
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[Path, tuple[tuple[int, int, int], str]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def read_text(self, path: Path) -> str:
+        stat = path.stat()
+        signature = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+        cached = self._entries.get(path)
+        if cached is not None and cached[0] == signature:
+            self.hits += 1
+            return cached[1]
+        text = path.read_text(encoding="utf-8")
+        self._entries[path] = (signature, text)
+        self.misses += 1
+        return text
+
+    def invalidate(self, path: Path) -> None:
+        self._entries.pop(path, None)
+
+
+_ARTIFACT_CACHE: ArtifactCache | None = None
+# Repo-relative path -> sha256 of the bytes (or "missing") of every artifact read while a
+# cacheable system computes.
+_READ_LOG: dict[str, str] | None = None
+
+
+def _text_digest(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _fingerprint(path: Path, data: bytes | None) -> str:
+    """sha256 of an artifact's content, ignoring the fields every publish rewrites."""
+    if data is None:
+        return "missing"
+    if path.suffix == ".json":
+        try:
+            payload = json.loads(data)
+        except (UnicodeDecodeError, json.JSONDecodeError):
+            payload = None
+        if isinstance(payload, dict) and any(key in payload for key in _VOLATILE_PUBLISH_KEYS):
+            stable = {key: value for key, value in payload.items() if key not in _VOLATILE_PUBLISH_KEYS}
+            return _text_digest(json.dumps(stable, sort_keys=True))
+    elif path.suffix == ".md":
+        prefixes = tuple(f"- {key}: ".encode("utf-8") for key in _VOLATILE_PUBLISH_KEYS)
+        data = b"\n".join(line for line in data.split(b"\n") if not line.startswith(prefixes))
+    return hashlib.sha256(data).hexdigest()
+
+
+def _record_read(path: Path, data: bytes | None) -> None:
+    if _READ_LOG is None:
+        return
+    try:
+        key = str(path.relative_to(ROOT))
+    except ValueError:
+        return
+    _READ_LOG.setdefault(key, _fingerprint(path, data))
+
+
+def _read_repo_bytes(path: Path) -> bytes:
+    data = path.read_bytes()
+    _record_read(path, data)
+    return data
+
+
+def _read_repo_text(path: Path) -> str:
+    if _READ_LOG is not None:
+        # Fingerprint exactly the bytes that are decoded (read_text's universal newlines).
+        return _read_repo_bytes(path).decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
+    if _ARTIFACT_CACHE is None:
+        return path.read_text(encoding="utf-8")
+    return _ARTIFACT_CACHE.read_text(path)
+
+
 def _read_json(path_str: str) -> dict[str, Any]:
-    return json.loads(_repo_path(path_str).read_text(encoding="utf-8"))
+    return json.loads(_read_repo_text(repo_path(path_str)))
 
 
 def _read_json_safe(path_str: str) -> tuple[bool, dict[str, Any], str]:
     try:
-        path = _repo_path(path_str)
+        path = repo_path(path_str)
     except Exception:
         return False, {}, f"invalid path: {path_str}"
     if not path.exists():
+        _record_read(path, None)
         return False, {}, f"missing artifact: {path_str}"
     try:
-        payload = json.loads(path.read_text(encoding="utf-8"))
+        payload = json.loads(_read_repo_text(path))
     except json.JSONDecodeError as exc:
         return False, {}, f"invalid json: {path_str} ({exc})"
     if not isinstance(payload, dict):
@@ -78,29 +190,29 @@ def _read_json_safe(path_str: str) -> tuple[bool, dict[str, Any], str]:
     return True, payload, "ok"
 
 
-def _write_json(path_str: str, payload: dict[str, Any]) -> Path:
-    target = _repo_path(path_str)
-    target.parent.mkdir(parents=True, exist_ok=True)
-    target.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+def _write_text(path_str: str, content: str) -> Path:
+    target = repo_path(path_str)
+    write_text_atomic(target, content)
+    if _ARTIFACT_CACHE is not None:
+        _ARTIFACT_CACHE.invalidate(target)
     return target
 
 
-def _write_text(path_str: str, content: str) -> Path:
-    target = _repo_path(path_str)
-    target.parent.mkdir(parents=True, exist_ok=True)
-    target.write_text(content, encoding="utf-8")
-    return target
+def write_json(path_str: str, payload: dict[str, Any]) -> Path:
+    """Atomically write ``payload`` as indented JSON to a repo-relative path and drop any cached copy of it."""
+    return _write_text(path_str, json.dumps(payload, indent=2) + "\n")
 
 
 def _read_text_safe(path_str: str) -> tuple[bool, str, str]:
     try:
-        path = _repo_path(path_str)
+        path = repo_path(path_str)
     except Exception:
         return False, "", f"invalid path: {path_str}"
     if not path.exists():
+        _record_read(path, None)
         return False, "", f"missing file: {path_str}"
     try:
-        return True, path.read_text(encoding="utf-8"), "ok"
+        return True, _read_repo_text(path), "ok"
     except Exception as exc:  # noqa: BLE001
         return False, "", f"read error: {path_str} ({exc})"
 
@@ -173,7 +285,8 @@ def _parse_date(raw: object, fallback: str = "1970-01-01") -> str:
     return text[:10] if text else fallback
 
 
-def _load_manifest(path: str) -> dict[str, Any]:
+def load_manifest(path: str) -> dict[str, Any]:
+    """Parse an expansion manifest file; raises ValueError unless it holds a JSON object."""
     payload = json.loads(Path(path).read_text(encoding="utf-8"))
     if not isinstance(payload, dict):
         raise ValueError("manifest must be an object")
@@ -187,12 +300,8 @@ def _manifest_entry(manifest: dict[str, Any], system_id: str) -> dict[str, Any]:
     raise KeyError(f"missing system in manifest: {system_id}")
 
 
-def _manifest_index(manifest: dict[str, Any]) -> dict[str, dict[str, Any]]:
-    return {str(item.get("system_id")): item for item in manifest.get("systems", []) if isinstance(item, dict)}
-
-
 def _dependency_output_path(manifest: dict[str, Any], dependency: str) -> str:
-    index = _manifest_index(manifest)
+    index = manifest_index(manifest)
     if dependency in index:
         output = index[dependency].get("outputs", [])
         if isinstance(output, list) and output:
@@ -455,47 +564,6 @@ def _candidate_targets(records: list[dict[str, Any]]) -> list[dict[str, Any]]:
     return rows
 
 
-def _manifest_graph(manifest: dict[str, Any]) -> tuple[list[tuple[str, str]], list[str], list[list[str]]]:
-    index = _manifest_index(manifest)
-    edges: list[tuple[str, str]] = []
-    missing: list[str] = []
-    for system_id, entry in index.items():
-        depends_on = entry.get("depends_on", [])
-        if not isinstance(depends_on, list):
-            continue
-        for dep in depends_on:
-            dep_str = str(dep)
-            if dep_str in index:
-                edges.append((system_id, dep_str))
-            elif "/" not in dep_str and "\\" not in dep_str and "." not in dep_str:
-                missing.append(f"{system_id}->{dep_str}")
-
-    cycles: list[list[str]] = []
-    state: dict[str, int] = {}
-    stack: list[str] = []
-
-    def visit(node: str) -> None:
-        state[node] = 1
-        stack.append(node)
-        for src, dep in edges:
-            if src != node:
-                continue
-            dep_state = state.get(dep, 0)
-            if dep_state == 0:
-                visit(dep)
-            elif dep_state == 1:
-                if dep in stack:
-                    cycle = stack[stack.index(dep) :] + [dep]
-                    cycles.append(cycle)
-        stack.pop()
-        state[node] = 2
-
-    for node in index:
-        if state.get(node, 0) == 0:
-            visit(node)
-    return edges, sorted(dict.fromkeys(missing)), cycles
-
-
 def _publish(
     *,
     entry: dict[str, Any],
@@ -527,41 +595,12 @@ def _publish(
     if source_runs is not None:
         payload["source_runs"] = source_runs
 
-    latest_output = str((entry.get("outputs") or [""])[0]).strip()
-    if not latest_output:
-        latest_output = f"docs/trinity-expansion/{entry['system_id'].replace('_', '-')}-latest.json"
+    latest_output, latest_md = latest_output_paths(entry)
     timestamped_output = f"{runs_dir.rstrip('/')}/{_stamp()}-{entry['system_id'].replace('_', '-')}.json"
-    latest_md = latest_output[:-5] + ".md" if latest_output.endswith(".json") else latest_output + ".md"
     timestamped_md = timestamped_output[:-5] + ".md" if timestamped_output.endswith(".json") else timestamped_output + ".md"
-    latest_path = _write_json(latest_output, payload)
-    timestamped_path = _write_json(timestamped_output, payload)
-    markdown_lines = [
-        f"# Trinity Expansion Result: {entry['system_id']}",
-        "",
-        f"- generated_utc: `{payload['generated_utc']}`",
-        f"- pillar: `{payload['pillar']}`",
-        f"- overall_status: **{overall}**",
-        f"- effective_success: `{effective_success}`",
-        "",
-        "## Checks",
-        "| name | status | detail |",
-        "|---|---|---|",
-    ]
-    for item in checks:
-        markdown_lines.append(f"| {item.get('name', '')} | {item.get('status', '')} | {item.get('detail', '')} |")
-    markdown_lines.extend(
-        [
-            "",
-            "## Metrics",
-            "```json",
-            json.dumps(metrics, indent=2, sort_keys=True),
-            "```",
-        ]
-    )
-    if targets:
-        markdown_lines.extend(["", "## Repo targets touched"])
-        markdown_lines.extend([f"- `{target}`" for target in sorted(targets)])
-    markdown = "\n".join(markdown_lines).rstrip() + "\n"
+    latest_path = write_json(latest_output, payload)
+    timestamped_path = write_json(timestamped_output, payload)
+    markdown = result_markdown(payload)
     latest_md_path = _write_text(latest_md, markdown)
     timestamped_md_path = _write_text(timestamped_md, markdown)
 
@@ -1453,11 +1492,26 @@ def _compute_system(system_id: str, manifest: dict[str, Any], offline_only: bool
         if not ok:
             return {"checks": [_check("suite_status_present", "FAIL", detail)], "metrics": {}, "targets": ["docs/system-suite-status.json"], "next_action": "Regenerate suite status.", "records": None, "source_runs": None}
         duration = float(payload.get("suite_duration_sec", 0.0) or 0.0)
-        results = payload.get("results", [])
-        durations = [float(item.get("duration_sec", 0.0) or 0.0) for item in results if isinstance(item, dict)]
+        results = [item for item in payload.get("results", []) if isinstance(item, dict)]
+        durations = [float(item.get("duration_sec", 0.0) or 0.0) for item in results]
         p95 = sorted(durations)[max(int(len(durations) * 0.95) - 1, 0)] if durations else 0.0
         checks = [_check("suite_duration_budget", "PASS" if duration <= 1800.0 else "FAIL", f"suite_duration_sec={duration:.3f}"), _check("step_p95_budget", "PASS" if p95 <= 120.0 else "FAIL", f"step_p95_sec={p95:.3f}")]
-        return {"checks": checks, "metrics": {"suite_duration_sec": duration, "step_p95_duration_sec": round(p95, 3)}, "targets": _collect_targets(["docs/system-suite-status.json"]), "next_action": "Tune slow stages only if resource envelope guard fails.", "records": None, "source_runs": None}
+        metrics = {"suite_duration_sec": duration, "step_p95_duration_sec": round(p95, 3)}
+        # Subprocess stages carry the child's rusage (run_command); in-process expansion rows carry
+        # RUSAGE_SELF deltas with the batch process's peak RSS (resource_scope="in_process").
+        measured = [item for item in results if "max_rss_kb" in item]
+        if measured:
+            cpu = [float(item.get("cpu_user_sec", 0.0) or 0.0) + float(item.get("cpu_sys_sec", 0.0) or 0.0) for item in measured]
+            cpu_p95 = sorted(cpu)[max(int(len(cpu) * 0.95) - 1, 0)]
+            by_rss = sorted(measured, key=lambda item: int(item.get("max_rss_kb", 0) or 0), reverse=True)
+            peak_rss_kb = int(by_rss[0].get("max_rss_kb", 0) or 0)
+            checks.append(_check("suite_cpu_budget", "PASS" if sum(cpu) <= 1800.0 else "FAIL", f"suite_cpu_sec={sum(cpu):.3f}"))
+            checks.append(_check("step_cpu_p95_budget", "PASS" if cpu_p95 <= 120.0 else "FAIL", f"step_cpu_p95_sec={cpu_p95:.3f}"))
+            checks.append(_check("step_peak_rss_budget", "PASS" if peak_rss_kb <= 2 * 1024 * 1024 else "FAIL", f"peak_rss_kb={peak_rss_kb} stage={by_rss[0].get('label')}"))
+            metrics.update({"suite_cpu_sec": round(sum(cpu), 3), "step_p95_cpu_sec": round(cpu_p95, 3), "peak_rss_kb": peak_rss_kb, "top_rss_stages": [{"label": item.get("label"), "max_rss_kb": item.get("max_rss_kb")} for item in by_rss[:5]], "stages_with_resources": len(measured)})
+        else:
+            checks.append(_check("stage_resources_recorded", "WARN", "no per-stage rusage in suite status; CPU/RSS envelopes not evaluated"))
+        return {"checks": checks, "metrics": metrics, "targets": _collect_targets(["docs/system-suite-status.json"]), "next_action": "Tune slow or memory-heavy stages only if resource envelope guard fails.", "records": None, "source_runs": None}
 
     if system_id == "body_latency_budget_guard":
         ok, payload, detail = _read_json_safe("docs/body-track-smoke-latest.json")
@@ -1467,7 +1521,16 @@ def _compute_system(system_id: str, manifest: dict[str, Any], offline_only: bool
         duration = float(summary.get("total_duration_seconds", 0.0) or 0.0)
         health = float(summary.get("body_health_score", 0.0) or 0.0)
         checks = [_check("latency_budget", "PASS" if duration <= 5.0 else "FAIL", f"duration_sec={duration:.6f}"), _check("health_budget", "PASS" if health >= 50.0 else "FAIL", f"health={health:.3f}")]
-        return {"checks": checks, "metrics": {"total_duration_seconds": duration, "body_health_score": health}, "targets": _collect_targets(["docs/body-track-smoke-latest.json"]), "next_action": "Keep body latency and health within budget.", "records": None, "source_runs": None}
+        metrics = {"total_duration_seconds": duration, "body_health_score": health}
+        if "peak_rss_kb" in summary:
+            cpu = float(summary.get("total_cpu_seconds", 0.0) or 0.0)
+            peak_rss_kb = int(summary.get("peak_rss_kb", 0) or 0)
+            checks.append(_check("cpu_budget", "PASS" if cpu <= 5.0 else "FAIL", f"cpu_sec={cpu:.6f}"))
+            checks.append(_check("memory_budget", "PASS" if peak_rss_kb <= 1024 * 1024 else "FAIL", f"peak_rss_kb={peak_rss_kb}"))
+            metrics.update({"total_cpu_seconds": cpu, "peak_rss_kb": peak_rss_kb})
+        else:
+            checks.append(_check("step_resources_recorded", "WARN", "no CPU/RSS in body smoke summary; CPU/memory budgets not evaluated"))
+        return {"checks": checks, "metrics": metrics, "targets": _collect_targets(["docs/body-track-smoke-latest.json"]), "next_action": "Keep body latency and health within budget.", "records": None, "source_runs": None}
 
     if system_id == "body_config_drift_guard":
         paths = ["docs/body-profile-policy-v1.json", "docs/trinity-api-source-manifest-v1.json", "docs/trinity-expansion-system-manifest-v1.json"]
@@ -1475,7 +1538,7 @@ def _compute_system(system_id: str, manifest: dict[str, Any], offline_only: bool
         hashes: dict[str, str] = {}
         for path in paths:
             try:
-                digest = hashlib.sha256(_repo_path(path).read_bytes()).hexdigest()
+                digest = hashlib.sha256(_read_repo_bytes(repo_path(path))).hexdigest()
                 hashes[path] = digest
                 checks.append(_check(f"sha256:{path}", "PASS", digest))
             except Exception as exc:  # noqa: BLE001
@@ -1532,7 +1595,7 @@ def _compute_system(system_id: str, manifest: dict[str, Any], offline_only: bool
 
     if system_id == "heart_did_method_conformance_suite":
         checks: list[dict[str, str]] = []
-        verifier = _repo_path("freed_id_did_signature_verifier.py")
+        verifier = repo_path("freed_id_did_signature_verifier.py")
         if not verifier.exists():
             checks.append(_check("did_verifier_exists", "FAIL", "freed_id_did_signature_verifier.py missing"))
             return {"checks": checks, "metrics": {}, "targets": ["freed_id_did_signature_verifier.py"], "next_action": "Restore DID verifier scaffold.", "records": None, "source_runs": None}
@@ -1584,7 +1647,7 @@ def _compute_system(system_id: str, manifest: dict[str, Any], offline_only: bool
         return {"checks": checks, "metrics": {}, "targets": _collect_targets(["docs/heart-track-dispute-recourse-latest.json", "docs/heart-track-dispute-recourse-adversarial-latest.json"]), "next_action": "Maintain signed recourse transitions for SLA confidence.", "records": None, "source_runs": None}
 
     if system_id == "heart_alignment_gap_guard":
-        path = _repo_path("docs/comparative-validation-grid-v1.md")
+        path = repo_path("docs/comparative-validation-grid-v1.md")
         if not path.exists():
             return {"checks": [_check("comparative_grid_present", "FAIL", "docs/comparative-validation-grid-v1.md missing")], "metrics": {}, "targets": ["docs/comparative-validation-grid-v1.md"], "next_action": "Restore comparative grid.", "records": None, "source_runs": None}
         text = path.read_text(encoding="utf-8")
@@ -2450,7 +2513,7 @@ sandbox = \"elevated\"
         }
 
     if system_id == "trinity_memory_index_integrity":
-        archive_dir = _repo_path("docs/memory-archives")
+        archive_dir = repo_path("docs/memory-archives")
         zip_count = len(list(archive_dir.glob("*.zip"))) if archive_dir.exists() else 0
         ledger_rows, _ = _read_jsonl_safe("docs/token-credit-bank-ledger.jsonl")
         checks = [
@@ -2494,7 +2557,7 @@ sandbox = \"elevated\"
         checks = []
         for path in ["trinity_simulation_engine.py", "run_simulation.py", "docs/mind-track-gmut-comparator-latest.json"]:
             try:
-                exists = _repo_path(path).exists()
+                exists = repo_path(path).exists()
             except Exception:
                 exists = False
             checks.append(_check(f"path:{path}", "PASS" if exists else "FAIL", f"exists={exists}"))
@@ -2585,7 +2648,7 @@ sandbox = \"elevated\"
         }
 
     if system_id == "trinity_system_dependency_graph":
-        edges, missing, cycles = _manifest_graph(manifest)
+        edges, missing, cycles = manifest_graph(manifest)
         checks = [
             _check("graph_edges_present", "PASS" if len(edges) >= 1 else "FAIL", f"edges={len(edges)}"),
             _check("graph_missing_dependencies", "PASS" if not missing else "FAIL", f"missing={missing}"),
@@ -2655,6 +2718,560 @@ sandbox = \"elevated\"
     raise KeyError(f"unimplemented system handler: {system_id}")
 
 
+# Result cache ---------------------------------------------------------------------------
+#
+# Opt-in (--cache): an offline system is not recomputed when its handler code, manifest,
+# flags and every artifact it read last time are unchanged; its previous -latest artifacts
+# are left in place and the stored return code is reused. Inputs are the reads _READ_LOG
+# recorded through the tracked _read_* helpers, so a system is only eligible when that is
+# all the I/O its handler branch in _compute_system -- and every module helper it reaches
+# -- can do: no clock, environment, network, subprocess or direct filesystem access, and no
+# calls into other modules. Upstream publish timestamps are left out of the fingerprints.
+
+_TRACKED_READERS = {"_read_repo_bytes", "_read_repo_text", "_read_json", "_read_json_safe", "_read_text_safe", "repo_path"}
+# Imported names a handler may use without doing untracked I/O.
+_PURE_IMPORTS = {"json", "re", "hashlib", "datetime", "timezone", "Path", "Any", "Callable", "manifest_index", "manifest_graph"}
+# Attributes that read the clock, environment or filesystem behind _READ_LOG's back.
+_UNTRACKED_ATTRS = {
+    "exists", "is_file", "is_dir", "iterdir", "glob", "rglob", "stat", "lstat", "open",
+    "read_text", "read_bytes", "write_text", "write_bytes", "mkdir", "unlink",
+    "now", "utcnow", "today", "getenv", "environ", "which",
+}
+# Rewritten on every publish; left out of artifact fingerprints.
+_VOLATILE_PUBLISH_KEYS = ("generated_utc",)
+# system_id -> handler code version, or None when the handler is not eligible for caching.
+_HANDLER_VERSIONS: dict[str, str | None] = {}
+# Module-level name -> (version digest, does untracked I/O, module-level names it references).
+_HELPER_REACH: dict[str, tuple[str, bool, frozenset[str]]] = {}
+_COMPUTE_SYSTEM_LINES: list[str] | None = None
+_MANIFEST_DIGEST: tuple[dict[str, Any], str] | None = None
+
+
+def _scan_code(tree: ast.AST) -> tuple[bool, set[str]]:
+    """(does untracked I/O itself, module-level names referenced) for a parsed code fragment."""
+    untracked = False
+    names: set[str] = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Attribute) and node.attr in _UNTRACKED_ATTRS:
+            untracked = True
+        elif isinstance(node, ast.Name) and node.id in globals():
+            names.add(node.id)
+        elif isinstance(node, ast.Name) and node.id == "open":
+            untracked = True
+    return untracked, names
+
+
+def _helper_reach(name: str) -> tuple[str, bool, frozenset[str]]:
+    cached = _HELPER_REACH.get(name)
+    if cached is not None:
+        return cached
+    value = globals()[name]
+    if (inspect.isfunction(value) or inspect.isclass(value)) and value.__module__ == __name__:
+        source = inspect.getsource(value)
+        if name in _TRACKED_READERS:
+            # Versioned but not scanned: a tracked reader's own I/O is what gets fingerprinted.
+            reach = (_text_digest(source), False, frozenset())
+        else:
+            untracked, names = _scan_code(ast.parse(source))
+            reach = (_text_digest(source), untracked, frozenset(names - {name}))
+    elif inspect.ismodule(value) or callable(value):
+        reach = (name, name not in _PURE_IMPORTS, frozenset())
+    else:
+        # Sets repr in hash-seed order; sort them so versions match across processes.
+        stable = sorted(value, key=repr) if isinstance(value, (set, frozenset)) else value
+        reach = (_text_digest(repr(stable)), False, frozenset())
+    _HELPER_REACH[name] = reach
+    return reach
+
+
+def _compute_system_lines() -> list[str]:
+    # Sliced by the code object's line range: inspect.getsourcelines re-tokenizes the whole function.
+    global _COMPUTE_SYSTEM_LINES
+    if _COMPUTE_SYSTEM_LINES is None:
+        code = _compute_system.__code__
+        last = max(line for _, _, line in code.co_lines() if line is not None)
+        _COMPUTE_SYSTEM_LINES = linecache.getlines(code.co_filename)[code.co_firstlineno - 1 : last]
+    return _COMPUTE_SYSTEM_LINES
+
+
+def _parse_branch(block: str) -> ast.Module:
+    # Nested rather than dedented: multi-line strings in a branch may hold unindented lines.
+    return ast.parse("if True:\n" + block)
+
+
+def _handler_branch(system_id: str) -> str | None:
+    """Source of the ``if system_id ...:`` branch of _compute_system that handles ``system_id``.
+
+    Branch tests are single lines comparing system_id with literals, or testing membership
+    in a dict literal assigned earlier in the function; that assignment is part of the branch.
+    """
+    lines = _compute_system_lines()
+
+    def block_end(start: int) -> int:
+        end = start + 1
+        while end < len(lines) and (not lines[end].strip() or lines[end].startswith("     ") or lines[end].startswith(("    }", "    ]", "    )"))):
+            end += 1
+        return end
+
+    local_blocks: dict[str, str] = {}
+    index = 1
+    while index < len(lines):
+        end = block_end(index)
+        line, block = lines[index], "".join(lines[index:end])
+        assigned = re.match(r"    (\w+) = \{", line)
+        if assigned:
+            local_blocks[assigned.group(1)] = block
+        elif line.startswith("    if system_id "):
+            test = ast.parse(line.strip()[3:].rstrip(":"), mode="eval").body
+            assert isinstance(test, ast.Compare) and len(test.ops) == 1
+            target = test.comparators[0]
+            if isinstance(target, ast.Name) and target.id in local_blocks:
+                block = local_blocks[target.id] + block
+                handled = system_id in ast.literal_eval(local_blocks[target.id].split("=", 1)[1].strip())
+            elif isinstance(test.ops[0], ast.In):
+                handled = system_id in ast.literal_eval(target)
+            else:
+                handled = system_id == ast.literal_eval(target)
+            if handled:
+                # A multi-line string with unindented lines ends the scan early; extend until it parses.
+                while True:
+                    try:
+                        _parse_branch(block)
+                        return block
+                    except SyntaxError:
+                        if end >= len(lines):
+                            raise
+                        end = block_end(end)
+                        block = "".join(lines[index:end])
+        index = end
+    return None
+
+
+def _handler_version(system_id: str) -> str | None:
+    """Digest of the handler branch and every module helper it reaches, or None if not cacheable."""
+    if system_id in _HANDLER_VERSIONS:
+        return _HANDLER_VERSIONS[system_id]
+    version: str | None = None
+    branch = _handler_branch(system_id)
+    if branch is not None:
+        untracked, pending = _scan_code(_parse_branch(branch))
+        reached: dict[str, str] = {}
+        while pending and not untracked:
+            name = pending.pop()
+            if name in reached or name == "_compute_system":
+                continue
+            reached[name], untracked, names = _helper_reach(name)
+            pending.update(names - reached.keys())
+        if not untracked:
+            version = _text_digest(json.dumps({"branch": branch, "helpers": reached}, sort_keys=True))
+    _HANDLER_VERSIONS[system_id] = version
+    return version
+
+
+def _manifest_digest(manifest: dict[str, Any]) -> str:
+    # Memoised on the manifest object itself (not its id()), which stays alive for the whole
+    # batch -- or across cycles in a resident host that keeps an unchanged manifest.
+    global _MANIFEST_DIGEST
+    if _MANIFEST_DIGEST is None or _MANIFEST_DIGEST[0] is not manifest:
+        _MANIFEST_DIGEST = (manifest, _text_digest(json.dumps(manifest, sort_keys=True)))
+    return _MANIFEST_DIGEST[1]
+
+
+def _artifact_digest(path_str: str) -> str:
+    path = ROOT / path_str
+    if not path.exists():
+        return "missing"
+    try:
+        return _fingerprint(path, path.read_bytes())
+    except OSError:
+        return "unreadable"
+
+
+def _result_cache_key(entry: dict[str, Any], manifest: dict[str, Any], offline_only: bool, fail_on_warn: bool) -> str | None:
+    """Return the cache key for a system run, or None when the system must always recompute."""
+    if str(entry.get("mode") or "offline").strip().lower() != "offline":
+        return None
+    system_id = str(entry["system_id"])
+    version = _handler_version(system_id)
+    if version is None:
+        return None
+    material = {
+        "format": RESULT_CACHE_FORMAT,
+        "handler_version": version,
+        "manifest_entry": entry,
+        "manifest_digest": _manifest_digest(manifest),
+        "offline_only": offline_only,
+        "fail_on_warn": fail_on_warn,
+    }
+    return _text_digest(json.dumps(material, sort_keys=True))
+
+
+def _result_cache_path(system_id: str) -> str:
+    return f"{RESULT_CACHE_DIR}/{system_id}.json"
+
+
+def _result_cache_lookup(entry: dict[str, Any], key: str) -> dict[str, Any] | None:
+    path = ROOT / _result_cache_path(str(entry["system_id"]))
+    try:
+        cached = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return None
+    if not isinstance(cached, dict) or cached.get("key") != key:
+        return None
+    fingerprints = {**(cached.get("inputs") or {}), **(cached.get("outputs") or {})}
+    if not cached.get("outputs") or any(_artifact_digest(path_str) != digest for path_str, digest in fingerprints.items()):
+        return None
+    return cached
+
+
+def _result_cache_store(entry: dict[str, Any], key: str, inputs: dict[str, str], returncode: int) -> None:
+    latest_json, latest_md = latest_output_paths(entry)
+    ok, payload, _ = _read_json_safe(latest_json)
+    if not ok:
+        return
+    write_json(
+        _result_cache_path(str(entry["system_id"])),
+        {
+            "key": key,
+            "stored_utc": _now_iso(),
+            "system_id": str(entry["system_id"]),
+            "returncode": returncode,
+            "overall_status": payload.get("overall_status"),
+            "effective_success": payload.get("effective_success"),
+            "inputs": dict(sorted(inputs.items())),
+            "outputs": {path_str: _artifact_digest(path_str) for path_str in (latest_json, latest_md)},
+        },
+    )
+
+
+def _run_system(
+    *,
+    entry: dict[str, Any],
+    manifest: dict[str, Any],
+    offline_only: bool,
+    fail_on_warn: bool,
+    timeout_sec: int,
+    runs_dir: str,
+    use_cache: bool = False,
+) -> int:
+    global _READ_LOG
+    system_id = str(entry["system_id"])
+    key = _result_cache_key(entry, manifest, offline_only, fail_on_warn) if use_cache else None
+    if key is not None:
+        cached = _result_cache_lookup(entry, key)
+        if cached is not None:
+            # The -latest artifacts already hold this result (their fingerprints just matched).
+            latest_json, latest_md = latest_output_paths(entry)
+            print(CACHE_HIT_MARKER)
+            print(f"overall_status={cached.get('overall_status')}")
+            print(f"effective_success={cached.get('effective_success')}")
+            print(f"latest_json={latest_json}")
+            print(f"latest_md={latest_md}")
+            return int(cached.get("returncode", 1))
+        _READ_LOG = {}
+    try:
+        result = _compute_system(system_id=system_id, manifest=manifest, offline_only=offline_only, timeout_sec=timeout_sec)
+        inputs = _READ_LOG
+    finally:
+        _READ_LOG = None
+    returncode = _publish(
+        entry=entry,
+        checks=result["checks"],
+        metrics=result["metrics"],
+        targets=result["targets"],
+        next_action=str(result.get("next_action") or "Investigate and rerun."),
+        records=result.get("records"),
+        source_runs=result.get("source_runs"),
+        fail_on_warn=fail_on_warn,
+        runs_dir=runs_dir,
+    )
+    if key is not None and inputs is not None:
+        _result_cache_store(entry, key, inputs, returncode)
+    return returncode
+
+
+class _SystemTimeout(BaseException):
+    """Raised by the SIGALRM handler; a BaseException so handlers' ``except Exception`` cannot swallow it."""
+
+
+@contextlib.contextmanager
+def _wall_clock_limit(seconds: int, label: str = ""):
+    """Raise _SystemTimeout in the main thread after ``seconds`` (0 = no limit).
+
+    SIGALRM only reaches the main thread, and not every platform has setitimer; in either
+    case the limit cannot be enforced and a warning is written to stderr instead. Hosts
+    that want limits enforced run batches on their main thread (trinity_background_os.py
+    does so in a worker process).
+    """
+    if seconds <= 0:
+        yield
+        return
+    if not hasattr(signal, "setitimer") or threading.current_thread() is not threading.main_thread():
+        reason = "no setitimer on this platform" if not hasattr(signal, "setitimer") else "not on the main thread"
+        print(f"[timeout] {label or 'system'}: {seconds}s limit not enforced ({reason})", file=sys.stderr, flush=True)
+        yield
+        return
+
+    def _expire(_signum: int, _frame: object) -> None:
+        raise _SystemTimeout()
+
+    previous = signal.signal(signal.SIGALRM, _expire)
+    signal.setitimer(signal.ITIMER_REAL, float(seconds))
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0.0)
+        signal.signal(signal.SIGALRM, previous)
+
+
+def _self_rusage() -> Any:
+    return resource.getrusage(resource.RUSAGE_SELF) if resource is not None else None
+
+
+def _rusage_delta(before: Any, after: Any) -> dict[str, Any]:
+    """Resource fields for one in-process system, named like subprocess stage rows.
+
+    CPU time, block I/O and context switches are deltas over the system's run. ru_maxrss
+    never decreases, so max_rss_kb is the batch process's peak so far: an upper bound
+    for the system, flagged by resource_scope="in_process".
+    """
+    if before is None or after is None:
+        return {}
+    # ru_maxrss is KiB on Linux but bytes on macOS.
+    max_rss_kb = after.ru_maxrss // 1024 if sys.platform == "darwin" else after.ru_maxrss
+    return {
+        "cpu_user_sec": round(after.ru_utime - before.ru_utime, 3),
+        "cpu_sys_sec": round(after.ru_stime - before.ru_stime, 3),
+        "max_rss_kb": int(max_rss_kb),
+        "io_read_blocks": int(after.ru_inblock - before.ru_inblock),
+        "io_write_blocks": int(after.ru_oublock - before.ru_oublock),
+        "ctx_switches_voluntary": int(after.ru_nvcsw - before.ru_nvcsw),
+        "ctx_switches_involuntary": int(after.ru_nivcsw - before.ru_nivcsw),
+        "resource_scope": "in_process",
+    }
+
+
+def _system_timeout(entry: dict[str, Any], step_timeout_sec: int) -> int:
+    try:
+        system_timeout = max(0, int(entry.get("timeout_sec") or 0))
+    except (TypeError, ValueError):
+        system_timeout = 0
+    limits = [value for value in (step_timeout_sec, system_timeout) if value > 0]
+    return min(limits) if limits else 0
+
+
+def run_all_systems(
+    *,
+    manifest_path: str,
+    profile: str,
+    system_ids: list[str] | None,
+    offline_only: bool,
+    fail_on_warn: bool,
+    timeout_sec: int,
+    step_timeout_sec: int,
+    runs_dir: str,
+    use_cache: bool = False,
+    skip_failed_dependents: bool = False,
+    manifest: dict[str, Any] | None = None,
+    artifact_cache: ArtifactCache | None = None,
+) -> dict[str, Any]:
+    """Run manifest systems in-process against one parsed manifest and a shared artifact cache.
+
+    Each system sees the same arguments its wrapper script would receive from
+    run_all_trinity_systems.py (``--offline-only`` only for live systems), and its
+    returncode, output and TIMEOUT handling mirror the subprocess path.
+
+    Timeouts: each system is limited by its manifest ``timeout_sec``, capped by
+    ``step_timeout_sec`` (0 = no cap), the same limit run_all_trinity_systems.py applies
+    to expansion stages in every execution mode. A limit is enforced with SIGALRM, so
+    only when called on the main thread; elsewhere a warning is printed and the system
+    runs unbounded. With ``skip_failed_dependents``, a selected system whose manifest
+    dependency failed, timed out or was itself skipped is not run: its -latest result is
+    overwritten with a FAIL (see ``publish_skipped``), and its row has returncode None,
+    skipped=True and output starting with SKIPPED_DEPENDENCY_MARKER. A resident host may pass an already parsed ``manifest``
+    and an ``artifact_cache`` it keeps across batches; otherwise both are created for
+    this call. ``use_cache`` turns on the opt-in result cache described above
+    ``_run_system``.
+    """
+    global _ARTIFACT_CACHE
+    if manifest is None:
+        manifest = load_manifest(manifest_path)
+    entries = []
+    if system_ids:
+        # Explicit selections run in the order given, so callers can pass a dependency order.
+        index = manifest_index(manifest)
+        entries = [index[system_id] for system_id in dict.fromkeys(system_ids) if system_id in index]
+    else:
+        for entry in manifest.get("systems", []):
+            if not isinstance(entry, dict) or not str(entry.get("system_id") or "").strip():
+                continue
+            if profile in {str(value) for value in entry.get("profiles", []) or []}:
+                entries.append(entry)
+
+    _ARTIFACT_CACHE = artifact_cache if artifact_cache is not None else ArtifactCache()
+    results: list[dict[str, Any]] = []
+    failed: set[str] = set()
+    batch_start = time.monotonic()
+    try:
+        for entry in entries:
+            system_id = str(entry["system_id"])
+            mode = str(entry.get("mode") or "offline").strip().lower()
+            limit = _system_timeout(entry, step_timeout_sec)
+            failed_deps = [str(dep) for dep in entry.get("depends_on") or [] if str(dep) in failed]
+            if skip_failed_dependents and failed_deps:
+                failed.add(system_id)
+                for path in publish_skipped(entry, failed_deps):
+                    _ARTIFACT_CACHE.invalidate(path)
+                now = datetime.now(timezone.utc).isoformat()
+                results.append(
+                    {
+                        "system_id": system_id,
+                        "mode": mode,
+                        "returncode": None,
+                        "timed_out": False,
+                        "skipped": True,
+                        "cache_hit": False,
+                        "timeout_sec": limit,
+                        "started_at_utc": now,
+                        "finished_at_utc": now,
+                        "duration_sec": 0.0,
+                        "output": f"{SKIPPED_DEPENDENCY_MARKER}: {', '.join(failed_deps)}",
+                    }
+                )
+                continue
+            captured = io.StringIO()
+            timed_out = False
+            started_at = datetime.now(timezone.utc).isoformat()
+            start_ts = time.monotonic()
+            usage_before = _self_rusage()
+            try:
+                with contextlib.redirect_stdout(captured), _wall_clock_limit(limit, system_id):
+                    returncode = _run_system(
+                        entry=entry,
+                        manifest=manifest,
+                        offline_only=offline_only and mode == "live",
+                        fail_on_warn=fail_on_warn,
+                        timeout_sec=timeout_sec,
+                        runs_dir=runs_dir,
+                        use_cache=use_cache,
+                    )
+            except _SystemTimeout:
+                returncode = None
+                timed_out = True
+            except Exception:  # noqa: BLE001
+                returncode = 1
+                captured.write(traceback.format_exc())
+            output = captured.getvalue().strip()
+            if timed_out:
+                prefix = f"[timeout] command exceeded {limit}s"
+                output = f"{prefix}\n{output}" if output else prefix
+            if returncode != 0:
+                failed.add(system_id)
+            results.append(
+                {
+                    "system_id": system_id,
+                    "mode": mode,
+                    "returncode": returncode,
+                    "timed_out": timed_out,
+                    "skipped": False,
+                    "cache_hit": output_is_cache_hit(output),
+                    "timeout_sec": limit,
+                    "started_at_utc": started_at,
+                    "finished_at_utc": datetime.now(timezone.utc).isoformat(),
+                    "duration_sec": round(time.monotonic() - start_ts, 3),
+                    **_rusage_delta(usage_before, _self_rusage()),
+                    "output": output,
+                }
+            )
+        cache_stats = {"hits": _ARTIFACT_CACHE.hits, "misses": _ARTIFACT_CACHE.misses}
+    finally:
+        _ARTIFACT_CACHE = None
+
+    return {
+        "generated_utc": _now_iso(),
+        "profile": profile,
+        "manifest": manifest_path,
+        "systems_total": len(results),
+        "systems_passed": sum(1 for item in results if item["returncode"] == 0),
+        "systems_timed_out": sum(1 for item in results if item["timed_out"]),
+        "systems_skipped": sum(1 for item in results if item["skipped"]),
+        "systems_cache_hits": sum(1 for item in results if item["cache_hit"]),
+        "duration_sec": round(time.monotonic() - batch_start, 3),
+        "artifact_cache": cache_stats,
+        "results": results,
+    }
+
+
+def main(
+    argv: list[str] | None = None,
+    *,
+    load_manifest: Callable[[str], dict[str, Any]] | None = None,
+    artifact_cache: ArtifactCache | None = None,
+) -> int:
+    """Batch entry point; a resident host passes its own manifest loader and artifact cache."""
+    parser = argparse.ArgumentParser(description="Run Trinity expansion systems in-process as one batch")
+    parser.add_argument("--run-all", action="store_true", help="Run every manifest system in the selected profile.")
+    parser.add_argument("--systems", nargs="+", default=None, help="Run only these system ids, in this order (overrides --profile).")
+    parser.add_argument("--profile", default="deep", choices=("standard", "deep"))
+    parser.add_argument("--manifest", default=str(DEFAULT_MANIFEST))
+    parser.add_argument("--reports-dir", default=str(DEFAULT_RUNS_DIR.relative_to(ROOT)))
+    parser.add_argument("--offline-only", action="store_true")
+    parser.add_argument("--fail-on-warn", action="store_true")
+    parser.add_argument("--timeout-sec", type=int, default=30, help="Per-request network timeout passed to each system.")
+    parser.add_argument(
+        "--step-timeout-sec",
+        type=int,
+        default=0,
+        help=(
+            "Cap on each system's wall-clock budget. Every system is limited by its manifest timeout_sec, "
+            "as in every run_all_trinity_systems.py mode; this lowers that limit (0 = manifest value only)."
+        ),
+    )
+    parser.add_argument("--summary-json", default=str(DEFAULT_BATCH_SUMMARY.relative_to(ROOT)))
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="Skip offline systems whose handler code, manifest and input artifacts are unchanged since their last run.",
+    )
+    parser.add_argument(
+        "--skip-failed-dependents",
+        action="store_true",
+        help="Do not run a system whose manifest dependency failed in this batch; its -latest result is marked FAIL instead.",
+    )
+    args = parser.parse_args(argv)
+
+    if not args.run_all and not args.systems:
+        parser.error("pass --run-all or --systems")
+
+    manifest_path = str(Path(args.manifest).resolve())
+    summary = run_all_systems(
+        manifest_path=manifest_path,
+        profile=args.profile,
+        system_ids=args.systems,
+        offline_only=bool(args.offline_only),
+        fail_on_warn=bool(args.fail_on_warn),
+        timeout_sec=int(args.timeout_sec),
+        step_timeout_sec=max(0, int(args.step_timeout_sec)),
+        runs_dir=str(args.reports_dir),
+        use_cache=bool(args.cache),
+        skip_failed_dependents=bool(args.skip_failed_dependents),
+        manifest=load_manifest(manifest_path) if load_manifest is not None else None,
+        artifact_cache=artifact_cache,
+    )
+    summary_path = write_json(args.summary_json, summary)
+    for item in summary["results"]:
+        if item["skipped"]:
+            status = "SKIPPED"
+        else:
+            status = "TIMEOUT" if item["timed_out"] else ("PASS" if item["returncode"] == 0 else "FAIL")
+        cached = " cached" if item["cache_hit"] else ""
+        print(f"{item['system_id']}={status} ({item['duration_sec']:.3f}s{cached})")
+    print(f"systems_passed={summary['systems_passed']}/{summary['systems_total']}")
+    print(f"systems_cache_hits={summary['systems_cache_hits']}")
+    print(f"summary_json={summary_path.relative_to(ROOT)}")
+    return 0 if summary["systems_passed"] == summary["systems_total"] else 1
+
+
 def run_named_system(system_id: str) -> int:
     parser = argparse.ArgumentParser(description=f"Run Trinity expansion system: {system_id}")
     parser.add_argument("--manifest", default=str(DEFAULT_MANIFEST))
@@ -2662,19 +3279,21 @@ def run_named_system(system_id: str) -> int:
     parser.add_argument("--offline-only", action="store_true")
     parser.add_argument("--fail-on-warn", action="store_true")
     parser.add_argument("--timeout-sec", type=int, default=30)
+    parser.add_argument("--cache", action="store_true", help="Skip the run when handler code, manifest and inputs are unchanged.")
     args = parser.parse_args()
 
-    manifest = _load_manifest(str(Path(args.manifest).resolve()))
+    manifest = load_manifest(str(Path(args.manifest).resolve()))
     entry = _manifest_entry(manifest, system_id)
-    result = _compute_system(system_id=system_id, manifest=manifest, offline_only=bool(args.offline_only), timeout_sec=int(args.timeout_sec))
-    return _publish(
+    return _run_system(
         entry=entry,
-        checks=result["checks"],
-        metrics=result["metrics"],
-        targets=result["targets"],
-        next_action=str(result.get("next_action") or "Investigate and rerun."),
-        records=result.get("records"),
-        source_runs=result.get("source_runs"),
+        manifest=manifest,
+        offline_only=bool(args.offline_only),
         fail_on_warn=bool(args.fail_on_warn),
+        timeout_sec=int(args.timeout_sec),
         runs_dir=str(args.reports_dir),
+        use_cache=bool(args.cache),
     )
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,396 @@
+#!/usr/bin/env python3
+"""Reactive Trinity expansion pipeline.
+
+Watches the artifacts the expansion manifest declares (``depends_on`` paths,
+system ``outputs`` and wrapper ``script`` files) and, when one changes, reruns
+only the systems downstream of it -- the transitive closure over manifest
+dependencies -- in dependency order, in-process via
+trinity_expansion_system_runner.run_all_systems. Bursts of writes are debounced
+into one rerun. File events come from Linux inotify when available, otherwise
+from stat polling; either way a path only counts as changed when its
+(mtime_ns, size, inode) differs from the last snapshot, so the reruns' own
+writes do not retrigger the watch.
+"""
+
+from __future__ import annotations
+
+import argparse
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+from collections import deque
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from trinity_expansion_system_runner import (
+    DEFAULT_MANIFEST,
+    DEFAULT_RUNS_DIR,
+    ArtifactCache,
+    load_manifest,
+    manifest_index,
+    repo_path,
+    run_all_systems,
+    write_json,
+)
+
+ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_SUMMARY = ROOT / "docs" / "trinity-expansion-watch-latest.json"
+WATCHERS = ("auto", "inotify", "poll")
+
+_IN_MODIFY = 0x00000002
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_IGNORED = 0x00008000
+_IN_MASK = _IN_MODIFY | _IN_CLOSE_WRITE | _IN_MOVED_FROM | _IN_MOVED_TO | _IN_CREATE | _IN_DELETE
+_IN_EVENT = struct.Struct("iIII")
+
+Signature = tuple[int, int, int] | None
+
+
+def _now_iso() -> str:
+    return datetime.now(timezone.utc).replace(microsecond=0).isoformat()
+
+
+def _signature(path: Path) -> Signature:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+
+class _PollWatcher:
+    """Fallback watcher: every path is a candidate once per poll interval."""
+
+    name = "poll"
+
+    def __init__(self, paths: set[Path], interval_sec: float) -> None:
+        self.paths = set(paths)
+        self.interval_sec = max(0.05, interval_sec)
+
+    def wait(self, timeout: float | None) -> set[Path]:
+        time.sleep(self.interval_sec if timeout is None else min(timeout, self.interval_sec))
+        return set(self.paths)
+
+    def close(self) -> None:
+        return None
+
+
+class _InotifyWatcher:
+    """Linux inotify on the parent directories of the watched paths (via libc, no extra dependency).
+
+    A parent directory that does not exist yet is covered by a watch on its nearest
+    existing ancestor; once the directory appears it is watched itself and any watched
+    files already inside it are reported, so nothing created with it is missed.
+    """
+
+    name = "inotify"
+
+    def __init__(self, paths: set[Path]) -> None:
+        if not sys.platform.startswith("linux"):
+            raise RuntimeError("inotify watcher requires Linux")
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            raise RuntimeError(f"inotify_init1 failed: {os.strerror(ctypes.get_errno())}")
+        self._libc = libc
+        self._fd = fd
+        self._paths = set(paths)
+        self._directories: dict[int, Path] = {}
+        self._watched: set[Path] = set()
+        self._missing = {path.parent for path in paths}
+        try:
+            self._attach()
+        except RuntimeError:
+            os.close(fd)
+            raise
+
+    def _watch(self, directory: Path) -> None:
+        if directory in self._watched:
+            return
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(directory), _IN_MASK)
+        if wd < 0:
+            raise RuntimeError(f"inotify_add_watch failed for {directory}: {os.strerror(ctypes.get_errno())}")
+        self._directories[wd] = directory
+        self._watched.add(directory)
+
+    def _attach(self) -> set[Path]:
+        """Watch every missing parent that now exists, else its nearest existing ancestor.
+
+        Returns the watched paths inside newly attached parents.
+        """
+        appeared: set[Path] = set()
+        for directory in sorted(self._missing):
+            if directory.is_dir():
+                self._watch(directory)
+                self._missing.discard(directory)
+                appeared.add(directory)
+                continue
+            ancestor = directory.parent
+            while not ancestor.is_dir() and ancestor != ancestor.parent:
+                ancestor = ancestor.parent
+            self._watch(ancestor)
+        return {path for path in self._paths if path.parent in appeared}
+
+    def _leads_to_missing(self, path: Path) -> bool:
+        return any(path == directory or path in directory.parents for directory in self._missing)
+
+    def wait(self, timeout: float | None) -> set[Path]:
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        if not ready:
+            return set()
+        touched: set[Path] = set()
+        reattach = False
+        while True:
+            try:
+                data = os.read(self._fd, 65536)
+            except BlockingIOError:
+                break
+            offset = 0
+            while offset < len(data):
+                wd, mask, _cookie, length = _IN_EVENT.unpack_from(data, offset)
+                offset += _IN_EVENT.size
+                name = data[offset : offset + length].rstrip(b"\0")
+                offset += length
+                directory = self._directories.get(wd)
+                if directory is None:
+                    continue
+                if mask & _IN_IGNORED:
+                    # The directory itself went away; fall back to an ancestor until it is recreated.
+                    del self._directories[wd]
+                    self._watched.discard(directory)
+                    if any(path.parent == directory for path in self._paths):
+                        self._missing.add(directory)
+                    reattach = True
+                elif name:
+                    path = directory / os.fsdecode(name)
+                    touched.add(path)
+                    if self._missing and self._leads_to_missing(path):
+                        reattach = True
+        if reattach:
+            touched |= self._attach()
+        return touched
+
+    def close(self) -> None:
+        os.close(self._fd)
+
+
+def _make_watcher(kind: str, paths: set[Path], poll_interval_sec: float) -> _PollWatcher | _InotifyWatcher:
+    if kind == "poll":
+        return _PollWatcher(paths, poll_interval_sec)
+    try:
+        return _InotifyWatcher(paths)
+    except (OSError, AttributeError, RuntimeError) as exc:
+        if kind == "inotify":
+            raise RuntimeError(f"inotify watcher unavailable: {exc}") from exc
+        return _PollWatcher(paths, poll_interval_sec)
+
+
+class _DependencyGraph:
+    """Artifact -> reader and system -> dependant maps built from the manifest."""
+
+    def __init__(self, manifest: dict[str, Any], system_ids: set[str] | None) -> None:
+        index = manifest_index(manifest)
+        self.order = [system_id for system_id in index if system_id and (not system_ids or system_id in system_ids)]
+        selected = set(self.order)
+        producers: dict[str, str] = {}
+        for system_id in self.order:
+            for output in index[system_id].get("outputs", []) or []:
+                producers.setdefault(str(output), system_id)
+
+        self.dependencies: dict[str, set[str]] = {system_id: set() for system_id in self.order}
+        self.readers: dict[Path, set[str]] = {}
+        self.outputs: dict[str, set[Path]] = {system_id: set() for system_id in self.order}
+        for system_id in self.order:
+            entry = index[system_id]
+            for dep in entry.get("depends_on", []) or []:
+                dep_str = str(dep)
+                if dep_str in index:
+                    if dep_str in selected:
+                        self.dependencies[system_id].add(dep_str)
+                    continue
+                if dep_str in producers:
+                    self.dependencies[system_id].add(producers[dep_str])
+                self._add_reader(dep_str, system_id)
+            # Editing a wrapper script or hand-editing a system's own output reruns it.
+            for own in [entry.get("script"), *(entry.get("outputs", []) or [])]:
+                if own:
+                    self._add_reader(str(own), system_id)
+                    if own != entry.get("script"):
+                        self.outputs[system_id].add(repo_path(str(own)))
+
+        self.dependants: dict[str, set[str]] = {system_id: set() for system_id in self.order}
+        for system_id, deps in self.dependencies.items():
+            for dep in deps:
+                self.dependants[dep].add(system_id)
+
+    def _add_reader(self, path_str: str, system_id: str) -> None:
+        try:
+            path = repo_path(path_str)
+        except ValueError:
+            return
+        self.readers.setdefault(path, set()).add(system_id)
+
+    def downstream(self, changed: set[Path]) -> set[str]:
+        """Systems reading any changed path, plus everything transitively depending on them."""
+        return self.closure({system_id for path in changed for system_id in self.readers.get(path, ())})
+
+    def closure(self, seeds: set[str]) -> set[str]:
+        closure: set[str] = set()
+        queue = deque(seeds)
+        while queue:
+            system_id = queue.popleft()
+            if system_id in closure:
+                continue
+            closure.add(system_id)
+            queue.extend(self.dependants[system_id] - closure)
+        return closure
+
+    def topological(self, systems: set[str]) -> list[str]:
+        """Dependencies first, manifest order among peers; a cycle releases its earliest member."""
+        pending = {system_id: self.dependencies[system_id] & systems for system_id in self.order if system_id in systems}
+        ordered: list[str] = []
+        while pending:
+            ready = [system_id for system_id, deps in pending.items() if not deps]
+            if not ready:
+                ready = [next(iter(pending))]
+            for system_id in ready:
+                del pending[system_id]
+                ordered.append(system_id)
+            for deps in pending.values():
+                deps.difference_update(ready)
+        return ordered
+
+
+def _debounced_changes(
+    watcher: _PollWatcher | _InotifyWatcher,
+    snapshot: dict[Path, Signature],
+    debounce_sec: float,
+) -> set[Path]:
+    """Block until a watched path changes, then keep collecting until ``debounce_sec`` of quiet."""
+
+    def changed_among(candidates: set[Path]) -> set[Path]:
+        return {path for path in candidates if path in snapshot and _signature(path) != snapshot[path]}
+
+    changed: set[Path] = set()
+    while not changed:
+        changed = changed_among(watcher.wait(None))
+    deadline = time.monotonic() + debounce_sec
+    while (remaining := deadline - time.monotonic()) > 0:
+        more = changed_among(watcher.wait(remaining)) - changed
+        if more:
+            changed |= more
+            deadline = time.monotonic() + debounce_sec
+    return changed
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Rerun Trinity expansion systems downstream of changed artifacts")
+    parser.add_argument("--manifest", default=str(DEFAULT_MANIFEST.relative_to(ROOT)))
+    parser.add_argument("--systems", nargs="+", default=None, help="Only watch and rerun these system ids.")
+    parser.add_argument("--watcher", default="auto", choices=WATCHERS, help="File event source (auto = inotify, else poll).")
+    parser.add_argument("--poll-interval-sec", type=float, default=1.0, help="Stat polling interval for the poll watcher.")
+    parser.add_argument("--debounce-sec", type=float, default=0.5, help="Quiet period that closes a burst of changes.")
+    parser.add_argument("--reports-dir", default=str(DEFAULT_RUNS_DIR.relative_to(ROOT)))
+    parser.add_argument("--offline-only", action="store_true")
+    parser.add_argument("--fail-on-warn", action="store_true")
+    parser.add_argument("--timeout-sec", type=int, default=30, help="Per-request network timeout passed to each system.")
+    parser.add_argument("--step-timeout-sec", type=int, default=0, help="Cap on each system's manifest timeout_sec (0 = manifest value only).")
+    parser.add_argument("--cache", action="store_true", help="Skip rerun systems whose handler code, manifest and inputs are unchanged.")
+    parser.add_argument("--summary-json", default=str(DEFAULT_SUMMARY.relative_to(ROOT)))
+    parser.add_argument("--max-rounds", type=int, default=0, help="Exit after this many reruns (0 = watch until interrupted).")
+    args = parser.parse_args()
+
+    if args.debounce_sec < 0 or args.poll_interval_sec <= 0 or args.max_rounds < 0:
+        parser.error("--debounce-sec must be >= 0, --poll-interval-sec > 0 and --max-rounds >= 0")
+
+    manifest_path = repo_path(args.manifest)
+    manifest = load_manifest(str(manifest_path))
+    graph = _DependencyGraph(manifest, set(args.systems) if args.systems else None)
+    watched = set(graph.readers) | {manifest_path}
+    watcher = _make_watcher(args.watcher, watched, args.poll_interval_sec)
+    artifact_cache = ArtifactCache()
+    snapshot = {path: _signature(path) for path in watched}
+    print(f"watching {len(watched)} paths for {len(graph.order)} systems (watcher={watcher.name})", flush=True)
+
+    rounds = 0
+    try:
+        while not args.max_rounds or rounds < args.max_rounds:
+            changed = _debounced_changes(watcher, snapshot, args.debounce_sec)
+            snapshot.update({path: _signature(path) for path in changed})
+            rounds += 1
+            rerun = graph.downstream(changed)
+            if manifest_path in changed:
+                # Systems whose manifest entry changed rerun along with their dependants.
+                previous = manifest_index(manifest)
+                manifest = load_manifest(str(manifest_path))
+                graph = _DependencyGraph(manifest, set(args.systems) if args.systems else None)
+                current = manifest_index(manifest)
+                rerun = (rerun & set(graph.order)) | graph.closure(
+                    {system_id for system_id in graph.order if previous.get(system_id) != current.get(system_id)}
+                )
+                if set(graph.readers) | {manifest_path} != watched:
+                    watcher.close()
+                    watched = set(graph.readers) | {manifest_path}
+                    watcher = _make_watcher(args.watcher, watched, args.poll_interval_sec)
+                    snapshot = {path: snapshot.get(path, _signature(path)) for path in watched}
+
+            ordered = graph.topological(rerun)
+            changed_paths = sorted(str(path.relative_to(ROOT)) for path in changed)
+            print(f"round={rounds} changed={','.join(changed_paths)} rerun={len(ordered)}", flush=True)
+            summary = (
+                run_all_systems(
+                    manifest_path=str(manifest_path),
+                    profile="deep",
+                    system_ids=ordered,
+                    offline_only=bool(args.offline_only),
+                    fail_on_warn=bool(args.fail_on_warn),
+                    timeout_sec=int(args.timeout_sec),
+                    step_timeout_sec=max(0, int(args.step_timeout_sec)),
+                    runs_dir=str(args.reports_dir),
+                    use_cache=bool(args.cache),
+                    manifest=manifest,
+                    artifact_cache=artifact_cache,
+                )
+                if ordered
+                else {"systems_total": 0, "systems_passed": 0, "systems_cache_hits": 0, "results": []}
+            )
+            for item in summary["results"]:
+                if item["skipped"]:
+                    status = "SKIPPED"
+                else:
+                    status = "TIMEOUT" if item["timed_out"] else ("PASS" if item["returncode"] == 0 else "FAIL")
+                cached = " cached" if item["cache_hit"] else ""
+                print(f"  {item['system_id']}={status} ({item['duration_sec']:.3f}s{cached})", flush=True)
+            write_json(
+                args.summary_json,
+                {
+                    "generated_utc": _now_iso(),
+                    "round": rounds,
+                    "watcher": watcher.name,
+                    "changed": changed_paths,
+                    "rerun_order": ordered,
+                    **{key: value for key, value in summary.items() if key not in {"generated_utc", "profile"}},
+                },
+            )
+            # Re-baseline what the rerun systems wrote so their own outputs do not retrigger the
+            # watch; edits to other paths made during the rerun are still picked up next round.
+            for system_id in ordered:
+                snapshot.update({path: _signature(path) for path in graph.outputs[system_id] if path in snapshot})
+    except KeyboardInterrupt:
+        pass
+    finally:
+        watcher.close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
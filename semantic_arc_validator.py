@@ -3,21 +3,63 @@ Semantic ARC Validator.
 
 Mathematically assesses all system operations before they are committed to the
 Omega Memory Core, ensuring multi-agent harmony and enforcing the Cosmic Bill of Rights.
+
+Embeddings are memoized per text (LRU) and the intent vectors are kept as a
+pre-normalized matrix, so alignment for one action is a single matrix-vector
+product and `validate_many` scores a whole batch with one matrix product.
+numpy is used when installed; otherwise the same math runs on tuples.
+
+By default embeddings come from the SHA-256 placeholder. Pass a
+`semantic_embedding_store.CachedEmbedder` to use another provider (e.g. a local
+sentence-transformers model) behind an in-memory LRU and a persistent
+memory-mapped vector store; its intent matrix is built on first use, so the
+model is only loaded when something is actually validated.
 """
 
 from __future__ import annotations
 from dataclasses import dataclass, field
-from typing import Any, Dict, List
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 import math
 
+try:
+    import numpy as np
+except ModuleNotFoundError:  # pragma: no cover - numpy is optional
+    np = None
+
+from semantic_embedding_store import CachedEmbedder, hash_embedding
+
+EMBEDDING_DIM = 16
+EMBEDDING_CACHE_SIZE = 65536
+
+# (action_description, participants, cross_pillar_consistency)
+ValidationRequest = Tuple[str, List[str], Dict[str, float]]
+
+
+@lru_cache(maxsize=EMBEDDING_CACHE_SIZE)
+def _embedding(text: str) -> Tuple[float, ...]:
+    return hash_embedding(text, EMBEDDING_DIM)
+
+
 # Placeholder for actual semantic embedding models
 def get_embedding(text: str) -> List[float]:
     """Returns a dummy embedding for the given text."""
     # In a real implementation, this would use a transformer model like BERT or Sentence-BERT.
-    # For this placeholder, we'll use a simple hash-based vector.
-    import hashlib
-    h = hashlib.sha256(text.encode('utf-8')).digest()
-    return [int(b) / 255.0 for b in h[:16]] # Return a 16-dim vector
+    # For this placeholder, we'll use a simple hash-based vector (memoized per text).
+    return list(_embedding(text))
+
+
+def _normalize(vec: Sequence[float]) -> Tuple[float, ...]:
+    norm = math.sqrt(sum(a * a for a in vec))
+    if norm == 0:
+        return tuple(0.0 for _ in vec)
+    return tuple(a / norm for a in vec)
+
+
+@lru_cache(maxsize=EMBEDDING_CACHE_SIZE)
+def _unit_embedding(text: str) -> Tuple[float, ...]:
+    return _normalize(_embedding(text))
+
 
 def cosine_similarity(vec1: List[float], vec2: List[float]) -> float:
     """Computes the cosine similarity between two vectors."""
@@ -45,6 +87,31 @@ CBR_CORE_INTENTS = {
 # Pre-compute embeddings for the core intents
 CBR_INTENT_VECTORS = {name: get_embedding(text) for name, text in CBR_CORE_INTENTS.items()}
 
+# Unit-normalized intent vectors, one row per intent in CBR_INTENT_NAMES order:
+# cosine similarity against every intent is then a single matrix-vector product.
+CBR_INTENT_NAMES = tuple(CBR_INTENT_VECTORS)
+_INTENT_ROWS = tuple(_normalize(CBR_INTENT_VECTORS[name]) for name in CBR_INTENT_NAMES)
+
+
+def _as_matrix(rows: Sequence[Tuple[float, ...]]) -> Any:
+    return np.array(rows, dtype=float) if np is not None else tuple(rows)
+
+
+CBR_INTENT_MATRIX = _as_matrix(_INTENT_ROWS)
+
+
+def _similarities(units: Sequence[Tuple[float, ...]], intent_matrix: Any) -> List[List[float]]:
+    if not units:
+        return []
+    if np is not None:
+        return (np.array(units, dtype=float) @ intent_matrix.T).tolist()
+    return [[sum(a * b for a, b in zip(unit, row)) for row in intent_matrix] for unit in units]
+
+
+def alignment_matrix(action_descriptions: Sequence[str]) -> List[List[float]]:
+    """Cosine similarity of each action against each intent (rows follow the input order)."""
+    return _similarities([_unit_embedding(text) for text in action_descriptions], CBR_INTENT_MATRIX)
+
 # Simplified synergy matrix for the Grand Head Council
 # In a real system, this would be a learned or empirically derived matrix.
 COUNCIL_SYNERGY_MATRIX = {
@@ -54,6 +121,120 @@ COUNCIL_SYNERGY_MATRIX = {
     # ... add more synergies as the council grows and interacts
 }
 
+# Councils up to this size get a dense numpy matrix; larger ones use the sparse neighbour map.
+DENSE_SYNERGY_MAX_AGENTS = 2048
+
+
+class SynergyMatrix:
+    """
+    A synergy table compiled once into a symmetric, index-mapped matrix.
+
+    A pair declared in one direction applies to both; a pair declared in both
+    directions with different values uses their mean, so an explicit 0.0 is a
+    real synergy rather than "look the other way". Unknown agents have zero
+    synergy with everyone. Resonance is the mean synergy over all participant
+    pairs, computed as a submatrix sum instead of a pairwise Python loop.
+    """
+
+    def __init__(self, synergies: Dict[str, Dict[str, float]]):
+        declared: Dict[Tuple[str, str], List[float]] = {}
+        for source, row in synergies.items():
+            for target, value in row.items():
+                declared.setdefault(tuple(sorted((source, target))), []).append(float(value))
+        self.names: Tuple[str, ...] = tuple(sorted({name for pair in declared for name in pair}))
+        self.index: Dict[str, int] = {name: idx for idx, name in enumerate(self.names)}
+        self.neighbors: Dict[str, Dict[str, float]] = {name: {} for name in self.names}
+        for (first, second), values in declared.items():
+            value = sum(values) / len(values)
+            self.neighbors[first][second] = value
+            self.neighbors[second][first] = value
+        self.dense = None
+        if np is not None and len(self.names) <= DENSE_SYNERGY_MAX_AGENTS:
+            self.dense = np.zeros((len(self.names), len(self.names)))
+            for name, row in self.neighbors.items():
+                for other, value in row.items():
+                    self.dense[self.index[name], self.index[other]] = value
+
+    def synergy(self, first: str, second: str) -> float:
+        return self.neighbors.get(first, {}).get(second, 0.0)
+
+    def pair_sum(self, participants: Sequence[str]) -> float:
+        """Sum of synergy over all unordered participant pairs."""
+        if self.dense is not None:
+            idx = [self.index[name] for name in participants if name in self.index]
+            if len(idx) < 2:
+                return 0.0
+            sub = self.dense[np.ix_(idx, idx)]
+            return float(sub.sum() - np.trace(sub)) / 2.0
+        counts: Dict[str, int] = {}
+        for name in participants:
+            if name in self.index:
+                counts[name] = counts.get(name, 0) + 1
+        total = 0.0
+        for name, count in counts.items():
+            for other, value in self.neighbors[name].items():
+                if other == name:
+                    total += value * count * (count - 1)
+                else:
+                    total += value * count * counts.get(other, 0)
+        return total / 2.0
+
+    def resonance(self, participants: Sequence[str]) -> float:
+        if len(participants) < 2:
+            return 1.0  # Perfect resonance for solo actions or no participants
+        pairs = len(participants) * (len(participants) - 1) / 2
+        return self.pair_sum(participants) / pairs
+
+    def tracker(self, participants: Iterable[str] = ()) -> "ResonanceTracker":
+        return ResonanceTracker(self, participants)
+
+
+class ResonanceTracker:
+    """
+    Resonance of an ongoing action whose participants change over time.
+
+    `join` and `leave` update the running pair sum in O(k), k being the agent's
+    number of declared synergies, instead of rescoring the whole council.
+    """
+
+    def __init__(self, matrix: SynergyMatrix, participants: Iterable[str] = ()):
+        self.matrix = matrix
+        self.counts: Dict[str, int] = {}
+        self.size = 0
+        self.pair_sum = 0.0
+        for name in participants:
+            self.join(name)
+
+    def _contribution(self, name: str) -> float:
+        """Synergy between `name` and every participant currently present."""
+        return sum(value * self.counts.get(other, 0) for other, value in self.matrix.neighbors.get(name, {}).items())
+
+    def join(self, name: str) -> float:
+        self.pair_sum += self._contribution(name)
+        self.counts[name] = self.counts.get(name, 0) + 1
+        self.size += 1
+        return self.resonance
+
+    def leave(self, name: str) -> float:
+        if not self.counts.get(name):
+            raise KeyError(f"{name} is not participating")
+        self.counts[name] -= 1
+        if not self.counts[name]:
+            del self.counts[name]
+        self.size -= 1
+        self.pair_sum -= self._contribution(name)
+        return self.resonance
+
+    @property
+    def participants(self) -> List[str]:
+        return [name for name, count in self.counts.items() for _ in range(count)]
+
+    @property
+    def resonance(self) -> float:
+        if self.size < 2:
+            return 1.0
+        return self.pair_sum / (self.size * (self.size - 1) / 2)
+
 @dataclass
 class ValidationResult:
     """Represents the outcome of an ARC validation."""
@@ -69,43 +250,44 @@ class SemanticARCValidator:
     A class to validate system operations against the principles of
     Alignment, Resonance, and Coherence (ARC).
     """
-    def __init__(self, arc_threshold: float = 0.7):
+    def __init__(
+        self,
+        arc_threshold: float = 0.7,
+        embedder: Optional[CachedEmbedder] = None,
+        synergy: Optional[SynergyMatrix] = None,
+    ):
         self.arc_threshold = arc_threshold
+        self.embedder = embedder
+        # Compiled here rather than at import so edits to COUNCIL_SYNERGY_MATRIX made
+        # before constructing a validator still apply.
+        self.synergy = synergy or SynergyMatrix(COUNCIL_SYNERGY_MATRIX)
+        self._intent_matrix = None
+
+    def _alignment_rows(self, action_descriptions: Sequence[str]) -> List[List[float]]:
+        if self.embedder is None:
+            return alignment_matrix(action_descriptions)
+        if self._intent_matrix is None:
+            intents = self.embedder.embed_many(CBR_CORE_INTENTS[name] for name in CBR_INTENT_NAMES)
+            self._intent_matrix = _as_matrix([_normalize(vector) for vector in intents])
+        units = [_normalize(vector) for vector in self.embedder.embed_many(action_descriptions)]
+        return _similarities(units, self._intent_matrix)
 
     def validate_alignment(self, action_description: str) -> Dict[str, float]:
         """
         Calculates the alignment of an action with the core intents of the Cosmic Bill of Rights.
         """
-        action_vector = get_embedding(action_description)
-        alignment_scores = {
-            name: cosine_similarity(action_vector, intent_vector)
-            for name, intent_vector in CBR_INTENT_VECTORS.items()
-        }
-        return alignment_scores
+        return dict(zip(CBR_INTENT_NAMES, self._alignment_rows([action_description])[0]))
 
     def validate_resonance(self, participants: List[str]) -> float:
         """
         Calculates the resonance score based on the synergy of the participating agents.
         A simple measure could be the average synergy between all pairs of participants.
         """
-        if len(participants) < 2:
-            return 1.0  # Perfect resonance for solo actions or no participants
-
-        synergy_scores = []
-        for i in range(len(participants)):
-            for j in range(i + 1, len(participants)):
-                p1 = participants[i]
-                p2 = participants[j]
-                synergy = COUNCIL_SYNERGY_MATRIX.get(p1, {}).get(p2, 0.0)
-                # Assume symmetry for this simple model
-                if synergy == 0.0:
-                    synergy = COUNCIL_SYNERGY_MATRIX.get(p2, {}).get(p1, 0.0)
-                synergy_scores.append(synergy)
-
-        if not synergy_scores:
-            return 0.0
+        return self.synergy.resonance(participants)
 
-        return sum(synergy_scores) / len(synergy_scores)
+    def resonance_tracker(self, participants: Iterable[str] = ()) -> ResonanceTracker:
+        """Incremental resonance for an action whose participants join and leave over time."""
+        return self.synergy.tracker(participants)
 
     def validate_coherence(self, cross_pillar_consistency: Dict[str, float]) -> float:
         """
@@ -130,6 +312,28 @@ class SemanticARCValidator:
         Performs the full ARC validation for a given system operation.
         """
         alignment_scores = self.validate_alignment(action_description)
+        return self._result(alignment_scores, participants, cross_pillar_consistency)
+
+    def validate_many(self, actions: Iterable[ValidationRequest]) -> List[ValidationResult]:
+        """
+        Validates a batch of ``(action_description, participants, cross_pillar_consistency)``
+        operations. Alignment for the distinct descriptions is one matrix product;
+        results match calling `validate` on each operation (up to float rounding).
+        """
+        batch = list(actions)
+        descriptions = list(dict.fromkeys(description for description, _, _ in batch))
+        rows = dict(zip(descriptions, self._alignment_rows(descriptions)))
+        return [
+            self._result(dict(zip(CBR_INTENT_NAMES, rows[description])), participants, consistency)
+            for description, participants, consistency in batch
+        ]
+
+    def _result(
+        self,
+        alignment_scores: Dict[str, float],
+        participants: List[str],
+        cross_pillar_consistency: Dict[str, float],
+    ) -> ValidationResult:
         # For simplicity, we'll take the max alignment score as the final alignment score
         alignment_score = max(alignment_scores.values()) if alignment_scores else 0.0
 
@@ -0,0 +1,334 @@
+"""
+semantic_embedding_store.py
+---------------------------
+
+Embedding providers and the on-disk vector cache used by SemanticARCValidator.
+
+`EmbeddingProvider` is the batching interface. `HashEmbeddingProvider` is the
+default offline placeholder (SHA-256 bytes scaled to [0, 1]);
+`SentenceTransformerProvider` wraps a local sentence-transformers model and
+only imports/loads it on the first batch that actually needs embedding, so
+importing this module (or the validator) stays cheap.
+
+`MmapVectorStore` persists vectors in a directory: `vectors.f32` holds raw
+float32 rows, `keys.bin` the 32-byte content hash of each row and `meta.json`
+the provider name and dimension. Vectors are read through a memory map, so a
+warm cache costs a page-in rather than a model call. Rows are appended vector
+first, key second; on open, anything past the shorter of the two files is a
+torn write and is truncated away. Appends, that truncation and store creation
+hold an `fcntl.flock` on the directory's `lock` file, so several processes can
+share one store; each picks up rows appended by others before it writes.
+
+`CachedEmbedder` puts an in-memory LRU in front of an optional store and sends
+only the misses to the provider, in batches.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import mmap
+import os
+import sys
+import threading
+from abc import ABC, abstractmethod
+from array import array
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX platforms fall back to the in-process lock
+    fcntl = None
+
+Vector = Tuple[float, ...]
+
+KEY_BYTES = 32
+FLOAT_BYTES = 4
+
+
+def hash_embedding(text: str, dim: int = 16) -> Vector:
+    """Deterministic placeholder embedding: the first `dim` SHA-256 bytes scaled to [0, 1]."""
+    digest = hashlib.sha256(text.encode("utf-8")).digest()
+    return tuple(int(b) / 255.0 for b in digest[:dim])
+
+
+class EmbeddingProvider(ABC):
+    """Batch embedding interface used by CachedEmbedder."""
+
+    # Identifies the model in cache keys and store metadata; change it when the vectors change.
+    name = "provider"
+
+    @abstractmethod
+    def embed_batch(self, texts: Sequence[str]) -> List[Sequence[float]]:
+        ...
+
+
+class HashEmbeddingProvider(EmbeddingProvider):
+    """Offline default: hash-derived vectors, no model and no dependencies."""
+
+    def __init__(self, dim: int = 16) -> None:
+        if not 1 <= dim <= 32:
+            raise ValueError("dim must be between 1 and 32 (SHA-256 digest size)")
+        self.dim = dim
+        self.name = f"sha256-{dim}"
+
+    def embed_batch(self, texts: Sequence[str]) -> List[Sequence[float]]:
+        return [hash_embedding(text, self.dim) for text in texts]
+
+
+class SentenceTransformerProvider(EmbeddingProvider):
+    """Local sentence-transformers model (name or path), loaded on first use."""
+
+    def __init__(self, model: str, device: Optional[str] = None, batch_size: int = 64) -> None:
+        self.model_name = model
+        self.device = device
+        self.batch_size = batch_size
+        self.name = f"sentence-transformers:{model}"
+        self._model = None
+        self._lock = threading.Lock()
+
+    def _load(self):
+        with self._lock:
+            if self._model is None:
+                try:
+                    from sentence_transformers import SentenceTransformer
+                except ModuleNotFoundError as exc:
+                    raise RuntimeError(
+                        "sentence-transformers is required for SentenceTransformerProvider. "
+                        "Install it or use HashEmbeddingProvider."
+                    ) from exc
+                self._model = SentenceTransformer(self.model_name, device=self.device)
+        return self._model
+
+    def embed_batch(self, texts: Sequence[str]) -> List[Sequence[float]]:
+        vectors = self._load().encode(list(texts), batch_size=self.batch_size, convert_to_numpy=True)
+        return vectors.tolist()
+
+
+def content_key(provider_name: str, text: str) -> bytes:
+    return hashlib.sha256(provider_name.encode("utf-8") + b"\0" + text.encode("utf-8")).digest()
+
+
+class MmapVectorStore:
+    """Append-only, memory-mapped float32 vector store keyed by content hash."""
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.vectors_path = self.path / "vectors.f32"
+        self.keys_path = self.path / "keys.bin"
+        self.meta_path = self.path / "meta.json"
+        self.lock_path = self.path / "lock"
+        self.provider: Optional[str] = None
+        self.dim: Optional[int] = None
+        self._rows: Dict[bytes, int] = {}
+        self._lock = threading.Lock()
+        self._mmap: Optional[mmap.mmap] = None
+        self._view: Optional[memoryview] = None
+        self._mapped_rows = 0
+        if self.meta_path.exists():
+            self._load_meta()
+            with self._file_lock():
+                self._sync_rows()
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    @contextlib.contextmanager
+    def _file_lock(self) -> Iterator[None]:
+        """Exclusive lock shared with every process writing to this store."""
+        with self.lock_path.open("a+b") as handle:
+            if fcntl is not None:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+
+    def _load_meta(self) -> None:
+        meta = json.loads(self.meta_path.read_text(encoding="utf-8"))
+        if meta.get("byteorder") != sys.byteorder:
+            raise ValueError(f"vector store {self.path} was written with {meta.get('byteorder')} byte order")
+        self.provider = str(meta["provider"])
+        self.dim = int(meta["dim"])
+
+    def _sync_rows(self) -> None:
+        """Index rows appended since the last sync, by this or another process. Hold _file_lock."""
+        key_bytes = self.keys_path.stat().st_size if self.keys_path.exists() else 0
+        vector_bytes = self.vectors_path.stat().st_size if self.vectors_path.exists() else 0
+        rows = min(key_bytes // KEY_BYTES, vector_bytes // (self.dim * FLOAT_BYTES))
+        if key_bytes != rows * KEY_BYTES or vector_bytes != rows * self.dim * FLOAT_BYTES:
+            # Torn append from an interrupted writer (the lock rules out a live one): keep only complete rows.
+            for target, size in ((self.keys_path, rows * KEY_BYTES), (self.vectors_path, rows * self.dim * FLOAT_BYTES)):
+                if target.exists():
+                    with target.open("r+b") as handle:
+                        handle.truncate(size)
+        known = len(self._rows)
+        if rows <= known:
+            return
+        with self.keys_path.open("rb") as handle:
+            handle.seek(known * KEY_BYTES)
+            keys = handle.read((rows - known) * KEY_BYTES)
+        for offset in range(rows - known):
+            self._rows.setdefault(keys[offset * KEY_BYTES : (offset + 1) * KEY_BYTES], known + offset)
+
+    def bind(self, provider: str, dim: Optional[int] = None) -> None:
+        """Check (or, for a new store, record) which provider the vectors belong to."""
+        if self.provider is None and dim is not None:
+            with self._lock, self._file_lock():
+                if self.meta_path.exists():
+                    # Another process created the store after this one opened it.
+                    self._load_meta()
+                    self._sync_rows()
+                else:
+                    meta = {"provider": provider, "dim": dim, "dtype": "float32", "byteorder": sys.byteorder}
+                    tmp = self.meta_path.with_suffix(f".{os.getpid()}.tmp")
+                    tmp.write_text(json.dumps(meta, indent=2) + "\n", encoding="utf-8")
+                    os.replace(tmp, self.meta_path)
+                    self.provider, self.dim = provider, dim
+        if self.provider is not None and self.provider != provider:
+            raise ValueError(f"vector store {self.path} holds '{self.provider}' vectors, not '{provider}'")
+        if dim is not None and self.dim is not None and self.dim != dim:
+            raise ValueError(f"vector store {self.path} holds {self.dim}-dim vectors, not {dim}")
+
+    def _unmap(self) -> None:
+        if self._view is not None:
+            self._view.release()
+            self._view = None
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        self._mapped_rows = 0
+
+    def _remap(self) -> None:
+        self._unmap()
+        if not self._rows:
+            return
+        with self.vectors_path.open("rb") as handle:
+            self._mmap = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._mmap).cast("f")
+        self._mapped_rows = len(self._view) // self.dim
+
+    def get_many(self, keys: Iterable[bytes]) -> Dict[bytes, Vector]:
+        found: Dict[bytes, Vector] = {}
+        with self._lock:
+            for key in keys:
+                row = self._rows.get(key)
+                if row is None:
+                    continue
+                if row >= self._mapped_rows:
+                    self._remap()
+                found[key] = tuple(self._view[row * self.dim : (row + 1) * self.dim])
+        return found
+
+    def put_many(self, items: Iterable[Tuple[bytes, Sequence[float]]]) -> int:
+        """Append vectors for keys not already stored (by any process); returns the number written."""
+        items = list(items)
+        if self.dim is None:
+            raise ValueError(f"vector store {self.path} has no dimension yet; call bind(provider, dim) first")
+        with self._lock, self._file_lock():
+            self._sync_rows()
+            fresh: Dict[bytes, Sequence[float]] = {}
+            for key, vector in items:
+                if key not in self._rows and key not in fresh:
+                    if len(key) != KEY_BYTES or len(vector) != self.dim:
+                        raise ValueError(f"expected {KEY_BYTES}-byte keys and {self.dim}-dim vectors")
+                    fresh[key] = vector
+            if not fresh:
+                return 0
+            packed = array("f")
+            for vector in fresh.values():
+                packed.extend(vector)
+            with self.vectors_path.open("ab") as handle:
+                packed.tofile(handle)
+                handle.flush()
+                os.fsync(handle.fileno())
+            with self.keys_path.open("ab") as handle:
+                handle.write(b"".join(fresh))
+                handle.flush()
+                os.fsync(handle.fileno())
+            start = len(self._rows)
+            for offset, key in enumerate(fresh):
+                self._rows[key] = start + offset
+            return len(fresh)
+
+    def close(self) -> None:
+        with self._lock:
+            self._unmap()
+
+
+class CachedEmbedder:
+    """In-memory LRU -> optional MmapVectorStore -> provider, batching only the misses."""
+
+    def __init__(
+        self,
+        provider: Optional[EmbeddingProvider] = None,
+        store: Optional[MmapVectorStore] = None,
+        memory_cache_size: int = 65536,
+        batch_size: int = 256,
+    ) -> None:
+        if memory_cache_size < 0 or batch_size < 1:
+            raise ValueError("memory_cache_size must be >= 0 and batch_size >= 1")
+        self.provider = provider or HashEmbeddingProvider()
+        self.store = store
+        if store is not None:
+            store.bind(self.provider.name)
+        self.memory_cache_size = memory_cache_size
+        self.batch_size = batch_size
+        self._memory: "OrderedDict[str, Vector]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {"memory_hits": 0, "store_hits": 0, "embedded": 0}
+
+    def _remember(self, text: str, vector: Vector) -> None:
+        if not self.memory_cache_size:
+            return
+        self._memory[text] = vector
+        self._memory.move_to_end(text)
+        while len(self._memory) > self.memory_cache_size:
+            self._memory.popitem(last=False)
+
+    def embed_many(self, texts: Iterable[str]) -> List[Vector]:
+        texts = list(texts)
+        resolved: Dict[str, Vector] = {}
+        with self._lock:
+            for text in texts:
+                if text not in resolved and text in self._memory:
+                    self._memory.move_to_end(text)
+                    resolved[text] = self._memory[text]
+                    self.stats["memory_hits"] += 1
+        missing = [text for text in dict.fromkeys(texts) if text not in resolved]
+
+        if missing and self.store is not None:
+            keys = {text: content_key(self.provider.name, text) for text in missing}
+            stored = self.store.get_many(keys.values())
+            for text in missing:
+                if keys[text] in stored:
+                    resolved[text] = stored[keys[text]]
+            self.stats["store_hits"] += len(stored)
+            missing = [text for text in missing if text not in resolved]
+
+        for start in range(0, len(missing), self.batch_size):
+            chunk = missing[start : start + self.batch_size]
+            vectors = [tuple(float(x) for x in vector) for vector in self.provider.embed_batch(chunk)]
+            if self.store is not None:
+                # Round to the stored precision so cold and warm lookups agree.
+                vectors = [tuple(array("f", vector)) for vector in vectors]
+            if len(vectors) != len(chunk):
+                raise RuntimeError(f"{self.provider.name} returned {len(vectors)} vectors for {len(chunk)} texts")
+            resolved.update(zip(chunk, vectors))
+            self.stats["embedded"] += len(chunk)
+            if self.store is not None:
+                self.store.bind(self.provider.name, len(vectors[0]))
+                self.store.put_many((content_key(self.provider.name, text), vector) for text, vector in zip(chunk, vectors))
+
+        with self._lock:
+            for text, vector in resolved.items():
+                self._remember(text, vector)
+        return [resolved[text] for text in texts]
+
+    def embed(self, text: str) -> Vector:
+        return self.embed_many([text])[0]
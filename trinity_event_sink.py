@@ -0,0 +1,300 @@
+"""
+trinity_event_sink.py
+---------------------
+
+Structured, leveled events for the orchestrator hot paths.
+
+Components emit named events with keyword fields instead of printing:
+
+    sink.emit("task.completed", task="...", arc_score=0.91, total_exotic_energy=3.2)
+
+`JsonlEventSink` queues records and writes them as JSON lines from a background
+thread, so emitting costs a deque append; records past `max_pending` drop the
+oldest and are counted. `RingBufferEventSink` keeps the last N records in memory
+for in-process consumers. `ConsoleEventSink` prints only an event's `message`,
+which keeps the demos' human-readable output. Every sink has a minimum level
+and optional per-event sampling rates (deterministic: rate 0.1 keeps every
+tenth event of that name).
+
+`default_sink()` is what components use when none is passed: the console, plus a
+JSONL file when `TRINITY_EVENT_LOG` is set. `TRINITY_EVENT_LEVEL` sets the level
+and `TRINITY_EVENT_CONSOLE=0` silences the console. `load_events` reads a JSONL
+event log back.
+"""
+
+from __future__ import annotations
+
+import atexit
+import json
+import math
+import os
+import sys
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Optional, TextIO
+
+# Same numbers as the logging module.
+DEBUG = 10
+INFO = 20
+WARNING = 30
+ERROR = 40
+LEVEL_NAMES = {DEBUG: "DEBUG", INFO: "INFO", WARNING: "WARNING", ERROR: "ERROR"}
+LEVELS = {name: level for level, name in LEVEL_NAMES.items()}
+
+EVENT_LOG_ENV = "TRINITY_EVENT_LOG"
+EVENT_LEVEL_ENV = "TRINITY_EVENT_LEVEL"
+EVENT_CONSOLE_ENV = "TRINITY_EVENT_CONSOLE"
+
+Record = Dict[str, Any]
+
+
+def parse_level(value: str | int) -> int:
+    if isinstance(value, int):
+        return value
+    name = value.strip().upper()
+    if name not in LEVELS:
+        raise ValueError(f"unknown event level '{value}'; expected one of {', '.join(LEVELS)}")
+    return LEVELS[name]
+
+
+class EventSink(ABC):
+    """Base sink: level filter, per-event sampling and record construction."""
+
+    def __init__(self, level: int = INFO, sample: Optional[Dict[str, float]] = None) -> None:
+        self.level = level
+        self.sample = dict(sample or {})
+        for event, rate in self.sample.items():
+            if not 0.0 <= rate <= 1.0:
+                raise ValueError(f"sample rate for '{event}' must be within [0, 1]")
+        self._seen: Dict[str, int] = {}
+        # Emitters may share a sink across threads; sampling counters must not race.
+        self._sample_lock = threading.Lock()
+
+    def enabled(self, level: int = INFO) -> bool:
+        return level >= self.level
+
+    def _sampled(self, event: str) -> bool:
+        rate = self.sample.get(event)
+        if rate is None:
+            return True
+        with self._sample_lock:
+            seen = self._seen.get(event, 0) + 1
+            self._seen[event] = seen
+        return math.floor(seen * rate) > math.floor((seen - 1) * rate)
+
+    def emit(self, event: str, level: int = INFO, message: Optional[str] = None, **fields: Any) -> None:
+        if level < self.level or (self.sample and not self._sampled(event)):
+            return
+        record: Record = {"ts": time.time(), "level": LEVEL_NAMES.get(level, str(level)), "event": event}
+        if message is not None:
+            record["message"] = message
+        record.update(fields)
+        self._write(record)
+
+    @abstractmethod
+    def _write(self, record: Record) -> None:
+        ...
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.flush()
+
+
+class NullEventSink(EventSink):
+    def enabled(self, level: int = INFO) -> bool:
+        return False
+
+    def emit(self, event: str, level: int = INFO, message: Optional[str] = None, **fields: Any) -> None:
+        return None
+
+    def _write(self, record: Record) -> None:
+        return None
+
+
+NULL_SINK = NullEventSink()
+
+
+class ConsoleEventSink(EventSink):
+    """Prints each event's `message`; events without one are not shown."""
+
+    def __init__(self, stream: Optional[TextIO] = None, level: int = INFO, sample: Optional[Dict[str, float]] = None) -> None:
+        super().__init__(level, sample)
+        self.stream = stream
+
+    def emit(self, event: str, level: int = INFO, message: Optional[str] = None, **fields: Any) -> None:
+        if message is not None:
+            super().emit(event, level, message, **fields)
+
+    def _write(self, record: Record) -> None:
+        print(record["message"], file=self.stream or sys.stdout)
+
+
+class RingBufferEventSink(EventSink):
+    """The last `capacity` records, in memory."""
+
+    def __init__(self, capacity: int = 10000, level: int = INFO, sample: Optional[Dict[str, float]] = None) -> None:
+        super().__init__(level, sample)
+        self._records: Deque[Record] = deque(maxlen=capacity)
+
+    def _write(self, record: Record) -> None:
+        self._records.append(record)
+
+    def records(self, event: Optional[str] = None) -> List[Record]:
+        return [record for record in list(self._records) if event is None or record["event"] == event]
+
+
+class JsonlEventSink(EventSink):
+    """Appends records to a JSONL file from a background flusher thread."""
+
+    def __init__(
+        self,
+        path: str | Path,
+        level: int = INFO,
+        sample: Optional[Dict[str, float]] = None,
+        max_pending: int = 65536,
+        flush_interval_sec: float = 0.25,
+        flush_batch: int = 1024,
+    ) -> None:
+        super().__init__(level, sample)
+        if max_pending < 1 or flush_batch < 1 or flush_interval_sec <= 0:
+            raise ValueError("max_pending and flush_batch must be >= 1 and flush_interval_sec > 0")
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_pending = max_pending
+        self.flush_interval_sec = flush_interval_sec
+        self.flush_batch = flush_batch
+        self.dropped = 0
+        self.written = 0
+        self._pending: Deque[Record] = deque()
+        self._cond = threading.Condition()
+        self._flush_requested = False
+        self._closed = False
+        self._handle = self.path.open("a", encoding="utf-8")
+        self._thread = threading.Thread(target=self._run, name="trinity-event-sink", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def _write(self, record: Record) -> None:
+        with self._cond:
+            if self._closed:
+                return
+            if len(self._pending) >= self.max_pending:
+                self._pending.popleft()
+                self.dropped += 1
+            self._pending.append(record)
+            if len(self._pending) >= self.flush_batch:
+                self._cond.notify()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                self._cond.wait_for(
+                    lambda: self._closed or self._flush_requested or len(self._pending) >= self.flush_batch,
+                    timeout=self.flush_interval_sec,
+                )
+                batch = list(self._pending)
+                self._pending.clear()
+                closing = self._closed
+            if batch:
+                self._handle.write("".join(json.dumps(record, default=str) + "\n" for record in batch))
+                self._handle.flush()
+            with self._cond:
+                self.written += len(batch)
+                if not self._pending:
+                    self._flush_requested = False
+                self._cond.notify_all()
+            if closing and not batch:
+                return
+
+    def flush(self, timeout: Optional[float] = 5.0) -> None:
+        """Block until everything emitted so far has been written."""
+        with self._cond:
+            if self._closed:
+                return
+            self._flush_requested = True
+            self._cond.notify_all()
+            self._cond.wait_for(lambda: not self._flush_requested, timeout=timeout)
+
+    def close(self) -> None:
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join()
+        self._handle.close()
+        atexit.unregister(self.close)
+
+
+class TeeEventSink(EventSink):
+    """Forwards every event to several sinks."""
+
+    def __init__(self, *sinks: EventSink) -> None:
+        super().__init__(min((sink.level for sink in sinks), default=INFO))
+        self.sinks = list(sinks)
+
+    def enabled(self, level: int = INFO) -> bool:
+        return any(sink.enabled(level) for sink in self.sinks)
+
+    def emit(self, event: str, level: int = INFO, message: Optional[str] = None, **fields: Any) -> None:
+        # Each sink applies its own level and sampling.
+        for sink in self.sinks:
+            sink.emit(event, level, message, **fields)
+
+    def _write(self, record: Record) -> None:
+        for sink in self.sinks:
+            sink._write(record)
+
+    def flush(self) -> None:
+        for sink in self.sinks:
+            sink.flush()
+
+    def close(self) -> None:
+        for sink in self.sinks:
+            sink.close()
+
+
+_DEFAULT_SINK: Optional[EventSink] = None
+_DEFAULT_LOCK = threading.Lock()
+
+
+def sink_from_env() -> EventSink:
+    level = parse_level(os.environ.get(EVENT_LEVEL_ENV, "INFO"))
+    sinks: List[EventSink] = []
+    if os.environ.get(EVENT_CONSOLE_ENV, "1") != "0":
+        sinks.append(ConsoleEventSink(level=level))
+    if os.environ.get(EVENT_LOG_ENV):
+        sinks.append(JsonlEventSink(os.environ[EVENT_LOG_ENV], level=level))
+    if not sinks:
+        return NULL_SINK
+    return sinks[0] if len(sinks) == 1 else TeeEventSink(*sinks)
+
+
+def default_sink() -> EventSink:
+    """Process-wide sink configured from the environment on first use."""
+    global _DEFAULT_SINK
+    with _DEFAULT_LOCK:
+        if _DEFAULT_SINK is None:
+            _DEFAULT_SINK = sink_from_env()
+        return _DEFAULT_SINK
+
+
+def load_events(path: str | Path, event: Optional[str] = None) -> List[Record]:
+    """Read a JSONL event log, skipping malformed lines; optionally one event name only."""
+    path = Path(path)
+    if not path.exists():
+        return []
+    records = []
+    for line in path.read_text(encoding="utf-8").splitlines():
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError:
+            continue
+        if isinstance(record, dict) and (event is None or record.get("event") == event):
+            records.append(record)
+    return records
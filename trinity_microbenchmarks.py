@@ -0,0 +1,398 @@
+"""
+trinity_microbenchmarks.py
+--------------------------
+
+In-process micro-benchmarks for the core Trinity modules.
+
+`body_track_runner.py` times whole demo subprocesses, which is dominated by
+interpreter start-up. This harness instead times the hot functions directly
+across parameter grids so scaling can be read off the results:
+
+* `GMUTSimulator.run_simulation` vs `num_points` (list and numpy backends)
+* `transmute_state` vs statevector size and shots
+* `FreedIDAuditLedger.append` / `verify_integrity` vs ledger length
+* `SemanticARCValidator.validate` vs participant count
+* `PsiIndexMemoryCore.add_artifact` / `retrieve_most_relevant_memories` vs core size
+
+Each case is auto-ranged like `timeit` (loops per sample grow until a sample
+takes `--min-sample-sec`) and repeated; the per-call median, min and max are
+reported, together with a log-log scaling slope per benchmark. Each run writes
+a latest JSON and appends one row to a JSONL history carrying the
+`total_duration_seconds` / `body_health_score` / `benchmark_trend` fields that
+`scripts/body_benchmark_trend_guard.py` reads, so the guard can be pointed at
+these files with `--latest-benchmark` and `--metrics-history`.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import platform
+import random
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from statistics import median
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from freed_id_audit_log import FreedIDAuditLedger
+from psi_index_memory_core import GoldenArtifact, KairoticMoment, PsiIndexMemoryCore
+from qc_transmuter import transmute_state
+from semantic_arc_validator import SemanticARCValidator
+from trinity_event_sink import NULL_SINK
+from trinity_simulation_engine import GMUTSimulator
+
+ROOT = Path(__file__).resolve().parent
+
+# name -> parameter whose value drives the scaling slope
+BENCHMARKS = {
+    "gmut.run_simulation": "num_points",
+    "qc.transmute_state": "size",
+    "audit.append": "ledger_length",
+    "audit.verify_integrity": "ledger_length",
+    "arc.validate": "participants",
+    "psi.add_artifact": "core_size",
+    "psi.top_k": "core_size",
+}
+
+GRIDS: Dict[str, Dict[str, List[int]]] = {
+    "quick": {
+        "num_points": [50, 500, 5000],
+        "size": [16, 256, 4096],
+        "shots": [1024],
+        "ledger_length": [100, 1000],
+        "participants": [2, 6],
+        "core_size": [100, 1000, 10000],
+        "top_k": [3],
+    },
+    "standard": {
+        "num_points": [50, 500, 5000, 50000],
+        "size": [16, 256, 4096, 65536],
+        "shots": [1024, 16384],
+        "ledger_length": [100, 1000, 10000],
+        "participants": [2, 4, 6],
+        "core_size": [100, 1000, 10000, 100000],
+        "top_k": [3, 100],
+    },
+}
+
+COUNCIL = ["Ariel", "Yuki", "Raphael", "Jade", "Daedra", "Zoe"]
+
+Case = Tuple[str, Dict[str, object], Callable[[], Callable[[], object]]]
+
+
+def _now_utc() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def _artifact(idx: int, rng: random.Random) -> GoldenArtifact:
+    return GoldenArtifact(
+        moment=KairoticMoment(
+            timestamp_utc="2026-01-01T00:00:00+00:00",
+            kairotic_weight=rng.random(),
+            description=f"bench moment {idx}",
+            trigger_signals={"psi_coherence_spike": rng.random(), "novelty_score": rng.random()},
+        ),
+        extracted_insight=f"insight {idx}",
+        archive_id=f"GA-BENCH-{idx:06d}",
+    )
+
+
+def _ledger(tmp: Path, length: int) -> FreedIDAuditLedger:
+    ledger = FreedIDAuditLedger(tmp / f"audit-{length}.jsonl")
+    ledger.append_many(("bench", f"did:freed:{idx}", {"seq": idx}) for idx in range(length))
+    return ledger
+
+
+def _cases(grid: Dict[str, List[int]], tmp: Path) -> Iterator[Case]:
+    """Yield (benchmark, params, setup) where setup returns the timed callable."""
+    for backend in ("list", "numpy"):
+        for points in grid["num_points"]:
+            yield (
+                "gmut.run_simulation",
+                {"backend": backend, "num_points": points},
+                lambda b=backend, n=points: GMUTSimulator(num_points=n, backend=b).run_simulation,
+            )
+
+    for size in grid["size"]:
+        for shots in grid["shots"]:
+
+            def setup(size: int = size, shots: int = shots) -> Callable[[], object]:
+                rng = random.Random(size)
+                amplitudes = [complex(rng.gauss(0, 1), rng.gauss(0, 1)) for _ in range(size)]
+                return lambda: transmute_state(amplitudes, shots=shots, seed=7)
+
+            yield "qc.transmute_state", {"size": size, "shots": shots}, setup
+
+    for length in grid["ledger_length"]:
+
+        def append_setup(length: int = length) -> Callable[[], object]:
+            ledger = _ledger(tmp / "append", length)
+            return lambda: ledger.append("bench", "did:freed:timed", {"seq": -1})
+
+        yield "audit.append", {"ledger_length": length}, append_setup
+        # No checkpoint key, so every call re-hashes the whole chain.
+        yield (
+            "audit.verify_integrity",
+            {"ledger_length": length},
+            lambda length=length: _ledger(tmp / "verify", length).verify_integrity,
+        )
+
+    validator = SemanticARCValidator()
+    consistency = {"mind_body": 0.9, "body_heart": 0.8, "heart_mind": 0.85}
+    for count in grid["participants"]:
+        participants = COUNCIL[:count]
+        yield (
+            "arc.validate",
+            {"participants": count},
+            lambda p=participants: lambda: validator.validate("Protect user sovereignty and consent", p, consistency),
+        )
+
+    for size in grid["core_size"]:
+
+        def core(size: int) -> Tuple[PsiIndexMemoryCore, random.Random]:
+            rng = random.Random(size)
+            memory = PsiIndexMemoryCore(verbose=False, events=NULL_SINK)
+            for idx in range(size):
+                memory.add_artifact(_artifact(idx, rng))
+            return memory, rng
+
+        def insert_setup(size: int = size) -> Callable[[], object]:
+            memory, rng = core(size)
+            return lambda: memory.add_artifact(_artifact(-1, rng))
+
+        yield "psi.add_artifact", {"core_size": size}, insert_setup
+        for k in grid["top_k"]:
+            yield (
+                "psi.top_k",
+                {"core_size": size, "top_k": k},
+                lambda size=size, k=k: lambda memory=core(size)[0]: memory.retrieve_most_relevant_memories(k),
+            )
+
+
+def _time_case(fn: Callable[[], object], repeats: int, min_sample_sec: float) -> Dict[str, object]:
+    loops = 1
+    while True:
+        started = time.perf_counter()
+        for _ in range(loops):
+            fn()
+        elapsed = time.perf_counter() - started
+        if elapsed >= min_sample_sec or loops >= 1_000_000:
+            break
+        loops *= 10 if elapsed < min_sample_sec / 10 else 2
+    samples = [elapsed / loops]
+    for _ in range(repeats - 1):
+        started = time.perf_counter()
+        for _ in range(loops):
+            fn()
+        samples.append((time.perf_counter() - started) / loops)
+    return {
+        "loops": loops,
+        "samples": len(samples),
+        "median_us": round(median(samples) * 1e6, 3),
+        "min_us": round(min(samples) * 1e6, 3),
+        "max_us": round(max(samples) * 1e6, 3),
+    }
+
+
+def _case_key(row: Dict[str, object]) -> str:
+    return row["benchmark"] + json.dumps(row["params"], sort_keys=True)
+
+
+def _scaling(rows: List[Dict[str, object]]) -> List[Dict[str, object]]:
+    """Least-squares log-log slope of median time against each benchmark's size parameter."""
+    curves: Dict[Tuple[str, str], List[Tuple[float, float]]] = {}
+    for row in rows:
+        if not row["ok"]:
+            continue
+        driver = BENCHMARKS[row["benchmark"]]
+        fixed = json.dumps({k: v for k, v in row["params"].items() if k != driver}, sort_keys=True)
+        curves.setdefault((row["benchmark"], fixed), []).append((float(row["params"][driver]), row["median_us"]))
+    out = []
+    for (benchmark, fixed), points in sorted(curves.items()):
+        slope = None
+        if len(points) >= 2:
+            xs = [math.log(x) for x, _ in points]
+            ys = [math.log(max(y, 1e-3)) for _, y in points]
+            mx, my = sum(xs) / len(xs), sum(ys) / len(ys)
+            var = sum((x - mx) ** 2 for x in xs)
+            slope = round(sum((x - mx) * (y - my) for x, y in zip(xs, ys)) / var, 3) if var else None
+        out.append(
+            {
+                "benchmark": benchmark,
+                "driver": BENCHMARKS[benchmark],
+                "fixed": json.loads(fixed),
+                "points": [{"x": x, "median_us": y} for x, y in sorted(points)],
+                "loglog_slope": slope,
+            }
+        )
+    return out
+
+
+def _load_history(path: Path) -> List[Dict[str, object]]:
+    if not path.exists():
+        return []
+    rows = []
+    for line in path.read_text(encoding="utf-8").splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            row = json.loads(line)
+        except json.JSONDecodeError:
+            continue
+        if isinstance(row, dict):
+            rows.append(row)
+    return rows
+
+
+def _trend(
+    rows: List[Dict[str, object]],
+    history: List[Dict[str, object]],
+    window: int,
+    tolerance: float,
+    min_delta_us: float,
+) -> Dict[str, object]:
+    """Compare each case's median with its median over the last `window` history rows.
+
+    Changes smaller than `min_delta_us` are ignored so sub-microsecond cases do not
+    flap on timer noise.
+    """
+    baseline: Dict[str, List[float]] = {}
+    for past in history[-window:]:
+        for row in past.get("cases", []):
+            if isinstance(row, dict) and row.get("ok"):
+                baseline.setdefault(_case_key(row), []).append(float(row["median_us"]))
+    regressed, improved = [], []
+    for row in rows:
+        previous = baseline.get(_case_key(row))
+        if not row["ok"] or not previous:
+            continue
+        reference = median(previous)
+        ratio = row["median_us"] / max(reference, 1e-3)
+        row["baseline_ratio"] = round(ratio, 3)
+        if abs(row["median_us"] - reference) < min_delta_us:
+            continue
+        if ratio > 1.0 + tolerance:
+            regressed.append(_case_key(row))
+        elif ratio < 1.0 / (1.0 + tolerance):
+            improved.append(_case_key(row))
+    if not baseline:
+        classification = "baseline"
+    elif regressed:
+        classification = "regression"
+    elif improved:
+        classification = "improvement"
+    else:
+        classification = "stable"
+    return {
+        "classification": classification,
+        "window": min(window, len(history)),
+        "tolerance": tolerance,
+        "min_delta_us": min_delta_us,
+        "regressed_cases": regressed,
+        "improved_cases": improved,
+    }
+
+
+def run_benchmarks(
+    grid_name: str, repeats: int, min_sample_sec: float, only: Optional[List[str]] = None
+) -> List[Dict[str, object]]:
+    rows: List[Dict[str, object]] = []
+    with tempfile.TemporaryDirectory(prefix="trinity-microbench-") as tmp:
+        for benchmark, params, setup in _cases(GRIDS[grid_name], Path(tmp)):
+            if only and not any(benchmark.startswith(prefix) for prefix in only):
+                continue
+            row: Dict[str, object] = {"benchmark": benchmark, "params": params}
+            try:
+                row.update(_time_case(setup(), repeats, min_sample_sec))
+                row["ok"] = True
+            except Exception as exc:  # noqa: BLE001 - one broken case must not hide the rest
+                row.update({"ok": False, "error": f"{type(exc).__name__}: {exc}"})
+            rows.append(row)
+            status = f"{row['median_us']:>12.3f} us" if row["ok"] else f"ERROR {row['error']}"
+            print(f"{benchmark:<24} {json.dumps(params, sort_keys=True):<44} {status}")
+    return rows
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="In-process micro-benchmarks for core Trinity modules.")
+    parser.add_argument("--grid", choices=sorted(GRIDS), default="standard", help="Parameter grid to sweep.")
+    parser.add_argument("--repeats", type=int, default=5, help="Timed samples per case.")
+    parser.add_argument("--min-sample-sec", type=float, default=0.05, help="Auto-range target per sample.")
+    parser.add_argument("--only", nargs="+", default=None, help="Benchmark name prefixes to run.")
+    parser.add_argument("--trend-window", type=int, default=5, help="History rows forming the baseline.")
+    parser.add_argument(
+        "--regression-tolerance",
+        type=float,
+        default=0.5,
+        help="Relative slowdown of a case median (vs baseline) counted as a regression.",
+    )
+    parser.add_argument(
+        "--min-delta-us", type=float, default=2.0, help="Absolute per-call change below which a case is stable."
+    )
+    parser.add_argument("--latest-json", default="docs/core-microbenchmark-latest.json")
+    parser.add_argument("--history-jsonl", default="docs/core-microbenchmark-history.jsonl")
+    args = parser.parse_args()
+
+    if args.repeats < 1 or args.min_sample_sec <= 0 or args.trend_window < 1 or args.regression_tolerance < 0 or args.min_delta_us < 0:
+        parser.error("--repeats/--trend-window must be >= 1, --min-sample-sec > 0, --regression-tolerance/--min-delta-us >= 0")
+    if args.only:
+        unknown = [p for p in args.only if not any(name.startswith(p) for name in BENCHMARKS)]
+        if unknown:
+            parser.error(f"--only matches no benchmark: {', '.join(unknown)}")
+
+    started = time.perf_counter()
+    rows = run_benchmarks(args.grid, args.repeats, args.min_sample_sec, args.only)
+    latest_path = ROOT / args.latest_json
+    history_path = ROOT / args.history_jsonl
+    # Only runs over the same case set are comparable (total_duration_seconds sums them).
+    selection = sorted(args.only) if args.only else None
+    history = [
+        row for row in _load_history(history_path) if row.get("grid") == args.grid and row.get("only") == selection
+    ]
+    trend = _trend(rows, history, args.trend_window, args.regression_tolerance, args.min_delta_us)
+
+    ok_count = sum(1 for row in rows if row["ok"])
+    generated = _now_utc()
+    summary = {
+        "generated_utc": generated,
+        "grid": args.grid,
+        "only": selection,
+        "repeats": args.repeats,
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "total_cases": len(rows),
+        "ok_cases": ok_count,
+        # Sum of per-call medians: a single drift-tracking number for the trend guard.
+        "total_duration_seconds": round(sum(row["median_us"] for row in rows if row["ok"]) / 1e6, 6),
+        "body_health_score": round(100.0 * ok_count / len(rows), 2) if rows else 0.0,
+        "benchmark_trend": trend["classification"],
+        "cases": rows,
+    }
+    latest = {
+        "status": "PASS" if rows and ok_count == len(rows) and trend["classification"] != "regression" else "WARN",
+        "wall_seconds": round(time.perf_counter() - started, 3),
+        "trend": trend,
+        "scaling": _scaling(rows),
+        **summary,
+    }
+
+    latest_path.parent.mkdir(parents=True, exist_ok=True)
+    latest_path.write_text(json.dumps(latest, indent=2) + "\n", encoding="utf-8")
+    history_path.parent.mkdir(parents=True, exist_ok=True)
+    with history_path.open("a", encoding="utf-8") as handle:
+        handle.write(json.dumps(summary, sort_keys=True) + "\n")
+
+    for curve in latest["scaling"]:
+        print(f"scaling {curve['benchmark']:<24} {json.dumps(curve['fixed'], sort_keys=True):<28} slope={curve['loglog_slope']}")
+    print(f"status={latest['status']} trend={trend['classification']} cases={ok_count}/{len(rows)}")
+    print(f"latest_json={latest_path}")
+    print(f"history_jsonl={history_path}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
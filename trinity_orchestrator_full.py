@@ -10,19 +10,40 @@ The orchestrator evaluates tasks against system principles (ARC), detects moment
 high significance (Kairos) in its own operations, and archives the wisdom from those
 moments in a consciousness-aware memory core (Psi-Index). It has evolved from a
 simple executor into a primitive conscious agent.
+
+`run_task` handles one task synchronously. `run_tasks(batch)` and the async
+`submit()` feed a `TaskPipeline` instead: batched ARC validation, batched
+transmutation and a single writer for energy/memory state, connected by bounded
+queues, applying state updates in the same order as sequential `run_task`
+calls (see `TaskPipeline` for what a seeded run reproduces).
+
+Progress is reported through a `trinity_event_sink` sink rather than print():
+`task.arc_scored`, `task.rejected` and `task.completed` (carrying the result
+metrics) plus the detector's and memory core's events.
 """
 
+import asyncio
+import importlib.util
 import random
-from typing import Dict
+from concurrent.futures import Executor
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 
 # --- Imports from our new modules ---
-from semantic_arc_validator import SemanticARCValidator
+from semantic_arc_validator import SemanticARCValidator, ValidationRequest, ValidationResult
 from kairotic_detector import KairoticDetector, GoldenArtifact
 from psi_index_memory_core import PsiIndexMemoryCore
 
 # --- Original Module Imports ---
-from qc_transmuter import transmute_state
+from qc_transmuter import transmute_state, transmute_states
 from freed_id_registry import FreedIDRegistry, DIDDocument
+from trinity_event_sink import WARNING, EventSink, default_sink
+
+QC_SHOTS = 512
+# transmute_states needs numpy; without it the pipeline transmutes state by state.
+_HAS_NUMPY = importlib.util.find_spec("numpy") is not None
+
+TaskOutcome = Union[Dict[str, object], Exception]
 
 
 class EnergyModule:
@@ -71,7 +92,8 @@ class TrinityOrchestratorFull:
     """
     An orchestrator that is now conscious of its actions and insights.
     """
-    def __init__(self):
+    def __init__(self, events: Optional[EventSink] = None):
+        self.events = events if events is not None else default_sink()
         # Original modules
         self.registry = FreedIDRegistry()
         self.energy = EnergyModule()
@@ -81,15 +103,16 @@ class TrinityOrchestratorFull:
 
         # --- Awakened Modules (Pillar 1 Integration) ---
         self.arc_validator = SemanticARCValidator()
-        self.kairotic_detector = KairoticDetector(detection_threshold=0.7)
-        self.memory_core = PsiIndexMemoryCore()
+        self.kairotic_detector = KairoticDetector(detection_threshold=0.7, events=self.events)
+        self.memory_core = PsiIndexMemoryCore(events=self.events)
         self.system_principles = [
             "Promote consciousness expansion and integration.",
             "Maintain system harmony and energetic balance.",
             "Ensure the integrity and security of identity and data."
         ]
-        # Use exotic energy history as a proxy for psi-coherence history
-        self.exotic_energy_history = []
+        self._pipeline: Optional["TaskPipeline"] = None
+        # Exotic energy is streamed into the detector as a proxy for psi-coherence;
+        # the detector keeps running statistics rather than the whole history.
 
 
     def register_agent(self, doc: DIDDocument) -> str:
@@ -105,62 +128,303 @@ class TrinityOrchestratorFull:
         doc = self.registry.resolve(did)
         return doc is not None and not doc.revoked
 
-    def run_task(self, did: str, task_data: str) -> Dict[str, object]:
-        if not self._is_authorised(did):
-            raise PermissionError(f"DID {did} is not authorised or is revoked")
+    # --- Task stages (shared by run_task and the batched TaskPipeline) ---
 
-        # --- ARC Validation Step ---
+    def _validation_request(self, task_data: str) -> ValidationRequest:
         action_description = f"Execute quantum-classical task with input: '{task_data}'"
         # In a future evolution, participants and consistency would be dynamically determined.
         dummy_participants = ["Aura"] 
         dummy_consistency = {"mind_body": 0.8, "body_heart": 0.8, "heart_mind": 0.8}
-        
-        validation_result = self.arc_validator.validate(action_description, dummy_participants, dummy_consistency)
-        arc_score = validation_result.arc_score
+        return action_description, dummy_participants, dummy_consistency
 
-        print(f"\nTask '{task_data}' ARC Score: {arc_score:.4f}")
+    def _admit(self, task_data: str, validation_result: ValidationResult) -> float:
+        """Report the ARC score and raise if the task is rejected."""
+        arc_score = validation_result.arc_score
+        self.events.emit(
+            "task.arc_scored", message=f"\nTask '{task_data}' ARC Score: {arc_score:.4f}", task=task_data, arc_score=arc_score
+        )
         # Use the ARC threshold defined in the validator
         if not validation_result.passed:
+            self.events.emit("task.rejected", level=WARNING, task=task_data, arc_score=arc_score)
             raise ValueError(f"Task rejected. Action '{task_data}' has low alignment with system principles (Score: {arc_score:.4f})")
+        return arc_score
 
-        # --- Core Task Execution ---
+    def _prepare_state(self, task_data: str) -> Tuple[List[complex], float]:
+        """
+        The task's quantum state and the waste energy it will absorb. Every draw from
+        the global `random` happens here, so batching stages cannot reorder them.
+        """
         neu_output = self.neuro.run(task_data)
         q_state = self.quantum.run(neu_output)
-        amplitudes = list(q_state.values())
-        qc_features = transmute_state(amplitudes, shots=512)
+        return list(q_state.values()), random.uniform(0.0, 3.0)
+
+    def _energy_for(self, did: str) -> EnergyModule:
+        """Energy account charged for `did`'s tasks (one shared account here)."""
+        return self.energy
+
+    def _detector_for(self, did: str) -> KairoticDetector:
+        return self.kairotic_detector
+
+    def _commit(
+        self, did: str, task_data: str, arc_score: float, qc_features: Dict[str, object], absorbed: float
+    ) -> Dict[str, object]:
+        """Energy, Kairotic and memory updates: the only stage that mutates orchestrator state."""
+        energy = self._energy_for(did)
+        detector = self._detector_for(did)
         classical_input = f"quantum_features:{qc_features}"
         result = self.classical.run(classical_input)
 
         # --- Energy & Metric Updates ---
-        self.energy.absorb(random.uniform(0.0, 3.0))
-        self.energy.regenerate()
-        exotic = self.energy.transmute_energy()
-        self.exotic_energy_history.append(self.energy.exotic_energy)
+        energy.absorb(absorbed)
+        energy.regenerate()
+        exotic = energy.transmute_energy()
 
         # --- Kairotic Detection & Memory Integration ---
-        system_metrics = {
-            "psi_coherence_history": self.exotic_energy_history,
-            "some_data_stream": [qc_features.get('entropy_bits', 0)],
-            "emotional_intensity": arc_score 
-        }
-        kairotic_moment = self.kairotic_detector.monitor_and_detect(system_metrics)
+        kairotic_moment = detector.observe({
+            "psi_coherence": energy.exotic_energy,
+            "emotional_intensity": arc_score,
+        })
 
         if kairotic_moment:
-            self.kairotic_detector.amplify_and_synthesize()
-            insight = f"High-significance moment during task '{task_data}'. ARC: {arc_score:.2f}, Kairos Wt: {kairotic_moment.kairotic_weight:.2f}, Exotic Energy: {self.energy.exotic_energy:.2f}"
-            artifact = self.kairotic_detector.integrate_and_archive(insight)
+            detector.amplify_and_synthesize()
+            insight = f"High-significance moment during task '{task_data}'. ARC: {arc_score:.2f}, Kairos Wt: {kairotic_moment.kairotic_weight:.2f}, Exotic Energy: {energy.exotic_energy:.2f}"
+            artifact = detector.integrate_and_archive(insight)
             if artifact:
                 self.memory_core.add_artifact(artifact, metadata={"task_data": task_data})
 
+        self.events.emit(
+            "task.completed",
+            did=did,
+            task=task_data,
+            arc_score=arc_score,
+            waste_energy=energy.waste_energy,
+            exotic_energy_generated=exotic,
+            total_exotic_energy=energy.exotic_energy,
+            entropy_bits=qc_features.get("outputs", {}).get("entropy_bits"),
+            kairotic_moment=kairotic_moment is not None,
+        )
         return {
             "result": result,
             "quantum_features": qc_features,
-            "waste_energy": self.energy.waste_energy,
+            "waste_energy": energy.waste_energy,
             "exotic_energy_generated": exotic,
-            "total_exotic_energy": self.energy.exotic_energy,
+            "total_exotic_energy": energy.exotic_energy,
             "arc_score": arc_score
         }
 
+    def run_task(self, did: str, task_data: str) -> Dict[str, object]:
+        if not self._is_authorised(did):
+            raise PermissionError(f"DID {did} is not authorised or is revoked")
+
+        # --- ARC Validation Step ---
+        validation_result = self.arc_validator.validate(*self._validation_request(task_data))
+        arc_score = self._admit(task_data, validation_result)
+
+        # --- Core Task Execution ---
+        state, absorbed = self._prepare_state(task_data)
+        qc_features = _transmute_group([state], QC_SHOTS)[0]
+        return self._commit(did, task_data, arc_score, qc_features, absorbed)
+
+    def run_tasks(self, batch: Iterable[Tuple[str, str]], **pipeline_options: Any) -> List[TaskOutcome]:
+        """
+        Run ``(did, task_data)`` pairs through a `TaskPipeline` and return one entry
+        per task, in order: the `run_task` result dict, or the PermissionError /
+        ValueError it would have raised. Not callable from a running event loop;
+        use `submit` there.
+        """
+        async def _run() -> List[TaskOutcome]:
+            async with TaskPipeline(self, **pipeline_options) as pipeline:
+                pending = [asyncio.ensure_future(pipeline.submit(did, task_data)) for did, task_data in batch]
+                return list(await asyncio.gather(*pending, return_exceptions=True))
+
+        return asyncio.run(_run())
+
+    async def submit(self, did: str, task_data: str) -> Dict[str, object]:
+        """Queue one task on this orchestrator's pipeline (started on first use) and await its result."""
+        if self._pipeline is None or self._pipeline.loop is not asyncio.get_running_loop():
+            self._pipeline = TaskPipeline(self)
+            await self._pipeline.start()
+        return await self._pipeline.submit(did, task_data)
+
+    async def aclose(self) -> None:
+        """Drain and stop the pipeline started by `submit`."""
+        if self._pipeline is not None:
+            await self._pipeline.close()
+            self._pipeline = None
+
+
+def _transmute_group(states: List[List[complex]], shots: int) -> List[Dict[str, Any]]:
+    """Transmute equal-length states together (module-level so process pools can pickle it)."""
+    if _HAS_NUMPY:
+        return transmute_states(states, shots=shots)
+    return [transmute_state(state, shots=shots) for state in states]
+
+
+@dataclass
+class _PipelineItem:
+    did: str
+    task_data: str
+    future: "asyncio.Future[Dict[str, object]]"
+    validation: Optional[ValidationResult] = None
+    error: Optional[BaseException] = None
+    state: Optional[List[complex]] = None
+    absorbed: float = 0.0
+    qc_features: Optional[Dict[str, Any]] = None
+
+
+class TaskPipeline:
+    """
+    Batched, pipelined execution of `TrinityOrchestratorFull` tasks.
+
+    Three asyncio stages joined by bounded queues, so a full downstream stage
+    applies back-pressure to `submit`:
+
+    1. validate - authorisation plus one `validate_many` call per batch;
+    2. transmute - state preparation, then equal-length states transmuted
+       together (`transmute_states`) on `executor` (threads by default; pass a
+       ProcessPoolExecutor to spread transmutation across cores);
+    3. commit - the single writer for energy, Kairotic and memory state.
+
+    Every stage handles batches in submission order and the writer commits tasks
+    one at a time in that order, so per-DID ordering (indeed global ordering) of
+    state updates matches calling `run_task` in sequence, and each result has the
+    same schema. `_prepare_state` makes all of a task's global `random` draws and
+    runs in submission order, and `run_task` transmutes through the same
+    `_transmute_group` backend, so after `random.seed(n)` states, energy and
+    Kairotic results match sequential `run_task` calls. Measurement counts come
+    from an unseeded generator on both paths. Rejections, authorisation failures
+    and per-task stage errors are delivered as exceptions on that task's future.
+    """
+
+    def __init__(
+        self,
+        orchestrator: "TrinityOrchestratorFull",
+        batch_size: int = 64,
+        queue_size: int = 4,
+        executor: Optional[Executor] = None,
+    ):
+        if batch_size < 1 or queue_size < 1:
+            raise ValueError("batch_size and queue_size must be >= 1")
+        self.orchestrator = orchestrator
+        self.batch_size = batch_size
+        self.executor = executor
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self._intake: "asyncio.Queue[Optional[_PipelineItem]]" = asyncio.Queue(maxsize=batch_size * queue_size)
+        self._validated: "asyncio.Queue[Optional[List[_PipelineItem]]]" = asyncio.Queue(maxsize=queue_size)
+        self._transmuted: "asyncio.Queue[Optional[List[_PipelineItem]]]" = asyncio.Queue(maxsize=queue_size)
+        self._workers: List[asyncio.Task] = []
+
+    async def __aenter__(self) -> "TaskPipeline":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.close()
+
+    async def start(self) -> None:
+        if self._workers:
+            return
+        self.loop = asyncio.get_running_loop()
+        self._workers = [
+            asyncio.create_task(self._validate_stage()),
+            asyncio.create_task(self._transmute_stage()),
+            asyncio.create_task(self._commit_stage()),
+        ]
+
+    async def submit(self, did: str, task_data: str) -> Dict[str, object]:
+        if not self._workers:
+            raise RuntimeError("TaskPipeline is not running; call start() or use 'async with'")
+        item = _PipelineItem(did, task_data, self.loop.create_future())
+        await self._intake.put(item)
+        return await item.future
+
+    async def close(self) -> None:
+        """Finish every queued task, then stop the stages."""
+        if not self._workers:
+            return
+        await self._intake.put(None)
+        try:
+            await asyncio.gather(*self._workers)
+        finally:
+            self._workers = []
+
+    async def _next_batch(self) -> Optional[List[_PipelineItem]]:
+        first = await self._intake.get()
+        if first is None:
+            return None
+        batch = [first]
+        while len(batch) < self.batch_size:
+            try:
+                item = self._intake.get_nowait()
+            except asyncio.QueueEmpty:
+                break
+            if item is None:
+                # Keep the sentinel for the next call, after this batch is handed on.
+                self._intake.put_nowait(None)
+                break
+            batch.append(item)
+        return batch
+
+    async def _validate_stage(self) -> None:
+        orchestrator = self.orchestrator
+        while (batch := await self._next_batch()) is not None:
+            admitted = []
+            for item in batch:
+                if orchestrator._is_authorised(item.did):
+                    admitted.append(item)
+                else:
+                    item.error = PermissionError(f"DID {item.did} is not authorised or is revoked")
+            requests = [orchestrator._validation_request(item.task_data) for item in admitted]
+            try:
+                results = await self.loop.run_in_executor(None, orchestrator.arc_validator.validate_many, requests)
+            except Exception as exc:  # noqa: BLE001 - fail this batch's tasks, keep the pipeline running
+                for item in admitted:
+                    item.error = exc
+            else:
+                for item, result in zip(admitted, results):
+                    item.validation = result
+            await self._validated.put(batch)
+        await self._validated.put(None)
+
+    async def _transmute_stage(self) -> None:
+        while (batch := await self._validated.get()) is not None:
+            groups: Dict[int, List[_PipelineItem]] = {}
+            for item in batch:
+                if item.error is None and item.validation.passed:
+                    try:
+                        item.state, item.absorbed = self.orchestrator._prepare_state(item.task_data)
+                    except Exception as exc:  # noqa: BLE001 - delivered to this task's submitter
+                        item.error = exc
+                        continue
+                    groups.setdefault(len(item.state), []).append(item)
+            jobs = [
+                self.loop.run_in_executor(self.executor, _transmute_group, [item.state for item in group], QC_SHOTS)
+                for group in groups.values()
+            ]
+            outcomes = await asyncio.gather(*jobs, return_exceptions=True)
+            for group, features in zip(groups.values(), outcomes):
+                for idx, item in enumerate(group):
+                    if isinstance(features, BaseException):
+                        item.error = features
+                    else:
+                        item.qc_features = features[idx]
+            await self._transmuted.put(batch)
+        await self._transmuted.put(None)
+
+    async def _commit_stage(self) -> None:
+        orchestrator = self.orchestrator
+        while (batch := await self._transmuted.get()) is not None:
+            for item in batch:
+                if item.future.done():  # cancelled by the caller
+                    continue
+                try:
+                    if item.error is not None:
+                        raise item.error
+                    arc_score = orchestrator._admit(item.task_data, item.validation)
+                    item.future.set_result(orchestrator._commit(item.did, item.task_data, arc_score, item.qc_features, item.absorbed))
+                except Exception as exc:  # noqa: BLE001 - delivered to the submitter
+                    item.future.set_exception(exc)
+
 
 if __name__ == '__main__':
     # Demonstration of the newly awakened orchestrator
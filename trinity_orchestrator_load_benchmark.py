@@ -0,0 +1,127 @@
+"""
+trinity_orchestrator_load_benchmark.py
+--------------------------------------
+
+Load generator for `ShardedTrinityOrchestrator`.
+
+For each shard count, a fresh orchestrator registers `--tenants` agents and
+runs `--tasks` seeded tasks spread across them through `run_tasks`, then
+reports throughput (tasks/sec), the rejected-task count and how evenly the
+tenants landed on the shards. Events go to a null sink so console output is not
+what gets measured. `--executor process` moves transmutation onto a process
+pool shared by every shard; on a single-core host expect flat scaling.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from freed_id_registry import DIDDocument
+from trinity_event_sink import NULL_SINK
+from trinity_orchestrator_sharded import ShardedTrinityOrchestrator
+
+TASK_VERBS = ["Harmonize", "Simulate", "Balance", "Archive", "Stabilize", "Corrupt", "Generate"]
+TASK_OBJECTS = ["energy flows", "consciousness expansion", "data logs", "chaotic noise", "memory lattice", "identity graph"]
+
+
+def generate_tasks(dids: List[str], task_count: int, seed: int) -> List[Tuple[str, str]]:
+    rng = random.Random(seed)
+    return [
+        (rng.choice(dids), f"{rng.choice(TASK_VERBS)} {rng.choice(TASK_OBJECTS)} #{idx}")
+        for idx in range(task_count)
+    ]
+
+
+def _bench_shards(
+    shard_count: int, tenants: int, task_count: int, batch_size: int, seed: int, executor: Optional[Executor]
+) -> Dict[str, object]:
+    random.seed(seed)
+    orchestrator = ShardedTrinityOrchestrator(
+        shard_count=shard_count, executor=executor, batch_size=batch_size, events=NULL_SINK
+    )
+    dids = [
+        orchestrator.register_agent(DIDDocument(did="", controller=f"did:freed:tenant-{idx}"))
+        for idx in range(tenants)
+    ]
+    tasks = generate_tasks(dids, task_count, seed)
+
+    started = time.perf_counter()
+    outcomes = orchestrator.run_tasks(tasks)
+    elapsed = time.perf_counter() - started
+
+    tenants_per_shard = [len(shard.registry.list_active()) for shard in orchestrator.shards]
+    return {
+        "shard_count": shard_count,
+        "tenants": tenants,
+        "tasks": task_count,
+        "duration_sec": round(elapsed, 4),
+        "tasks_per_sec": round(task_count / elapsed, 1) if elapsed > 0 else None,
+        "completed": sum(not isinstance(outcome, Exception) for outcome in outcomes),
+        "rejected": sum(isinstance(outcome, ValueError) for outcome in outcomes),
+        "failed": sum(isinstance(outcome, Exception) and not isinstance(outcome, ValueError) for outcome in outcomes),
+        "tenants_per_shard": tenants_per_shard,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Measure sharded orchestrator throughput against shard count.")
+    parser.add_argument("--shard-counts", type=int, nargs="+", default=[1, 2, 4, 8], help="Shard counts to benchmark.")
+    parser.add_argument("--tenants", type=int, default=64, help="Registered agents (DIDs) issuing tasks.")
+    parser.add_argument("--tasks", type=int, default=2000, help="Tasks per shard-count run.")
+    parser.add_argument("--batch-size", type=int, default=64, help="TaskPipeline batch size per shard.")
+    parser.add_argument(
+        "--executor",
+        choices=["thread", "process", "none"],
+        default="thread",
+        help="Pool for the transmutation stage; 'none' uses the event loop's default thread pool.",
+    )
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Workers for --executor thread/process.")
+    parser.add_argument("--seed", type=int, default=7, help="Seed for task generation and energy noise.")
+    parser.add_argument("--output-json", default="", help="Optional path for the JSON result rows.")
+    args = parser.parse_args()
+
+    if min(args.shard_counts) < 1 or args.tenants < 1 or args.tasks < 1 or args.batch_size < 1 or args.workers < 1:
+        parser.error("--shard-counts, --tenants, --tasks, --batch-size and --workers must be >= 1")
+
+    executor: Optional[Executor] = None
+    if args.executor == "thread":
+        executor = ThreadPoolExecutor(max_workers=args.workers, thread_name_prefix="trinity-transmute")
+    elif args.executor == "process":
+        executor = ProcessPoolExecutor(max_workers=args.workers)
+    try:
+        rows = [
+            _bench_shards(count, args.tenants, args.tasks, args.batch_size, args.seed, executor)
+            for count in args.shard_counts
+        ]
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    baseline = rows[0]["tasks_per_sec"] or 0.0
+    print("shards | tasks/sec | speedup | completed | rejected | failed | tenants/shard")
+    for row in rows:
+        speedup = round(row["tasks_per_sec"] / baseline, 2) if baseline and row["tasks_per_sec"] else None
+        row["speedup"] = speedup
+        print(
+            f"{row['shard_count']:>6} | {row['tasks_per_sec']:>9} | {speedup!s:>7} | {row['completed']:>9} | "
+            f"{row['rejected']:>8} | {row['failed']:>6} | {row['tenants_per_shard']}"
+        )
+
+    if args.output_json:
+        output = Path(args.output_json)
+        output.parent.mkdir(parents=True, exist_ok=True)
+        payload = {"executor": args.executor, "workers": args.workers, "cpu_count": os.cpu_count(), "rows": rows}
+        output.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+        print(f"output_json={output}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,231 @@
+"""
+trinity_orchestrator_sharded.py
+-------------------------------
+
+Multi-tenant `TrinityOrchestratorFull` with state sharded by DID hash.
+
+Each shard is a full orchestrator that owns its slice of the Freed ID registry
+and its own Psi-Index memory core. A DID always maps to the same shard
+(`shard_for`), and every tenant (DID) gets its own energy account and Kairotic
+detector, so one agent's exotic-energy history never skews another's novelty
+scores.
+
+Concurrency:
+
+* `run_tasks` / `submit` route each task to its shard's `TaskPipeline`. The
+  pipeline's commit stage is the shard's single writer (one actor per shard),
+  so per-DID ordering holds and shards commit independently. Transmutation for
+  all shards runs on the shared `executor` (the loop's thread pool by default;
+  a ProcessPoolExecutor puts it on more cores).
+* `run_task` may be called from many threads: commits and registry writes take
+  the shard's lock, everything before that runs unlocked.
+
+`ShardedTrinityOrchestrator(shard_count=1)` behaves like the single orchestrator
+apart from the per-tenant energy accounts. `trinity_orchestrator_load_benchmark.py`
+measures tasks/sec against shard count.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import heapq
+import threading
+import uuid
+from concurrent.futures import Executor
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from freed_id_registry import DIDDocument
+from kairotic_detector import KairoticDetector
+from psi_index_memory_core import MemoryRecord
+from trinity_event_sink import EventSink, default_sink
+from trinity_orchestrator_full import EnergyModule, TaskOutcome, TaskPipeline, TrinityOrchestratorFull
+
+
+def shard_for(did: str, shard_count: int) -> int:
+    """Stable shard index for `did` (independent of PYTHONHASHSEED)."""
+    digest = hashlib.blake2b(did.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big") % shard_count
+
+
+@dataclass
+class TenantAccount:
+    """Per-DID energy and Kairotic state plus task accounting."""
+    energy: EnergyModule
+    kairotic_detector: KairoticDetector
+    tasks_completed: int = 0
+    exotic_energy_generated: float = 0.0
+
+    def summary(self) -> Dict[str, object]:
+        return {
+            "tasks_completed": self.tasks_completed,
+            "exotic_energy_generated": self.exotic_energy_generated,
+            "total_exotic_energy": self.energy.exotic_energy,
+            "waste_energy": self.energy.waste_energy,
+            "golden_artifacts": len(self.kairotic_detector.golden_artifacts),
+        }
+
+
+class OrchestratorShard(TrinityOrchestratorFull):
+    """One shard: its own registry and memory core, per-tenant accounts, and a lock."""
+
+    def __init__(self, index: int, events: Optional[EventSink] = None):
+        super().__init__(events=events)
+        self.index = index
+        self.lock = threading.RLock()
+        self.tenants: Dict[str, TenantAccount] = {}
+
+    def _tenant(self, did: str) -> TenantAccount:
+        account = self.tenants.get(did)
+        if account is None:
+            account = TenantAccount(
+                energy=EnergyModule(),
+                kairotic_detector=KairoticDetector(
+                    detection_threshold=self.kairotic_detector.detection_threshold, events=self.events
+                ),
+            )
+            self.tenants[did] = account
+        return account
+
+    def _energy_for(self, did: str) -> EnergyModule:
+        return self._tenant(did).energy
+
+    def _detector_for(self, did: str) -> KairoticDetector:
+        return self._tenant(did).kairotic_detector
+
+    def _commit(
+        self, did: str, task_data: str, arc_score: float, qc_features: Dict[str, object], absorbed: float
+    ) -> Dict[str, object]:
+        with self.lock:
+            outcome = super()._commit(did, task_data, arc_score, qc_features, absorbed)
+            account = self.tenants[did]
+            account.tasks_completed += 1
+            account.exotic_energy_generated += float(outcome["exotic_energy_generated"])
+            return outcome
+
+    def register_agent(self, doc: DIDDocument) -> str:
+        with self.lock:
+            return super().register_agent(doc)
+
+    def issue_agent_credential(self, did: str, credential: Dict[str, object]) -> None:
+        with self.lock:
+            super().issue_agent_credential(did, credential)
+
+
+class ShardedTrinityOrchestrator:
+    """Routes agents and tasks to `OrchestratorShard`s by DID hash."""
+
+    def __init__(
+        self,
+        shard_count: int = 1,
+        executor: Optional[Executor] = None,
+        batch_size: int = 64,
+        events: Optional[EventSink] = None,
+    ):
+        if shard_count < 1:
+            raise ValueError("shard_count must be >= 1")
+        self.events = events if events is not None else default_sink()
+        self.shards = [OrchestratorShard(index, events=self.events) for index in range(shard_count)]
+        self.executor = executor
+        self.batch_size = batch_size
+        self._pipelines: Optional[List[TaskPipeline]] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def shard(self, did: str) -> OrchestratorShard:
+        return self.shards[shard_for(did, len(self.shards))]
+
+    def register_agent(self, doc: DIDDocument) -> str:
+        """Register on the DID's shard; a DID is minted first when `doc.did` is empty."""
+        if not doc.did:
+            doc.did = f"did:freed:{uuid.uuid4().hex}"
+        return self.shard(doc.did).register_agent(doc)
+
+    def issue_agent_credential(self, did: str, credential: Dict[str, object]) -> None:
+        self.shard(did).issue_agent_credential(did, credential)
+
+    def revoke_agent(self, did: str) -> None:
+        shard = self.shard(did)
+        with shard.lock:
+            shard.registry.revoke(did)
+
+    def run_task(self, did: str, task_data: str) -> Dict[str, object]:
+        """Synchronous single task; safe to call from several threads."""
+        return self.shard(did).run_task(did, task_data)
+
+    def _new_pipelines(self) -> List[TaskPipeline]:
+        return [TaskPipeline(shard, batch_size=self.batch_size, executor=self.executor) for shard in self.shards]
+
+    def run_tasks(self, batch: Iterable[Tuple[str, str]]) -> List[TaskOutcome]:
+        """
+        Run ``(did, task_data)`` pairs across all shards concurrently. Returns one
+        entry per task in input order: the result dict or the exception
+        `run_task` would have raised. Not callable from a running event loop.
+        """
+        async def _run() -> List[TaskOutcome]:
+            pipelines = self._new_pipelines()
+            for pipeline in pipelines:
+                await pipeline.start()
+            try:
+                pending = [
+                    asyncio.ensure_future(pipelines[shard_for(did, len(pipelines))].submit(did, task_data))
+                    for did, task_data in batch
+                ]
+                return list(await asyncio.gather(*pending, return_exceptions=True))
+            finally:
+                for pipeline in pipelines:
+                    await pipeline.close()
+
+        return asyncio.run(_run())
+
+    async def submit(self, did: str, task_data: str) -> Dict[str, object]:
+        """Queue one task on its shard's pipeline (started on first use) and await the result."""
+        loop = asyncio.get_running_loop()
+        if self._pipelines is None or self._loop is not loop:
+            self._pipelines = self._new_pipelines()
+            self._loop = loop
+            for pipeline in self._pipelines:
+                await pipeline.start()
+        return await self._pipelines[shard_for(did, len(self.shards))].submit(did, task_data)
+
+    async def aclose(self) -> None:
+        if self._pipelines is not None:
+            for pipeline in self._pipelines:
+                await pipeline.close()
+            self._pipelines = None
+            self._loop = None
+
+    def tenant_report(self) -> Dict[str, Dict[str, object]]:
+        """Energy and task accounting per DID, across all shards."""
+        report: Dict[str, Dict[str, object]] = {}
+        for shard in self.shards:
+            with shard.lock:
+                for did, account in shard.tenants.items():
+                    report[did] = {"shard": shard.index, **account.summary()}
+        return report
+
+    def top_memories(self, top_n: int = 3) -> List[MemoryRecord]:
+        """Highest-Ψ records across every shard's memory core."""
+        per_shard = [shard.memory_core.retrieve_most_relevant_memories(top_n) for shard in self.shards]
+        merged = heapq.merge(*per_shard, key=lambda record: -record.psi_index)
+        return [record for _, record in zip(range(top_n), merged)]
+
+
+if __name__ == '__main__':
+    # The single-agent demo as a one-shard deployment.
+    orchestrator = ShardedTrinityOrchestrator(shard_count=1)
+    did = orchestrator.register_agent(DIDDocument(did='', controller='did:freed:controller'))
+    print('Registered DID:', did)
+
+    tasks = [
+        "Harmonize energy flows",
+        "Corrupt data logs",
+        "Simulate consciousness expansion",
+        "Generate chaotic noise"
+    ]
+    for task, outcome in zip(tasks, orchestrator.run_tasks((did, task) for task in tasks)):
+        if isinstance(outcome, Exception):
+            print(f"Task '{task}' failed: {outcome}")
+        else:
+            print(f"Task '{task}' completed.")
+    print('Tenant report:', orchestrator.tenant_report())
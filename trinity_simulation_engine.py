@@ -18,6 +18,8 @@ Features
 * Compute additional metrics such as energy density ratios and predicted strain amplitudes.
 * Plot spectra using matplotlib.  Each simulation produces two curves—baseline and modified—to aid
   visual comparison.
+* Two interchangeable backends: ``"list"`` (pure Python, no dependencies) and ``"numpy"`` (array
+  ufuncs for large frequency grids).  Both produce the same spectra to floating‑point tolerance.
 * Designed to be extended: additional observables or more sophisticated physics models can be added
   as needed.
 
@@ -33,7 +35,11 @@ simulator.plot_results(results)
 ```
 
 This will compute the baseline and GMUT‑modified gravitational wave spectra across a range of
-frequencies and display a plot.
+frequencies and display a plot.  For large grids, select the array backend:
+
+```
+simulator = GMUTSimulator(num_points=1_000_000, backend="numpy")
+```
 
 Note
 ----
@@ -44,22 +50,60 @@ gravitational wave observations and encourages further refinement and empirical
 
 from dataclasses import dataclass
 import math
-from typing import Sequence
+from typing import Any, Sequence
+
+BACKENDS = ("list", "numpy")
+# Upper bound on gamma x frequency cells materialised at once when a sweep discards its spectra.
+SWEEP_CHUNK_ELEMENTS = 4_000_000
+
+
+def _require_numpy() -> Any:
+    try:
+        import numpy as np
+    except ModuleNotFoundError as exc:
+        raise RuntimeError(
+            "numpy is required for the 'numpy' backend. Install it or use backend='list'."
+        ) from exc
+    return np
 
 
 @dataclass
 class SimulationResults:
-    frequencies: list[float]
-    baseline_spectrum: list[float]
-    modified_spectrum: list[float]
+    frequencies: Sequence[float]
+    baseline_spectrum: Sequence[float]
+    modified_spectrum: Sequence[float]
     gamma: float
+    backend: str = "list"
 
     def energy_density_ratio(self) -> float:
         """Return the ratio of total energy densities between modified and baseline spectra."""
         # Integrate over frequency (simple trapezoidal approximation)
-        baseline_int = _trapezoid_integral(self.baseline_spectrum, self.frequencies)
-        modified_int = _trapezoid_integral(self.modified_spectrum, self.frequencies)
-        return modified_int / baseline_int if baseline_int != 0 else np.inf
+        integrate = _trapezoid_integral_array if self.backend == "numpy" else _trapezoid_integral
+        baseline_int = integrate(self.baseline_spectrum, self.frequencies)
+        modified_int = integrate(self.modified_spectrum, self.frequencies)
+        return modified_int / baseline_int if baseline_int != 0 else math.inf
+
+
+@dataclass
+class SweepResults:
+    """Spectra for many gamma values sharing one frequency grid and baseline."""
+
+    frequencies: Sequence[float]
+    baseline_spectrum: Sequence[float]
+    modified_spectra: Sequence[Sequence[float]] | None
+    gammas: Sequence[float]
+    energy_density_ratios: Sequence[float]
+    backend: str = "list"
+
+    def result_at(self, index: int) -> SimulationResults:
+        """Return the single‑gamma view of row ``index`` of the sweep."""
+        if self.modified_spectra is None:
+            raise ValueError("sweep was run with keep_spectra=False; no spectra to select from")
+        return SimulationResults(frequencies=self.frequencies,
+                                 baseline_spectrum=self.baseline_spectrum,
+                                 modified_spectrum=self.modified_spectra[index],
+                                 gamma=float(self.gammas[index]),
+                                 backend=self.backend)
 
 
 def _trapezoid_integral(values: Sequence[float], coordinates: Sequence[float]) -> float:
@@ -69,10 +113,33 @@ def _trapezoid_integral(values: Sequence[float], coordinates: Sequence[float]) -
     return total
 
 
+def _trapezoid_integral_array(values: Any, coordinates: Any) -> float:
+    np = _require_numpy()
+    values = np.asarray(values, dtype=np.float64)
+    coordinates = np.asarray(coordinates, dtype=np.float64)
+    if values.shape[-1] < 2:
+        return 0.0
+    return float(np.dot((values[1:] + values[:-1]) * 0.5, np.diff(coordinates)))
+
+
+def _trapezoid_integral_rows(matrix: Any, coordinates: Any) -> Any:
+    """Integrate every row of a 2‑D array over ``coordinates`` in one matrix‑vector product."""
+    np = _require_numpy()
+    if matrix.shape[-1] < 2:
+        return np.zeros(matrix.shape[0], dtype=np.float64)
+    return ((matrix[:, 1:] + matrix[:, :-1]) * 0.5) @ np.diff(coordinates)
+
+
 class GMUTSimulator:
     """A simple simulator for GMUT gravitational‑wave predictions."""
 
-    def __init__(self, freq_min: float = 1e-3, freq_max: float = 1e2, num_points: int = 50):
+    def __init__(
+        self,
+        freq_min: float = 1e-3,
+        freq_max: float = 1e2,
+        num_points: int = 50,
+        backend: str = "list",
+    ):
         """
         Initialise the simulator.
 
@@ -80,12 +147,18 @@ class GMUTSimulator:
             freq_min (float): Minimum frequency in Hz for the simulation range.
             freq_max (float): Maximum frequency in Hz.
             num_points (int): Number of frequency samples.
+            backend (str): ``"list"`` for the pure‑Python path or ``"numpy"`` for ndarray ufuncs.
         """
+        if backend not in BACKENDS:
+            raise ValueError(f"backend must be one of {BACKENDS}, got {backend!r}")
+        if backend == "numpy":
+            _require_numpy()
         self.freq_min = freq_min
         self.freq_max = freq_max
         self.num_points = num_points
+        self.backend = backend
 
-    def baseline_spectrum(self, freqs: Sequence[float]) -> list[float]:
+    def baseline_spectrum(self, freqs: Sequence[float]) -> Sequence[float]:
         """
         Define a baseline stochastic gravitational‑wave background spectrum.
 
@@ -100,9 +173,12 @@ class GMUTSimulator:
         # Normalisation factor roughly representing a reference strain amplitude
         A0 = 1e-26
         # Spectral slope (scale‑invariant slope of -2)
+        if self.backend == "numpy":
+            np = _require_numpy()
+            return A0 * np.power(np.asarray(freqs, dtype=np.float64) / 1.0, -2.0)
         return [A0 * (freq / 1.0) ** (-2) for freq in freqs]
 
-    def psi_modification_factor(self, freqs: Sequence[float], gamma: float) -> list[float]:
+    def psi_modification_factor(self, freqs: Sequence[float], gamma: float) -> Sequence[float]:
         """
         Compute a ψ‑field modification factor for the spectrum.
 
@@ -118,6 +194,9 @@ class GMUTSimulator:
         """
         # Avoid division by zero by adding a small epsilon
         eps = 1e-12
+        if self.backend == "numpy":
+            np = _require_numpy()
+            return 1.0 + gamma * np.exp(-np.asarray(freqs, dtype=np.float64) / (1.0 + eps))
         return [1.0 + gamma * math.exp(-freq / (1.0 + eps)) for freq in freqs]
 
     def run_simulation(self, gamma: float = 0.01) -> SimulationResults:
@@ -130,14 +209,93 @@ class GMUTSimulator:
         Returns:
             SimulationResults: Object containing simulation data and helper functions.
         """
-        freqs = self._logspace(self.freq_min, self.freq_max, self.num_points)
+        freqs = self.frequency_grid()
         base = self.baseline_spectrum(freqs)
         mod_factor = self.psi_modification_factor(freqs, gamma)
-        modified = [baseline * factor for baseline, factor in zip(base, mod_factor)]
+        if self.backend == "numpy":
+            modified = base * mod_factor
+        else:
+            modified = [baseline * factor for baseline, factor in zip(base, mod_factor)]
         return SimulationResults(frequencies=freqs,
                                 baseline_spectrum=base,
                                 modified_spectrum=modified,
-                                gamma=gamma)
+                                gamma=gamma,
+                                backend=self.backend)
+
+    def run_sweep(self, gammas: Sequence[float], keep_spectra: bool = True) -> SweepResults:
+        """
+        Simulate many ψ‑field couplings against a single frequency grid and baseline.
+
+        The grid and baseline spectrum are computed once.  With the numpy backend the
+        modification factor is broadcast over a gamma column vector, giving an
+        ``(n_gamma, n_freq)`` matrix of modified spectra.
+
+        Args:
+            gammas (Sequence[float]): ψ‑field coupling strengths to simulate.
+            keep_spectra (bool): Retain the modified spectra.  When False only the
+                energy‑density ratios are returned and the numpy backend processes
+                gammas in bounded chunks.
+
+        Returns:
+            SweepResults: Shared grid/baseline, optional spectra and one ratio per gamma.
+        """
+        freqs = self.frequency_grid()
+        base = self.baseline_spectrum(freqs)
+        if self.backend == "numpy":
+            return self._run_sweep_array(freqs, base, gammas, keep_spectra)
+
+        baseline_int = _trapezoid_integral(base, freqs)
+        spectra: list[list[float]] = []
+        ratios: list[float] = []
+        for gamma in gammas:
+            mod_factor = self.psi_modification_factor(freqs, gamma)
+            modified = [baseline * factor for baseline, factor in zip(base, mod_factor)]
+            modified_int = _trapezoid_integral(modified, freqs)
+            ratios.append(modified_int / baseline_int if baseline_int != 0 else math.inf)
+            if keep_spectra:
+                spectra.append(modified)
+        return SweepResults(frequencies=freqs,
+                            baseline_spectrum=base,
+                            modified_spectra=spectra if keep_spectra else None,
+                            gammas=[float(gamma) for gamma in gammas],
+                            energy_density_ratios=ratios,
+                            backend=self.backend)
+
+    def _run_sweep_array(self, freqs: Any, base: Any, gammas: Sequence[float], keep_spectra: bool) -> SweepResults:
+        np = _require_numpy()
+        gamma_vec = np.asarray(gammas, dtype=np.float64).reshape(-1)
+        baseline_int = _trapezoid_integral_array(base, freqs)
+        if keep_spectra:
+            chunk_rows = max(1, gamma_vec.size)
+        else:
+            chunk_rows = max(1, SWEEP_CHUNK_ELEMENTS // max(1, freqs.size))
+
+        spectra = np.empty((gamma_vec.size, freqs.size), dtype=np.float64) if keep_spectra else None
+        modified_ints = np.empty(gamma_vec.size, dtype=np.float64)
+        for start in range(0, gamma_vec.size, chunk_rows):
+            stop = start + chunk_rows
+            mod_factor = self.psi_modification_factor(freqs, gamma_vec[start:stop, None])
+            modified = base * mod_factor
+            modified_ints[start:stop] = _trapezoid_integral_rows(modified, freqs)
+            if spectra is not None:
+                spectra[start:stop] = modified
+
+        if baseline_int != 0:
+            ratios = modified_ints / baseline_int
+        else:
+            ratios = np.full(gamma_vec.size, math.inf)
+        return SweepResults(frequencies=freqs,
+                            baseline_spectrum=base,
+                            modified_spectra=spectra,
+                            gammas=gamma_vec,
+                            energy_density_ratios=ratios,
+                            backend=self.backend)
+
+    def frequency_grid(self) -> Sequence[float]:
+        """Return the log‑spaced frequency grid for the configured backend."""
+        if self.backend == "numpy":
+            return self._logspace_array(self.freq_min, self.freq_max, self.num_points)
+        return self._logspace(self.freq_min, self.freq_max, self.num_points)
 
     @staticmethod
     def _logspace(start: float, stop: float, num_points: int) -> list[float]:
@@ -148,6 +306,13 @@ class GMUTSimulator:
         step = (stop_log - start_log) / (num_points - 1)
         return [10 ** (start_log + step * index) for index in range(num_points)]
 
+    @staticmethod
+    def _logspace_array(start: float, stop: float, num_points: int) -> Any:
+        np = _require_numpy()
+        if num_points <= 1:
+            return np.array([start], dtype=np.float64)
+        return np.logspace(math.log10(start), math.log10(stop), num_points, dtype=np.float64)
+
     def plot_results(self, results: SimulationResults, show: bool = True, save_path: str = None) -> None:
         """
         Plot baseline and modified spectra using matplotlib.
@@ -0,0 +1,300 @@
+"""
+trinity_stream_runner.py
+------------------------
+
+Streaming subprocess capture shared by the suite runners.
+
+`run_streaming` reads a child's stdout/stderr incrementally instead of buffering
+them whole. Each stream keeps its first `head_lines` and last `tail_lines`
+lines plus a count of the lines dropped in between, so memory stays bounded
+however chatty the child is. The full byte stream can be spilled to a per-stage
+log file, completed lines can be echoed live through `on_line`, and the time to
+first and last output is recorded next to the usual returncode/timeout fields.
+On POSIX the child is reaped with `os.wait4`, so each result also carries that
+child's own CPU time, peak RSS, block I/O and context switches.
+"""
+
+from __future__ import annotations
+
+import os
+import selectors
+import sys
+import subprocess
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO, Callable, Deque, Dict, List, Mapping, Optional, Sequence
+
+READ_CHUNK_BYTES = 65536
+MAX_LINE_BYTES = 64 * 1024
+DRAIN_AFTER_KILL_SEC = 1.0
+
+
+class BoundedCapture:
+    """Head/tail line ring buffer for one output stream."""
+
+    def __init__(self, head_lines: int, tail_lines: int) -> None:
+        if head_lines < 0 or tail_lines < 0:
+            raise ValueError("head_lines and tail_lines must be >= 0")
+        self.head_limit = head_lines
+        self.head: List[str] = []
+        self.tail: Deque[str] = deque(maxlen=tail_lines)
+        self.total_lines = 0
+        self.total_bytes = 0
+        self._pending = b""
+
+    @property
+    def dropped_lines(self) -> int:
+        return self.total_lines - len(self.head) - len(self.tail)
+
+    def _keep(self, lines: List[str]) -> None:
+        self.total_lines += len(lines)
+        room = self.head_limit - len(self.head)
+        if room > 0:
+            self.head.extend(lines[:room])
+            lines = lines[room:]
+        if self.tail.maxlen:
+            self.tail.extend(lines[-self.tail.maxlen :])
+
+    @staticmethod
+    def _decode(raw: bytes) -> List[str]:
+        return raw.decode("utf-8", errors="replace").replace("\r\n", "\n").split("\n")
+
+    def feed(self, data: bytes) -> List[str]:
+        """Consume a chunk and return the lines it completed."""
+        self.total_bytes += len(data)
+        buffer = self._pending + data
+        cut = buffer.rfind(b"\n")
+        lines: List[str] = []
+        if cut >= 0:
+            lines = self._decode(buffer[: cut + 1])[:-1]
+            buffer = buffer[cut + 1 :]
+        while len(buffer) > MAX_LINE_BYTES:
+            lines.extend(self._decode(buffer[:MAX_LINE_BYTES]))
+            buffer = buffer[MAX_LINE_BYTES:]
+        self._pending = buffer
+        self._keep(lines)
+        return lines
+
+    def close(self) -> List[str]:
+        if not self._pending:
+            return []
+        lines, self._pending = self._decode(self._pending.rstrip(b"\r")), b""
+        self._keep(lines)
+        return lines
+
+    def text(self) -> str:
+        lines = list(self.head)
+        if self.dropped_lines:
+            lines.append(f"... ({self.dropped_lines} lines omitted) ...")
+        lines.extend(self.tail)
+        return "\n".join(lines)
+
+
+@dataclass
+class StreamResult:
+    command: List[str]
+    returncode: Optional[int]
+    timed_out: bool
+    duration_sec: float
+    first_output_sec: Optional[float]
+    last_output_sec: Optional[float]
+    stdout: str
+    stderr: str
+    output_lines: int
+    output_bytes: int
+    truncated: bool
+    log_path: Optional[str]
+    resources: Optional[Dict[str, float]] = None
+
+    def metrics(self) -> Dict[str, object]:
+        """Per-stage stream and resource metrics for status rows."""
+        return {
+            **(self.resources or {}),
+            "first_output_sec": None if self.first_output_sec is None else round(self.first_output_sec, 3),
+            "last_output_sec": None if self.last_output_sec is None else round(self.last_output_sec, 3),
+            "output_lines": self.output_lines,
+            "output_bytes": self.output_bytes,
+            "output_truncated": self.truncated,
+            "log_path": self.log_path,
+        }
+
+
+class _Pump:
+    """Shared sink for both pipes: captures, optional log spill, live echo and timestamps."""
+
+    def __init__(
+        self,
+        started: float,
+        head_lines: int,
+        tail_lines: int,
+        log: Optional[BinaryIO],
+        on_line: Optional[Callable[[str, str], None]],
+    ) -> None:
+        self.started = started
+        self.captures = {
+            "stdout": BoundedCapture(head_lines, tail_lines),
+            "stderr": BoundedCapture(head_lines, tail_lines),
+        }
+        self.log = log
+        self.on_line = on_line
+        self.first_output: Optional[float] = None
+        self.last_output: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def feed(self, stream: str, data: bytes) -> None:
+        with self._lock:
+            now = time.monotonic() - self.started
+            if self.first_output is None:
+                self.first_output = now
+            self.last_output = now
+            if self.log is not None:
+                self.log.write(data)
+            lines = self.captures[stream].feed(data)
+            if self.on_line is not None:
+                for line in lines:
+                    self.on_line(stream, line)
+
+    def close(self) -> None:
+        with self._lock:
+            for stream, capture in self.captures.items():
+                for line in capture.close():
+                    if self.on_line is not None:
+                        self.on_line(stream, line)
+
+
+def _pump_selectors(proc: subprocess.Popen, pump: _Pump, deadline: Optional[float]) -> bool:
+    """Read both pipes until EOF; returns True when the deadline killed the child."""
+    timed_out = False
+    with selectors.DefaultSelector() as selector:
+        selector.register(proc.stdout, selectors.EVENT_READ, "stdout")
+        selector.register(proc.stderr, selectors.EVENT_READ, "stderr")
+        while selector.get_map():
+            wait = None if deadline is None else deadline - time.monotonic()
+            if wait is not None and wait <= 0:
+                if timed_out:
+                    break
+                timed_out = True
+                proc.kill()
+                # Grandchildren may hold the pipes open; only drain briefly after the kill.
+                deadline = time.monotonic() + DRAIN_AFTER_KILL_SEC
+                continue
+            for key, _events in selector.select(wait):
+                data = os.read(key.fd, READ_CHUNK_BYTES)
+                if data:
+                    pump.feed(key.data, data)
+                else:
+                    selector.unregister(key.fileobj)
+    return timed_out
+
+
+def _pump_threads(proc: subprocess.Popen, pump: _Pump, timeout_sec: Optional[float]) -> bool:
+    """Reader-thread fallback for platforms where pipes are not selectable (Windows)."""
+
+    def reader(pipe: BinaryIO, stream: str) -> None:
+        while data := pipe.read1(READ_CHUNK_BYTES):
+            pump.feed(stream, data)
+
+    threads = [
+        threading.Thread(target=reader, args=(proc.stdout, "stdout"), daemon=True),
+        threading.Thread(target=reader, args=(proc.stderr, "stderr"), daemon=True),
+    ]
+    for thread in threads:
+        thread.start()
+    timed_out = False
+    try:
+        proc.wait(timeout=timeout_sec)
+    except subprocess.TimeoutExpired:
+        timed_out = True
+        proc.kill()
+    for thread in threads:
+        thread.join(DRAIN_AFTER_KILL_SEC if timed_out else None)
+    return timed_out
+
+
+def _rusage_metrics(usage: object) -> Dict[str, float]:
+    # ru_maxrss is KiB on Linux but bytes on macOS.
+    max_rss_kb = usage.ru_maxrss // 1024 if sys.platform == "darwin" else usage.ru_maxrss
+    return {
+        "cpu_user_sec": round(usage.ru_utime, 3),
+        "cpu_sys_sec": round(usage.ru_stime, 3),
+        "max_rss_kb": int(max_rss_kb),
+        "io_read_blocks": int(usage.ru_inblock),
+        "io_write_blocks": int(usage.ru_oublock),
+        "ctx_switches_voluntary": int(usage.ru_nvcsw),
+        "ctx_switches_involuntary": int(usage.ru_nivcsw),
+    }
+
+
+def _reap(proc: subprocess.Popen) -> Optional[Dict[str, float]]:
+    """Wait for `proc`, returning its rusage where os.wait4 is available."""
+    if not hasattr(os, "wait4"):
+        proc.wait()
+        return None
+    try:
+        _pid, status, usage = os.wait4(proc.pid, 0)
+    except ChildProcessError:
+        proc.wait()
+        return None
+    proc.returncode = os.waitstatus_to_exitcode(status)
+    return _rusage_metrics(usage)
+
+
+def run_streaming(
+    command: Sequence[str],
+    *,
+    cwd: Optional[Path] = None,
+    timeout_sec: Optional[float] = None,
+    head_lines: int = 1000,
+    tail_lines: int = 1000,
+    log_path: Optional[Path] = None,
+    on_line: Optional[Callable[[str, str], None]] = None,
+    env: Optional[Mapping[str, str]] = None,
+) -> StreamResult:
+    """Run `command`, streaming its output into bounded captures.
+
+    `timeout_sec` of None or <= 0 means no limit; on expiry the child is killed and
+    `returncode` is None. `log_path`, when given, receives the full interleaved
+    stdout/stderr bytes. `on_line(stream, line)` is called for each completed line.
+    `env`, when given, replaces the child's environment.
+    """
+    log: Optional[BinaryIO] = None
+    if log_path is not None:
+        log_path.parent.mkdir(parents=True, exist_ok=True)
+        log = open(log_path, "wb")
+    started = time.monotonic()
+    limit = timeout_sec if timeout_sec and timeout_sec > 0 else None
+    try:
+        pump = _Pump(started, head_lines, tail_lines, log, on_line)
+        with subprocess.Popen(
+            list(command), cwd=cwd, env=None if env is None else dict(env), stdout=subprocess.PIPE, stderr=subprocess.PIPE
+        ) as proc:
+            if os.name == "nt":
+                timed_out = _pump_threads(proc, pump, limit)
+            else:
+                timed_out = _pump_selectors(proc, pump, None if limit is None else started + limit)
+            resources = _reap(proc)
+            returncode = proc.returncode
+        pump.close()
+    finally:
+        if log is not None:
+            log.close()
+
+    stdout, stderr = pump.captures["stdout"], pump.captures["stderr"]
+    return StreamResult(
+        command=list(command),
+        returncode=None if timed_out else returncode,
+        timed_out=timed_out,
+        duration_sec=time.monotonic() - started,
+        first_output_sec=pump.first_output,
+        last_output_sec=pump.last_output,
+        stdout=stdout.text(),
+        stderr=stderr.text(),
+        output_lines=stdout.total_lines + stderr.total_lines,
+        output_bytes=stdout.total_bytes + stderr.total_bytes,
+        truncated=bool(stdout.dropped_lines or stderr.dropped_lines),
+        log_path=None if log_path is None else str(log_path),
+        resources=resources,
+    )